@@ -0,0 +1,743 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BeRightBack - Mock LCU Simulator
+HTTPS + basic auth, gameflow fazları, ready check yaşam döngüsü,
+gecikme / jitter / hata enjeksiyonu ve istek sayaçları
+"""
+
+import os
+import ssl
+import sys
+import json
+import signal
+import time
+import base64
+import random
+import argparse
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit
+
+READY_CHECK_TIMEOUT = 12.0  # Gerçek client'taki kabul penceresi (ölçeklenmez)
+
+# /lol-game-queues/v1/queues - oynanabilir kuyruklar; gerçek listede çoğu kapalı olan ~100+ kuyruk bulunur
+QUEUES = [
+    (400, "Normal Draft", "CLASSIC", 11, "Available"),
+    (420, "Ranked Solo/Duo", "CLASSIC", 11, "Available"),
+    (430, "Normal Blind", "CLASSIC", 11, "Available"),
+    (440, "Ranked Flex", "CLASSIC", 11, "Available"),
+    (450, "ARAM", "ARAM", 12, "Available"),
+    (490, "Quickplay", "CLASSIC", 11, "Available"),
+    (900, "ARURF", "URF", 11, "PlatformDisabled"),
+    (1700, "Arena", "CHERRY", 30, "Available"),
+]
+
+def ensure_certificate(cert_dir=None):
+    """Self-signed sertifika oluştur (openssl gerekir), önbellekten kullan"""
+    cert_dir = Path(cert_dir or Path(tempfile.gettempdir()) / "berightback-lcu-sim")
+    cert_dir.mkdir(parents=True, exist_ok=True)
+    cert_file = cert_dir / "cert.pem"
+    key_file = cert_dir / "key.pem"
+
+    if not (cert_file.exists() and key_file.exists()):
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+             "-keyout", str(key_file), "-out", str(cert_file),
+             "-days", "30", "-subj", "/CN=127.0.0.1"],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+    return cert_file, key_file
+
+# /lol-game-data/assets/v1/champion-summary.json - id -> isim
+CHAMPIONS = {
+    1: "Annie", 2: "Olaf", 3: "Galio", 4: "Twisted Fate", 5: "Xin Zhao", 6: "Urgot", 7: "LeBlanc",
+    8: "Vladimir", 9: "Fiddlesticks", 10: "Kayle", 11: "Master Yi", 12: "Alistar", 13: "Ryze",
+    14: "Sion", 15: "Sivir", 16: "Soraka", 17: "Teemo", 18: "Tristana", 19: "Warwick",
+    20: "Nunu & Willump", 21: "Miss Fortune", 22: "Ashe", 23: "Tryndamere", 24: "Jax", 25: "Morgana",
+    26: "Zilean", 27: "Singed", 28: "Evelynn", 29: "Twitch", 30: "Karthus", 31: "Cho'Gath",
+    32: "Amumu", 33: "Rammus", 34: "Anivia", 35: "Shaco", 36: "Dr. Mundo", 37: "Sona",
+    38: "Kassadin", 39: "Irelia", 40: "Janna", 41: "Gangplank", 42: "Corki", 43: "Karma",
+    44: "Taric", 45: "Veigar", 48: "Trundle", 50: "Swain", 51: "Caitlyn", 53: "Blitzcrank",
+    54: "Malphite", 55: "Katarina", 56: "Nocturne", 57: "Maokai", 58: "Renekton", 59: "Jarvan IV",
+    60: "Elise", 61: "Orianna", 62: "Wukong", 63: "Brand", 64: "Lee Sin", 67: "Vayne", 68: "Rumble",
+    69: "Cassiopeia", 72: "Skarner", 74: "Heimerdinger", 75: "Nasus", 76: "Nidalee", 77: "Udyr",
+    78: "Poppy", 79: "Gragas", 80: "Pantheon", 81: "Ezreal", 82: "Mordekaiser", 83: "Yorick",
+    84: "Akali", 85: "Kennen", 86: "Garen", 89: "Leona", 90: "Malzahar", 91: "Talon", 92: "Riven",
+    96: "Kog'Maw", 98: "Shen", 99: "Lux", 101: "Xerath", 102: "Shyvana", 103: "Ahri", 104: "Graves",
+    105: "Fizz", 106: "Volibear", 107: "Rengar", 110: "Varus", 111: "Nautilus", 112: "Viktor",
+    113: "Sejuani", 114: "Fiora", 115: "Ziggs", 117: "Lulu", 119: "Draven", 120: "Hecarim",
+    121: "Kha'Zix", 122: "Darius", 126: "Jayce", 127: "Lissandra", 131: "Diana", 133: "Quinn",
+    134: "Syndra", 136: "Aurelion Sol", 141: "Kayn", 142: "Zoe", 143: "Zyra", 145: "Kai'Sa",
+    147: "Seraphine", 150: "Gnar", 154: "Zac", 157: "Yasuo", 161: "Vel'Koz", 163: "Taliyah",
+    164: "Camille", 166: "Akshan", 200: "Bel'Veth", 201: "Braum", 202: "Jhin", 203: "Kindred",
+    221: "Zeri", 222: "Jinx", 223: "Tahm Kench", 233: "Briar", 234: "Viego", 235: "Senna",
+    236: "Lucian", 238: "Zed", 240: "Kled", 245: "Ekko", 246: "Qiyana", 254: "Vi", 266: "Aatrox",
+    267: "Nami", 268: "Azir", 350: "Yuumi", 360: "Samira", 412: "Thresh", 420: "Illaoi",
+    421: "Rek'Sai", 427: "Ivern", 429: "Kalista", 432: "Bard", 497: "Rakan", 498: "Xayah",
+    516: "Ornn", 517: "Sylas", 518: "Neeko", 523: "Aphelios", 526: "Rell", 555: "Pyke", 711: "Vex",
+    777: "Yone", 799: "Ambessa", 800: "Mel", 875: "Sett", 876: "Lillia", 887: "Gwen",
+    888: "Renata Glasc", 893: "Aurora", 895: "Nilah", 897: "K'Sante", 901: "Smolder", 902: "Milio",
+    910: "Hwei", 950: "Naafiri",
+}
+
+# Ranked draft sırası: (tür, hücreler) - aynı adımdaki aksiyonlar eş zamanlı sürer
+DRAFT_ORDER = [
+    ("ban", [0, 1, 2, 3, 4]), ("ban", [5, 6, 7, 8, 9]),
+    ("pick", [0]), ("pick", [5, 6]), ("pick", [1, 2]), ("pick", [7, 8]), ("pick", [3, 4]), ("pick", [9]),
+]
+
+class LCUState:
+    """Simüle edilen client durumu - faz geçişleri istek geldikçe tembel hesaplanır"""
+
+    def __init__(self, queue_time=(20, 40), champ_select=30, game=120, lobby_time=5,
+                 auto_queue=True, accept_rate=1.0, lobby_ready=0.0, search_reject_rate=0.0,
+                 post_game=None, start_phase="Lobby", game_version="14.20.628.3781",
+                 draft_turn=None, draft_planning=3.0, draft_timeout=30.0, owned_rate=0.7, seed=None):
+        self.lock = threading.RLock()
+        self.random = random.Random(seed)
+        self.queue_time = queue_time
+        self.champ_select = champ_select
+        self.game = game
+        self.lobby_time = lobby_time
+        self.auto_queue = auto_queue
+        self.accept_rate = accept_rate  # Diğer 9 oyuncunun kabul etme olasılığı
+        self.lobby_ready = lobby_ready  # Oyun sonrası parti üyelerinin lobby'ye dönme süresi
+        self.search_reject_rate = search_reject_rate
+        # None: eski davranış (istatistik 3 sn sonra kendiliğinden kapanır);
+        # sayı: onur + istatistik ekranları kullanıcı tıklayana kadar toplam bu kadar sürer (inf = gözetimsiz)
+        self.post_game = post_game
+        self.game_id = 0
+        self.game_version = game_version
+        self.lobby_queue_id = 420
+        self.queues = self._build_queues()
+        # None: champ select sabit süre sürer; sayı: diğer oyuncuların aksiyon süresi (sn) ile draft simülasyonu
+        self.draft_turn = draft_turn
+        self.draft_planning = draft_planning
+        self.draft_timeout = draft_timeout  # Kendi sıramızda işlem yapmazsak otomatik tamamlanır
+        self.owned = {champion_id for champion_id in sorted(CHAMPIONS) if self.random.random() < owned_rate}
+        self.draft = None
+        self.draft_turns = []       # kendi aksiyonlarımız: tür, sıra başı -> tamamlanma (ms), zaman aşımı
+        self.hovers = 0
+
+        self.started = time.monotonic()
+        self.phase = start_phase  # "None" = ana ekran, lobby yok
+        self.phase_started = self.started
+        self.deadline = self.started + lobby_time if auto_queue else None
+        self.ready_check = None
+        self.ready_check_started = None
+        self.search_started = None  # Kaçırılan ready check sonrası kuyruk süresi devam eder
+
+        # Metrics
+        self.requests = {}          # faz -> {"GET /path": sayı}
+        self.phase_seconds = {}     # faz -> toplam süre
+        self.accept_latencies = []  # ms, ready check görünmesi -> accept POST
+        self.ready_checks = 0
+        self.missed_ready_checks = 0
+        self.searches = 0
+        self.lobby_waits = []       # sn, lobby'ye giriş -> arama başlangıcı
+        self.games = 0
+        self.post_game_waits = []   # sn, oyun bitişi -> lobby
+        self.game_ended = None
+
+    # ---- Faz makinesi ----
+
+    def _duration(self, value):
+        """Sabit değer ya da (min, max) aralığından süre seç"""
+        if isinstance(value, (tuple, list)):
+            return self.random.uniform(value[0], value[1])
+        return float(value)
+
+    def set_phase(self, phase, at=None, duration=None):
+        """Fazı değiştir ve sonraki geçiş zamanını ayarla"""
+        at = at if at is not None else time.monotonic()
+        if self.phase == "Lobby" and phase == "Matchmaking":
+            self.lobby_waits.append(round(at - self.phase_started, 3))
+        if phase == "Matchmaking" and self.phase != "ReadyCheck":
+            self.search_started = at
+        if phase == "InProgress":
+            self.games += 1
+            self.game_id += 1
+        elif phase == "WaitingForStats":
+            self.game_ended = at
+        elif phase == "Lobby" and self.game_ended is not None:
+            self.post_game_waits.append(round(at - self.game_ended, 3))
+            self.game_ended = None
+        self.phase_seconds[self.phase] = self.phase_seconds.get(self.phase, 0) + (at - self.phase_started)
+        self.phase = phase
+        self.phase_started = at
+        self.deadline = at + duration if duration is not None else None
+
+        if phase == "ReadyCheck":
+            self.ready_checks += 1
+            self.ready_check_started = at
+            self.ready_check = {
+                "state": "InProgress", "playerResponse": "None", "timer": 0.0,
+                "declinerIds": [], "dodgeWarning": "None", "suppressUx": False
+            }
+        else:
+            self.ready_check = None
+
+        if phase == "ChampSelect" and self.draft_turn is not None:
+            self._start_draft(at)
+        else:
+            self.draft = None
+
+    def advance(self, now=None):
+        """Süresi dolan fazları sırayla ilerlet"""
+        now = now if now is not None else time.monotonic()
+        with self.lock:
+            while self.deadline is not None and now >= self.deadline:
+                self._transition(self.deadline)
+
+    def _transition(self, at):
+        """Bir sonraki faza geç"""
+        phase = self.phase
+        if phase == "Lobby":
+            self.searches += 1
+            self.set_phase("Matchmaking", at, self._duration(self.queue_time))
+        elif phase == "Matchmaking":
+            self.set_phase("ReadyCheck", at, READY_CHECK_TIMEOUT)
+        elif phase == "ReadyCheck":
+            rc = self.ready_check
+            if rc["state"] == "EveryoneReady":
+                self.set_phase("ChampSelect", at, self._duration(self.champ_select))
+            else:
+                # Süre doldu: biz kabul etmediysek kaçırıldı, kuyruk devam eder
+                if rc["playerResponse"] != "Accepted":
+                    self.missed_ready_checks += 1
+                self.set_phase("Matchmaking", at, self._duration(self.queue_time))
+        elif phase == "ChampSelect":
+            if self.draft is not None and self.draft["step"] < len(DRAFT_ORDER):
+                self._draft_tick(at)
+            else:
+                self.set_phase("InProgress", at, self._duration(self.game))
+        elif phase == "InProgress":
+            self.set_phase("WaitingForStats", at, 2)
+        elif phase == "WaitingForStats":
+            if self.post_game is None:
+                self.set_phase("EndOfGame", at, 3)
+            else:
+                self.set_phase("PreEndOfGame", at, self._screen_time())
+        elif phase == "PreEndOfGame":
+            self.set_phase("EndOfGame", at, self._screen_time())
+        elif phase == "EndOfGame":
+            self._return_to_lobby(at)
+        else:
+            self.deadline = None
+
+    def _screen_time(self):
+        """Kullanıcının bir oyun sonu ekranında geçirdiği süre (None = hiç tıklamaz)"""
+        if self.post_game == float("inf"):
+            return None
+        return self.post_game / 2
+
+    def _build_queues(self):
+        """Gerçekçi boyutta kuyruk listesi: bilinen kuyruklar + kapalı dolgu kuyrukları"""
+        queues = []
+        entries = QUEUES + [(2000 + i, f"Event Queue {i}", "CLASSIC", 11, "PlatformDisabled") for i in range(110)]
+        for queue_id, name, mode, map_id, availability in entries:
+            queues.append({
+                "id": queue_id, "name": name, "shortName": name, "description": name,
+                "detailedDescription": "", "gameMode": mode, "mapId": map_id,
+                "queueAvailability": availability, "category": "PvP", "type": mode,
+                "isRanked": "Ranked" in name, "maximumParticipantListSize": 5,
+                "minimumParticipantListSize": 1, "numPlayersPerTeam": 5,
+                "gameTypeConfig": {"id": 1, "name": "GAME_CFG_DRAFT_STD", "pickMode": "DraftModeSinglePickStrategy",
+                                   "banMode": "StandardBanStrategy", "maxAllowableBans": 10,
+                                   "reroll": False, "teamChampionPool": False},
+                "queueRewards": {"isChampionPointsEnabled": True, "isIpEnabled": True,
+                                 "isXpEnabled": True, "partySizeIpRewards": []},
+            })
+        return queues
+
+    # ---- Draft ----
+
+    def _start_draft(self, at):
+        """Aksiyon listesini kur; ilk adım planlama süresinden sonra başlar"""
+        actions = []
+        for step, (kind, cells) in enumerate(DRAFT_ORDER):
+            actions.append([
+                {"id": len(DRAFT_ORDER) * 10 * self.games + step * 10 + cell, "actorCellId": cell,
+                 "championId": 0, "type": kind, "completed": False, "isInProgress": False,
+                 "isAllyAction": cell < 5, "pickTurn": step}
+                for cell in cells
+            ])
+        self.draft = {
+            "local_cell": self.random.randrange(5), "actions": actions, "step": -1,
+            "step_started": at, "intents": {}
+        }
+        self.deadline = at + self.draft_planning
+
+    def _draft_taken(self):
+        return {action["championId"] for step in self.draft["actions"] for action in step
+                if action["completed"] and action["championId"]}
+
+    def _draft_tick(self, at):
+        """Zamanı gelen aksiyonları tamamla, adım bitince sıradakine geç"""
+        draft = self.draft
+        step = draft["step"]
+        if step >= 0:
+            for action in draft["actions"][step]:
+                if action["completed"]:
+                    continue
+                if action["actorCellId"] == draft["local_cell"]:
+                    if at >= draft["step_started"] + self.draft_timeout:
+                        self._complete_action(action, at, timed_out=True)
+                elif at >= draft["step_started"] + self.draft_turn:
+                    taken = self._draft_taken()
+                    action["championId"] = self.random.choice([c for c in CHAMPIONS if c not in taken])
+                    action["completed"] = True
+                    action["isInProgress"] = False
+        self._draft_schedule(at)
+
+    def _complete_action(self, action, at, timed_out=False):
+        action["completed"] = True
+        action["isInProgress"] = False
+        self.draft_turns.append({
+            "type": action["type"], "ms": round((at - self.draft["step_started"]) * 1000, 2),
+            "timed_out": timed_out, "championId": action["championId"]
+        })
+
+    def _draft_schedule(self, at):
+        """Mevcut adım tamamlandıysa sonrakini başlat; sıradaki olay zamanını ayarla"""
+        draft = self.draft
+        step = draft["step"]
+        while step < 0 or all(action["completed"] for action in draft["actions"][step]):
+            step += 1
+            draft["step"] = step
+            draft["step_started"] = at
+            if step == len(DRAFT_ORDER):
+                # Finalizasyon
+                self.deadline = at + 2.0
+                return
+            for action in draft["actions"][step]:
+                action["isInProgress"] = True
+        pending = [action for action in draft["actions"][step] if not action["completed"]]
+        others = any(action["actorCellId"] != draft["local_cell"] for action in pending)
+        ours = any(action["actorCellId"] == draft["local_cell"] for action in pending)
+        self.deadline = min(
+            draft["step_started"] + self.draft_turn if others else float("inf"),
+            draft["step_started"] + self.draft_timeout if ours else float("inf")
+        )
+
+    def _return_to_lobby(self, at=None):
+        self.set_phase("Lobby", at, self.lobby_time if self.auto_queue else None)
+
+    # ---- İstek sayaçları ----
+
+    def count(self, method, path):
+        """İsteği mevcut faza göre say"""
+        with self.lock:
+            by_phase = self.requests.setdefault(self.phase, {})
+            key = f"{method} {path}"
+            by_phase[key] = by_phase.get(key, 0) + 1
+
+    def snapshot(self):
+        """Metrikleri JSON uyumlu döndür"""
+        with self.lock:
+            now = time.monotonic()
+            phase_seconds = dict(self.phase_seconds)
+            phase_seconds[self.phase] = phase_seconds.get(self.phase, 0) + (now - self.phase_started)
+            return {
+                "phase": self.phase,
+                "uptime": now - self.started,
+                "requests": self.requests,
+                "phase_seconds": phase_seconds,
+                "accept_latencies_ms": self.accept_latencies,
+                "ready_checks": self.ready_checks,
+                "missed_ready_checks": self.missed_ready_checks,
+                "searches": self.searches,
+                "lobby_waits": self.lobby_waits,
+                "games": self.games,
+                "post_game_waits": self.post_game_waits,
+                "draft_turns": self.draft_turns,
+                "hovers": self.hovers
+            }
+
+    # ---- LCU endpoint'leri: (status, body) döndürür ----
+
+    def get_current_summoner(self, body):
+        return 200, {"displayName": "Simulator", "summonerId": 1, "puuid": "sim-puuid"}
+
+    def get_gameflow_phase(self, body):
+        return 200, self.phase
+
+    def get_ready_check(self, body):
+        if self.ready_check is None:
+            return 404, {"errorCode": "RPC_ERROR", "httpStatus": 404,
+                         "message": "Not attached to a matchmaking queue."}
+        self.ready_check["timer"] = round(time.monotonic() - self.ready_check_started, 1)
+        return 200, self.ready_check
+
+    def post_ready_check_accept(self, body):
+        if self.ready_check is None or self.ready_check["state"] != "InProgress":
+            return 500, {"errorCode": "RPC_ERROR", "httpStatus": 500, "message": "No ready check"}
+        now = time.monotonic()
+        if self.ready_check["playerResponse"] == "None":
+            self.accept_latencies.append(round((now - self.ready_check_started) * 1000, 2))
+        self.ready_check["playerResponse"] = "Accepted"
+
+        # Diğer oyuncular kabul ederse ~1 sn sonra EveryoneReady
+        if self.random.random() < self.accept_rate:
+            self.ready_check["state"] = "EveryoneReady"
+            self.deadline = min(self.deadline, now + 1.0)
+        return 204, None
+
+    def get_matchmaking_search(self, body):
+        if self.phase not in ("Matchmaking", "ReadyCheck"):
+            return 404, {"errorCode": "RPC_ERROR", "httpStatus": 404,
+                         "message": "Not attached to a matchmaking queue."}
+        queue_time = self.queue_time
+        estimated = sum(queue_time) / 2 if isinstance(queue_time, (tuple, list)) else float(queue_time)
+        return 200, {
+            "searchState": "Searching" if self.phase == "Matchmaking" else "Found",
+            "timeInQueue": round(time.monotonic() - self.search_started, 1),
+            "estimatedQueueTime": round(estimated, 1),
+            "queueId": self.lobby_queue_id,
+            "isCurrentlyInQueue": True,
+            "errors": [],
+            "lowPriorityData": {"penalizedSummonerIds": [], "penaltyTime": 0.0, "penaltyTimeRemaining": 0.0}
+        }
+
+    def _lobby_ready(self):
+        return self.phase == "Lobby" and time.monotonic() - self.phase_started >= self.lobby_ready
+
+    def post_matchmaking_search(self, body):
+        if not self._lobby_ready():
+            return 500, {"errorCode": "RPC_ERROR", "httpStatus": 500,
+                         "message": "Cannot start matchmaking in current state"}
+        if self.random.random() < self.search_reject_rate:
+            return 500, {"errorCode": "RPC_ERROR", "httpStatus": 500,
+                         "message": "GATEKEEPER_RESTRICTED"}
+        self.searches += 1
+        self.set_phase("Matchmaking", duration=self._duration(self.queue_time))
+        return 204, None
+
+    def get_lobby(self, body):
+        if self.phase not in ("Lobby", "Matchmaking", "ReadyCheck"):
+            return 404, {"errorCode": "RPC_ERROR", "httpStatus": 404, "message": "LOBBY_NOT_FOUND"}
+        return 200, {"canStartActivity": self._lobby_ready(), "gameConfig": {"queueId": self.lobby_queue_id}}
+
+    def post_lobby(self, body):
+        if self.phase not in ("None", "Lobby"):
+            return 500, {"errorCode": "RPC_ERROR", "httpStatus": 500, "message": "Cannot create lobby in current state"}
+        queue_id = (body or {}).get("queueId")
+        queue = next((queue for queue in self.queues if queue["id"] == queue_id), None)
+        if queue is None or queue["queueAvailability"] != "Available":
+            return 400, {"errorCode": "RPC_ERROR", "httpStatus": 400, "message": "INVALID_QUEUE"}
+        self.lobby_queue_id = queue_id
+        if self.phase != "Lobby":
+            self._return_to_lobby()
+        return 200, {"canStartActivity": self._lobby_ready(), "gameConfig": {"queueId": queue_id}}
+
+    def get_champion_summary(self, body):
+        summary = [{"id": -1, "name": "None", "alias": "None", "squarePortraitPath": "", "roles": []}]
+        for champion_id, name in CHAMPIONS.items():
+            alias = "".join(ch for ch in name if ch.isalnum())
+            summary.append({"id": champion_id, "name": name, "alias": alias,
+                            "squarePortraitPath": f"/lol-game-data/assets/v1/champion-icons/{champion_id}.png",
+                            "roles": ["mage"]})
+        return 200, summary
+
+    def get_owned_champions(self, body):
+        return 200, [
+            {"id": champion_id, "name": CHAMPIONS[champion_id], "alias": CHAMPIONS[champion_id],
+             "active": True, "freeToPlay": False, "ownership": {"owned": True, "rental": {"rented": False}}}
+            for champion_id in sorted(self.owned)
+        ]
+
+    def get_champ_select_session(self, body):
+        draft = self.draft
+        if self.phase != "ChampSelect" or draft is None:
+            return 404, {"errorCode": "RPC_ERROR", "httpStatus": 404, "message": "No active delegate"}
+        my_team = [{"cellId": cell, "championId": next(
+                        (action["championId"] for step in draft["actions"] for action in step
+                         if action["actorCellId"] == cell and action["type"] == "pick" and action["completed"]), 0),
+                    "championPickIntent": draft["intents"].get(cell, 0), "summonerId": cell + 1}
+                   for cell in range(5)]
+        step = draft["step"]
+        phase = "PLANNING" if step < 0 else "FINALIZATION" if step >= len(DRAFT_ORDER) else "BAN_PICK"
+        return 200, {
+            "localPlayerCellId": draft["local_cell"], "myTeam": my_team,
+            "theirTeam": [{"cellId": cell, "championId": 0} for cell in range(5, 10)],
+            "actions": draft["actions"], "bans": {"myTeamBans": [], "theirTeamBans": []},
+            "timer": {"phase": phase, "adjustedTimeLeftInPhase": max(int((self.deadline - time.monotonic()) * 1000), 0)
+                      if self.deadline else 0}
+        }
+
+    def patch_champ_select_action(self, action_id, body):
+        draft = self.draft
+        if self.phase != "ChampSelect" or draft is None:
+            return 404, {"errorCode": "RPC_ERROR", "httpStatus": 404, "message": "No active delegate"}
+        action = next((action for step in draft["actions"] for action in step if action["id"] == action_id), None)
+        if action is None or action["actorCellId"] != draft["local_cell"] or action["completed"]:
+            return 500, {"errorCode": "RPC_ERROR", "httpStatus": 500, "message": "Invalid action"}
+        champion_id = (body or {}).get("championId", action["championId"])
+        if champion_id in self._draft_taken() or (action["type"] == "pick" and champion_id not in self.owned):
+            return 500, {"errorCode": "RPC_ERROR", "httpStatus": 500, "message": "Champion not available"}
+        action["championId"] = champion_id
+        if not (body or {}).get("completed"):
+            if action["type"] == "pick":
+                draft["intents"][draft["local_cell"]] = champion_id
+            self.hovers += 1
+            return 204, None
+        if not action["isInProgress"]:
+            return 500, {"errorCode": "RPC_ERROR", "httpStatus": 500, "message": "Not your turn"}
+        now = time.monotonic()
+        self._complete_action(action, now)
+        self._draft_schedule(now)
+        return 204, None
+
+    def get_queues(self, body):
+        return 200, self.queues
+
+    def get_game_version(self, body):
+        return 200, self.game_version
+
+    def get_honor_ballot(self, body):
+        if self.phase != "PreEndOfGame":
+            return 404, {"errorCode": "RPC_ERROR", "httpStatus": 404, "message": "No ballot"}
+        return 200, {"gameId": self.game_id, "eligiblePlayers": []}
+
+    def post_honor_player(self, body):
+        if self.phase != "PreEndOfGame":
+            return 500, {"errorCode": "RPC_ERROR", "httpStatus": 500, "message": "Not in honor phase"}
+        self.set_phase("EndOfGame", duration=self._screen_time())
+        return 204, None
+
+    def post_dismiss_stats(self, body):
+        if self.phase != "EndOfGame":
+            return 500, {"errorCode": "RPC_ERROR", "httpStatus": 500, "message": "No stats to dismiss"}
+        return 204, None
+
+    def post_play_again(self, body):
+        if self.phase != "EndOfGame":
+            return 500, {"errorCode": "RPC_ERROR", "httpStatus": 500, "message": "Cannot play again now"}
+        self._return_to_lobby()
+        return 204, None
+
+    ROUTES = {
+        ("GET", "/lol-summoner/v1/current-summoner"): "get_current_summoner",
+        ("GET", "/lol-gameflow/v1/gameflow-phase"): "get_gameflow_phase",
+        ("GET", "/lol-matchmaking/v1/ready-check"): "get_ready_check",
+        ("POST", "/lol-matchmaking/v1/ready-check/accept"): "post_ready_check_accept",
+        ("GET", "/lol-matchmaking/v1/search"): "get_matchmaking_search",
+        ("POST", "/lol-lobby/v2/lobby/matchmaking/search"): "post_matchmaking_search",
+        ("GET", "/lol-lobby/v2/lobby"): "get_lobby",
+        ("POST", "/lol-lobby/v2/lobby"): "post_lobby",
+        ("GET", "/lol-game-queues/v1/queues"): "get_queues",
+        ("GET", "/lol-patch/v1/game-version"): "get_game_version",
+        ("GET", "/lol-game-data/assets/v1/champion-summary.json"): "get_champion_summary",
+        ("GET", "/lol-champions/v1/owned-champions-minimal"): "get_owned_champions",
+        ("GET", "/lol-champ-select/v1/session"): "get_champ_select_session",
+        ("GET", "/lol-honor-v2/v1/ballot"): "get_honor_ballot",
+        ("POST", "/lol-honor-v2/v1/honor-player"): "post_honor_player",
+        ("POST", "/lol-end-of-game/v1/state/dismiss-stats"): "post_dismiss_stats",
+        ("POST", "/lol-lobby/v2/play-again"): "post_play_again",
+    }
+
+    def handle(self, method, path, body):
+        """İsteği ilgili endpoint'e yönlendir"""
+        self.advance()
+        self.count(method, path)
+        handler = self.ROUTES.get((method, path))
+        action_prefix = "/lol-champ-select/v1/session/actions/"
+        if handler is None and method == "PATCH" and path.startswith(action_prefix):
+            with self.lock:
+                return self.patch_champ_select_action(int(path[len(action_prefix):]), body)
+        if handler is None:
+            return 404, {"errorCode": "RESOURCE_NOT_FOUND", "httpStatus": 404,
+                         "message": f"No handler for {method} {path}"}
+        with self.lock:
+            return getattr(self, handler)(body)
+
+class LCURequestHandler(BaseHTTPRequestHandler):
+    """HTTP katmanı: auth, gecikme / hata enjeksiyonu, JSON"""
+
+    protocol_version = "HTTP/1.1"
+    # Başlık ve gövde ayrı yazılır - Nagle + delayed ACK gövdeli her yanıta ~40 ms ekler
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _authorized(self):
+        expected = base64.b64encode(f"riot:{self.server.token}".encode()).decode()
+        return self.headers.get("Authorization") == f"Basic {expected}"
+
+    def _send(self, status, body):
+        payload = b"" if body is None else json.dumps(body).encode()
+        self.send_response(status)
+        if payload:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if payload:
+            self.wfile.write(payload)
+
+    def _dispatch(self, method):
+        sim = self.server.sim
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        path = urlsplit(self.path).path
+
+        if not self._authorized():
+            return self._send(401, {"errorCode": "UNAUTHORIZED", "httpStatus": 401})
+
+        # Simülatör kontrol endpoint'leri
+        if path == "/__sim/stats":
+            return self._send(200, sim.state.snapshot())
+        if path == "/__sim/phase" and method == "POST":
+            with sim.state.lock:
+                data = json.loads(raw or b"{}")
+                sim.state.set_phase(data["phase"], duration=data.get("duration"))
+            return self._send(204, None)
+        if path == "/__sim/latency" and method == "POST":
+            # Çalışırken yavaşlat: bağlanmış client'ın sonraki istekleri uçuşta kalır
+            sim.latency = json.loads(raw or b"{}")["ms"] / 1000
+            return self._send(204, None)
+
+        # Gecikme, jitter ve hata enjeksiyonu
+        delay = sim.latency + sim.random.uniform(0, sim.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        roll = sim.random.random()
+        if roll < sim.drop_rate:
+            self.close_connection = True
+            return
+        if roll < sim.drop_rate + sim.failure_rate:
+            return self._send(500, {"errorCode": "INJECTED_FAILURE", "httpStatus": 500})
+
+        body = json.loads(raw) if raw else None
+        status, response = sim.state.handle(method, path, body)
+        self._send(status, response)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+class LCUSimulator:
+    """HTTPS mock LCU sunucusu"""
+
+    def __init__(self, port=0, token="simulator-token", latency=0.0, jitter=0.0,
+                 failure_rate=0.0, drop_rate=0.0, seed=None, cert_dir=None, **state_options):
+        self.token = token
+        self.latency = latency          # saniye
+        self.jitter = jitter            # saniye, [0, jitter) eklenir
+        self.failure_rate = failure_rate
+        self.drop_rate = drop_rate
+        self.random = random.Random(seed)
+        self.state = LCUState(seed=seed, **state_options)
+
+        cert_file, key_file = ensure_certificate(cert_dir)
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), LCURequestHandler)
+        self.server.daemon_threads = True
+        self.server.sim = self
+        self.server.token = token
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(str(cert_file), str(key_file))
+        self.server.socket = context.wrap_socket(self.server.socket, server_side=True)
+        self.thread = None
+
+    @property
+    def port(self):
+        return self.server.server_address[1]
+
+    def start(self):
+        """Arka planda servis etmeye başla"""
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Sunucuyu kapat"""
+        self.server.shutdown()
+        self.server.server_close()
+
+def parse_range(value):
+    """'20' ya da '20-40' biçimindeki süreyi çöz"""
+    if "-" in value:
+        low, high = value.split("-", 1)
+        return (float(low), float(high))
+    return float(value)
+
+def main(argv=None):
+    """Komut satırından simülatörü çalıştır"""
+    parser = argparse.ArgumentParser(description="BeRightBack mock LCU simulator")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--token", default="simulator-token")
+    parser.add_argument("--latency", type=float, default=0.0, help="Sabit gecikme (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Rastgele ek gecikme (ms)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="HTTP 500 oranı (0-1)")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Bağlantı koparma oranı (0-1)")
+    parser.add_argument("--queue-time", type=parse_range, default=(20.0, 40.0), help="Saniye, örn. 20-40")
+    parser.add_argument("--champ-select", type=parse_range, default=30.0)
+    parser.add_argument("--game", type=parse_range, default=120.0)
+    parser.add_argument("--lobby-time", type=float, default=5.0)
+    parser.add_argument("--accept-rate", type=float, default=1.0)
+    parser.add_argument("--no-auto-queue", action="store_true",
+                        help="Kullanıcı kendisi aramaz - lobby'de kalır")
+    parser.add_argument("--lobby-ready", type=float, default=0.0,
+                        help="Lobby'ye dönüşten sonra canStartActivity'nin true olma süresi (sn)")
+    parser.add_argument("--search-reject-rate", type=float, default=0.0,
+                        help="Arama POST'unun reddedilme oranı (0-1)")
+    parser.add_argument("--post-game", type=float, default=None,
+                        help="Onur + istatistik ekranlarında kullanıcı tıklayana kadar geçen süre (sn, inf = gözetimsiz)")
+    parser.add_argument("--start-phase", default="Lobby",
+                        help="Başlangıç fazı (None = ana ekran, lobby yok)")
+    parser.add_argument("--game-version", default="14.20.628.3781")
+    parser.add_argument("--draft", type=float, default=None,
+                        help="Draft simülasyonu: diğer oyuncuların aksiyon süresi (sn); verilmezse champ select sabit sürer")
+    parser.add_argument("--draft-planning", type=float, default=3.0)
+    parser.add_argument("--draft-timeout", type=float, default=30.0,
+                        help="Kendi sıramızda işlem yapılmazsa otomatik tamamlanma süresi (sn)")
+    parser.add_argument("--owned-rate", type=float, default=0.7, help="Sahip olunan şampiyon oranı")
+    parser.add_argument("--lockfile", type=Path, default=None,
+                        help="Gerçek client gibi hazır olunca lockfile yaz, kapanınca sil")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    sim = LCUSimulator(
+        port=args.port, token=args.token,
+        latency=args.latency / 1000, jitter=args.jitter / 1000,
+        failure_rate=args.failure_rate, drop_rate=args.drop_rate, seed=args.seed,
+        queue_time=args.queue_time, champ_select=args.champ_select, game=args.game,
+        lobby_time=args.lobby_time, accept_rate=args.accept_rate,
+        auto_queue=not args.no_auto_queue, lobby_ready=args.lobby_ready,
+        search_reject_rate=args.search_reject_rate, post_game=args.post_game,
+        start_phase=args.start_phase, game_version=args.game_version,
+        draft_turn=args.draft, draft_planning=args.draft_planning, draft_timeout=args.draft_timeout,
+        owned_rate=args.owned_rate
+    )
+    if args.lockfile:
+        # terminate() ile kapanınca da lockfile silinsin
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        args.lockfile.write_text(f"LeagueClient:{os.getpid()}:{sim.port}:{sim.token}:https")
+    # Benchmark süreci bu satırı okuyarak bağlanır
+    print(f"READY {sim.port} {sim.token}", flush=True)
+    try:
+        sim.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sim.server.server_close()
+        if args.lockfile:
+            args.lockfile.unlink(missing_ok=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BeRightBack - Mini Metrik Collector
+Makinelerin gönderdiği gzip'li metrik partilerini toplar; filo toplamları ve
+birleştirilmiş histogram quantile'ları GET /stats ile okunur (yerel test içindir)
+"""
+
+import sys
+import gzip
+import json
+import argparse
+import threading
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from berightback import MetricsPusher, QuantileSketch  # noqa: E402
+
+class MetricsStore:
+    """Makine / süreç başına son kümülatif sayaçlar ve birleştirilmiş histogramlar"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.instances = {}     # (makine, süreç) -> {"seq", "counters", "last_seen"}
+        self.histograms = {}    # ad -> QuantileSketch (filo geneli)
+        self.received = {"payloads": 0, "batches": 0, "duplicates": 0, "bytes": 0, "raw_bytes": 0, "rejected": 0}
+
+    def ingest(self, payload, size, raw_size):
+        """Bir gönderimi işle; aynı partinin tekrarı (yanıt kaybolup yeniden gönderilen) atlanır"""
+        with self.lock:
+            if payload.get("format") != MetricsPusher.FORMAT:
+                self.received["rejected"] += 1
+                raise ValueError("Bilinmeyen format")
+            key = (payload["machine"], payload["instance"])
+            instance = self.instances.setdefault(key, {"seq": 0, "counters": {}, "last_seen": None})
+            self.received["payloads"] += 1
+            self.received["bytes"] += size
+            self.received["raw_bytes"] += raw_size
+            for batch in payload["batches"]:
+                if batch["seq"] <= instance["seq"]:
+                    self.received["duplicates"] += 1
+                    continue
+                instance["seq"] = batch["seq"]
+                instance["counters"] = batch["counters"]
+                instance["last_seen"] = batch["time"]
+                for name, data in batch["histograms"].items():
+                    sketch = QuantileSketch.from_dict(data)
+                    if name in self.histograms:
+                        self.histograms[name].merge(sketch)
+                    else:
+                        self.histograms[name] = sketch
+                self.received["batches"] += 1
+
+    def snapshot(self):
+        """Makine bazında sayaçlar, filo toplamları ve histogram özetleri"""
+        with self.lock:
+            machines = {}
+            totals = {}
+            for (machine, _), instance in self.instances.items():
+                counters = machines.setdefault(machine, {"instances": 0, "counters": {}, "last_seen": None})
+                counters["instances"] += 1
+                counters["last_seen"] = max(filter(None, (counters["last_seen"], instance["last_seen"])), default=None)
+                for name, value in instance["counters"].items():
+                    counters["counters"][name] = counters["counters"].get(name, 0) + value
+                    totals[name] = totals.get(name, 0) + value
+            histograms = {
+                name: {
+                    "count": sketch.count,
+                    "p50": sketch.quantile(0.5),
+                    "p90": sketch.quantile(0.9),
+                    "p99": sketch.quantile(0.99),
+                    "max": sketch.max
+                }
+                for name, sketch in self.histograms.items()
+            }
+            return {"machines": machines, "totals": totals, "histograms": histograms, "received": dict(self.received)}
+
+class CollectorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=None):
+        data = json.dumps(body).encode('utf-8') if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        if self.path != "/metrics":
+            return self._send(404, {"error": "not found"})
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            body = gzip.decompress(raw) if self.headers.get("Content-Encoding") == "gzip" else raw
+            self.server.store.ingest(json.loads(body), len(raw), len(body))
+        except (OSError, ValueError, KeyError) as e:
+            return self._send(400, {"error": str(e)})
+        self._send(204)
+
+    def do_GET(self):
+        if self.path != "/stats":
+            return self._send(404, {"error": "not found"})
+        self._send(200, self.server.store.snapshot())
+
+def main(argv=None):
+    """Collector'ı çalıştır - benchmark süreci READY satırını okur"""
+    parser = argparse.ArgumentParser(description="BeRightBack mini metrik collector")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = ThreadingHTTPServer((args.host, args.port), CollectorHandler)
+    server.daemon_threads = True
+    server.store = MetricsStore()
+    print(f"READY {server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1797 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BeRightBack - Benchmark Suite
+LoLClient ve izleme motorunu mock LCU'ya karşı GUI olmadan çalıştırır,
+sonuçları sürümler arası karşılaştırma için JSON olarak kaydeder
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import itertools
+import random
+import resource
+import logging
+import argparse
+import tempfile
+import threading
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import berightback  # noqa: E402
+from berightback import (  # noqa: E402
+    ConfigManager, LoLClient, MonitorEngine, SessionReplay, Tracer, QuantileSketch,
+    MatchHistory, HistoryAnalytics, StatsExporter, RateLimiter, QueueCatalog, EventBus,
+    MatchmakingTimer, Lifecycle, MetricsRegistry
+)
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+def summarize(values):
+    """Dağılım özeti (ms / s fark etmeksizin)"""
+    values = sorted(values)
+    if not values:
+        return {"count": 0}
+
+    def pick(q):
+        return round(values[min(int(q * len(values)), len(values) - 1)], 3)
+
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 3),
+        "p50": pick(0.50),
+        "p90": pick(0.90),
+        "p99": pick(0.99),
+        "max": round(values[-1], 3)
+    }
+
+def start_simulator(*extra_args):
+    """Simülatörü ayrı süreçte başlat, (process, port, token) döndür"""
+    process = subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve().parent / "lcu_simulator.py"), *map(str, extra_args)],
+        stdout=subprocess.PIPE, text=True
+    )
+    line = process.stdout.readline().split()
+    if not line or line[0] != "READY":
+        process.kill()
+        raise RuntimeError("Simülatör başlatılamadı")
+    return process, line[1], line[2]
+
+def start_collector(port=0):
+    """Mini metrik collector'ı ayrı süreçte başlat, (process, port) döndür"""
+    process = subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve().parent / "metrics_collector.py"), "--port", str(port)],
+        stdout=subprocess.PIPE, text=True
+    )
+    line = process.stdout.readline().split()
+    if not line or line[0] != "READY":
+        process.kill()
+        raise RuntimeError("Collector başlatılamadı")
+    return process, int(line[1])
+
+def free_port():
+    """Henüz dinlenmeyen bir yerel port (collector kesintisi senaryosu için)"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def sim_stats(client):
+    """Simülatör metriklerini al"""
+    response = client.session.get(f"https://127.0.0.1:{client.port}/__sim/stats", timeout=5)
+    return response.json()
+
+def per_hour(requests_by_phase, phase_seconds):
+    """Her fazda, o fazda geçirilen saat başına istek sayısı"""
+    result = {}
+    for phase, endpoints in requests_by_phase.items():
+        seconds = phase_seconds.get(phase, 0)
+        if seconds <= 0:
+            continue
+        result[phase] = {
+            "seconds": round(seconds, 1),
+            "total": round(sum(endpoints.values()) * 3600 / seconds, 1),
+            "endpoints": {name: round(count * 3600 / seconds, 1) for name, count in endpoints.items()}
+        }
+    return result
+
+def headless_engine(port, token, config_dir, record=None, tracer=None):
+    """GUI olmadan client + motor kur"""
+    config = ConfigManager(config_dir)
+    client = LoLClient()
+    client.tracer = tracer
+    if record:
+        client.start_recording(record)
+    if not client.connect(port, token):
+        raise RuntimeError(f"Simülatöre bağlanılamadı (port {port})")
+    history = MatchHistory(Path(config_dir) / "history.jsonl")
+    engine = MonitorEngine(client, config, tracer=tracer, history=history)
+    return config, client, engine
+
+def bench_latency(args):
+    """Ready check -> accept gecikmesi, faz başına istek hacmi ve CPU maliyeti"""
+    process, port, token = start_simulator(
+        "--queue-time", args.queue_time, "--champ-select", args.champ_select,
+        "--game", args.game, "--lobby-time", args.lobby_time,
+        "--latency", args.latency, "--jitter", args.jitter,
+        "--failure-rate", args.failure_rate, "--seed", args.seed
+    )
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            tracer = Tracer() if args.trace else None
+            config, client, engine = headless_engine(port, token, config_dir, tracer=tracer)
+            if args.no_cache:
+                client.cache = None
+
+            # GUI / diğer özellikler gibi durumu kendi temposunda okuyan ek thread'ler
+            stop = threading.Event()
+
+            def reader():
+                while not stop.wait(0.25):
+                    client.check_game_status()
+                    client.get_lobby()
+
+            readers = [threading.Thread(target=reader, daemon=True) for _ in range(args.readers)]
+
+            cpu_start = time.process_time()
+            wall_start = time.monotonic()
+            engine.set_auto_accept(True)
+            engine.start()
+            for thread in readers:
+                thread.start()
+            time.sleep(args.duration)
+            stop.set()
+            engine.stop(timeout=10)
+            config.close()
+            wall = time.monotonic() - wall_start
+            cpu = time.process_time() - cpu_start
+
+            stats = sim_stats(client)
+            app_stats = config.get('stats', {})
+            history_records = list(engine.history.iter_records())
+            cache_stats = client.cache.stats() if client.cache else None
+            limiter_stats = client.limiter.stats()
+            if tracer:
+                tracer.export(args.trace)
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+    return {
+        "accept_latency_ms": summarize(stats["accept_latencies_ms"]),
+        "ready_checks": stats["ready_checks"],
+        "missed_ready_checks": stats["missed_ready_checks"],
+        "matches_accepted": app_stats.get('matches_accepted', 0),
+        "history_records": len(history_records),
+        "total_requests": sum(sum(endpoints.values()) for endpoints in stats["requests"].values()),
+        "cache": cache_stats,
+        "limiter": limiter_stats,
+        "requests_per_hour": per_hour(stats["requests"], stats["phase_seconds"]),
+        "cpu": {
+            "seconds": round(cpu, 3),
+            "percent": round(cpu * 100 / wall, 3),
+            "ms_per_minute": round(cpu * 1000 * 60 / wall, 2)
+        },
+        "wall_seconds": round(wall, 1)
+    }
+
+def bench_record(args):
+    """Simülatörle gerçek zamanlı oturum kaydı oluştur (replay girdisi)"""
+    process, port, token = start_simulator(
+        "--queue-time", args.queue_time, "--champ-select", args.champ_select,
+        "--game", args.game, "--lobby-time", args.lobby_time, "--seed", args.seed
+    )
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            config, client, engine = headless_engine(port, token, config_dir, record=args.recording)
+            engine.set_auto_accept(True)
+            engine.start()
+            time.sleep(args.duration)
+            engine.stop(timeout=10)
+            config.close()
+            count = client.recorder.count
+            client.stop_recording()
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+    return {
+        "recording": str(args.recording),
+        "requests": count,
+        "bytes": Path(args.recording).stat().st_size
+    }
+
+def bench_replay(args):
+    """Kaydı motor üzerinden sanal saatle oynat, gecikme / istek / istatistik doğrula"""
+    replay = SessionReplay(args.recording)
+    with tempfile.TemporaryDirectory() as config_dir:
+        config = ConfigManager(config_dir)
+        client = LoLClient()
+        tracer = Tracer(clock=replay.clock) if args.trace else None
+        client.tracer = tracer
+        if not replay.attach(client):
+            raise RuntimeError("Replay bağlantısı kurulamadı")
+        engine = MonitorEngine(client, config, tracer=tracer)
+        engine.auto_accept_running = True
+
+        wall_start = time.monotonic()
+        cpu_start = time.process_time()
+        polls = replay.run(engine, speed=args.speed)
+        wall = time.monotonic() - wall_start
+        cpu = time.process_time() - cpu_start
+        app_stats = config.get('stats', {})
+        if tracer:
+            tracer.export(args.trace)
+
+    latencies = replay.accept_latencies()
+    result = {
+        "recorded_seconds": round(replay.duration, 1),
+        "replay_seconds": round(wall, 3),
+        "speedup": round(replay.duration / wall, 1) if wall else None,
+        "polls": polls,
+        "accept_latency_ms": summarize(latencies),
+        "ready_check_windows": len(set(replay.windows.values())),
+        "missed_windows": len(replay.missed_windows()),
+        "requests": replay.requests,
+        "total_requests": sum(replay.requests.values()),
+        "cache": client.cache.stats(),
+        "stats": {key: app_stats.get(key, 0) for key in ("matches_found", "matches_accepted")},
+        "cpu_seconds": round(cpu, 3)
+    }
+
+    # Regresyon doğrulamaları
+    failures = []
+    if args.max_accept_ms is not None and latencies and max(latencies) > args.max_accept_ms:
+        failures.append(f"accept gecikmesi {max(latencies)} ms > {args.max_accept_ms} ms")
+    if args.max_requests is not None and result["total_requests"] > args.max_requests:
+        failures.append(f"istek sayısı {result['total_requests']} > {args.max_requests}")
+    if args.expect_accepted is not None and result["stats"]["matches_accepted"] != args.expect_accepted:
+        failures.append(f"kabul edilen {result['stats']['matches_accepted']} != {args.expect_accepted}")
+    if result["missed_windows"] and not args.allow_missed:
+        failures.append(f"{result['missed_windows']} ready check kaçırıldı")
+    result["failures"] = failures
+    return result
+
+def bench_sketch(args):
+    """QuantileSketch doğruluğu ve ekleme maliyeti (sentetik kuyruk süreleri)"""
+    rng = random.Random(args.seed)
+    # Kuyruk süresi benzeri log-normal dağılım (medyan ~90 sn) + bir miktar aykırı değer
+    samples = [rng.lognormvariate(4.5, 0.6) for _ in range(args.samples)]
+    samples[::1000] = [rng.uniform(600, 1800) for _ in samples[::1000]]
+
+    sketch = QuantileSketch()
+    start = time.perf_counter()
+    for value in samples:
+        sketch.add(value)
+    add_seconds = time.perf_counter() - start
+
+    exact = sorted(samples)
+    accuracy = {}
+    query_start = time.perf_counter()
+    for q in (0.5, 0.9, 0.99, 0.999):
+        true_value = exact[int(q * (len(exact) - 1))]
+        estimate = sketch.quantile(q)
+        accuracy[f"p{q * 100:g}"] = {
+            "exact": round(true_value, 3),
+            "estimate": round(estimate, 3),
+            "relative_error": round(abs(estimate - true_value) / true_value, 5)
+        }
+    query_seconds = (time.perf_counter() - query_start) / 4
+
+    serialized = json.dumps(sketch.to_dict(), separators=(",", ":"))
+    restored = QuantileSketch.from_dict(json.loads(serialized))
+    return {
+        "samples": args.samples,
+        "add_ns_per_sample": round(add_seconds * 1e9 / args.samples, 1),
+        "query_us": round(query_seconds * 1e6, 1),
+        "accuracy": accuracy,
+        "max_relative_error": max(a["relative_error"] for a in accuracy.values()),
+        "buckets": len(sketch.buckets),
+        "serialized_bytes": len(serialized),
+        "round_trip_ok": all(restored.quantile(q) == sketch.quantile(q) for q in (0.5, 0.9, 0.99))
+    }
+
+def bench_bus(args):
+    """Olay bus'ı: yayın / teslim maliyeti, thread'ler arası verim, yavaş abonede yayıncı gecikmesi"""
+    failures = []
+    # Motorun bir izleme turundaki tipik karışım: çoğu durum olayı (birleşir), bir kısmı log
+    mix = [
+        ("state_changed", {"connected": True, "in_game": False}),
+        ("settings_changed", {"section": "stats"}),
+        ("phase_changed", {"phase": "Matchmaking", "previous": "Lobby"}),
+        ("log_record", {"message": "x" * 80, "level": "INFO"}),
+    ]
+    events = [mix[i % len(mix)] for i in range(args.events)]
+
+    # Eski yöntem: dinleyiciler yayıncı thread'inde senkron çağrılır
+    listeners = [lambda kind: None]
+    start = time.perf_counter()
+    for kind, _ in events:
+        for callback in listeners:
+            callback(kind)
+    direct_ns = (time.perf_counter() - start) * 1e9 / args.events
+
+    overhead = {"direct_callback_ns": round(direct_ns, 1)}
+    for subscribers in (0, 1, 4):
+        bus = EventBus()
+        subscriptions = [bus.subscribe(lambda event: None, maxsize=args.events) for _ in range(subscribers)]
+        start = time.perf_counter()
+        for kind, data in events:
+            bus.publish(kind, **data)
+        overhead[f"publish_ns_{subscribers}_subscribers"] = round(
+            (time.perf_counter() - start) * 1e9 / args.events, 1)
+        if subscriptions:
+            start = time.perf_counter()
+            delivered = subscriptions[0].drain()
+            overhead["drain_ns_per_event"] = round((time.perf_counter() - start) * 1e9 / max(delivered, 1), 1)
+            overhead["coalesced_share"] = round(subscriptions[0].coalesced / args.events, 3)
+
+    # Verim: yayıncı ve abone ayrı thread'lerde (GUI'deki gibi notify ile uyanır)
+    bus = EventBus()
+    ready = threading.Event()
+    delivered = []
+    subscription = bus.subscribe(lambda event: delivered.append(event.kind), kinds=["log_record"],
+                                 maxsize=args.events, notify=lambda subscription: ready.set())
+    done = threading.Event()
+
+    def consumer():
+        while not (done.is_set() and not subscription.pending()):
+            ready.wait(0.01)
+            ready.clear()
+            subscription.drain()
+
+    thread = threading.Thread(target=consumer)
+    thread.start()
+    start = time.perf_counter()
+    for i in range(args.events):
+        bus.publish("log_record", message="x", level="INFO")
+    done.set()
+    thread.join()
+    elapsed = time.perf_counter() - start
+    throughput = {
+        "events": args.events,
+        "delivered": len(delivered),
+        "events_per_second": round(len(delivered) / elapsed),
+        "high_watermark": subscription.high_watermark
+    }
+
+    # Yavaş abone (ör. meşgul Tk): yayıncı beklememeli, durum olayları birleşmeli
+    bus = EventBus()
+    slow = bus.subscribe(lambda event: time.sleep(args.slow_ms / 1000), maxsize=args.queue,
+                         notify=lambda subscription: ready.set())
+    done.clear()
+
+    def slow_consumer():
+        while not (done.is_set() and not slow.pending()):
+            ready.wait(0.01)
+            ready.clear()
+            slow.drain(limit=50)
+
+    thread = threading.Thread(target=slow_consumer)
+    thread.start()
+    publish_times = []
+    start = time.perf_counter()
+    for i in range(args.burst):
+        kind, data = mix[i % len(mix)]
+        before = time.perf_counter()
+        bus.publish(kind, **data)
+        publish_times.append((time.perf_counter() - before) * 1e6)
+    publisher_seconds = time.perf_counter() - start
+    done.set()
+    thread.join()
+    stats = slow.stats()
+    publish_us = summarize(publish_times)
+    slow_result = {
+        "burst": args.burst,
+        "subscriber_ms_per_event": args.slow_ms,
+        "publisher_ms": round(publisher_seconds * 1000, 2),
+        "synchronous_publisher_ms": round(args.burst * args.slow_ms, 1),
+        "publish_us": publish_us,
+        **stats
+    }
+    if stats["delivered"] + stats["coalesced"] + stats["dropped"] != args.burst:
+        failures.append("yavaş abone: olay sayıları tutmuyor")
+    if args.max_publish_us is not None and publish_us["p99"] > args.max_publish_us:
+        failures.append(f"yavaş abone: yayın p99 {publish_us['p99']:.0f} us")
+    return {
+        "overhead": overhead,
+        "throughput": throughput,
+        "slow_subscriber": slow_result,
+        "failures": failures
+    }
+
+def bench_analytics(args):
+    """Sentetik geçmiş üzerinde analitik yükleme + hesaplama süresi"""
+    if not HistoryAnalytics.available():
+        raise RuntimeError("NumPy gerekli: pip install numpy")
+    rng = random.Random(args.seed)
+    queues = [420, 420, 420, 440, 400, 450, 450]
+    count = int(args.days * args.cycles_per_day)
+    start_time = time.time() - args.days * 86400
+    with tempfile.TemporaryDirectory() as config_dir:
+        history = MatchHistory(Path(config_dir) / "history.jsonl")
+        with open(history.path, 'w', encoding='utf-8') as f:
+            for i in range(count):
+                t = start_time + i * 86400 / args.cycles_per_day + rng.uniform(0, 600)
+                played = rng.random() > 0.1
+                record = {"t": round(t, 1), "queue_id": rng.choice(queues),
+                          "queue_wait": round(rng.lognormvariate(4.5, 0.6), 3),
+                          "accept_latency": round(rng.uniform(0.05, 0.4), 3), "played": played}
+                if played:
+                    record["cycle_length"] = round(rng.uniform(1200, 2700), 3)
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        size = history.path.stat().st_size
+
+        # Soğuk: pencere ilk açıldığında tüm dosya; sıcak: yeni döngü sonrası yenileme
+        cold_ms, refresh_ms = [], []
+        for _ in range(args.repeat):
+            analytics = HistoryAnalytics(history)
+            started = time.perf_counter()
+            result = analytics.compute()
+            cold_ms.append((time.perf_counter() - started) * 1000)
+
+            history.append({"t": round(time.time(), 1), "queue_id": 420, "queue_wait": 80.0, "played": False})
+            started = time.perf_counter()
+            result = analytics.compute()
+            refresh_ms.append((time.perf_counter() - started) * 1000)
+
+    failures = []
+    cold = summarize(cold_ms)
+    if args.max_ms is not None and cold["p50"] > args.max_ms:
+        failures.append(f"analitik p50 {cold['p50']} ms > {args.max_ms} ms")
+    return {
+        "cycles": count,
+        "history_bytes": size,
+        "cold_ms": cold,
+        "refresh_ms": summarize(refresh_ms),
+        "heatmap_cells": int((result["heatmap_counts"] > 0).sum()),
+        "queues": len(result["queues"]),
+        "failures": failures
+    }
+
+def bench_export(args):
+    """Milyonlarca satırlık geçmişin CSV / JSONL dışa aktarma hızı ve bellek kullanımı"""
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as config_dir:
+        config = ConfigManager(config_dir)
+        history = MatchHistory(Path(config_dir) / "history.jsonl")
+        start_time = time.time() - args.rows * 60
+        with open(history.path, 'w', encoding='utf-8') as f:
+            for i in range(args.rows):
+                f.write(json.dumps({"t": round(start_time + i * 60, 1), "queue_id": 420,
+                                    "queue_wait": round(rng.lognormvariate(4.5, 0.6), 3),
+                                    "accept_latency": round(rng.uniform(0.05, 0.4), 3),
+                                    "cycle_length": round(rng.uniform(1200, 2700), 3),
+                                    "played": True}, separators=(",", ":")) + "\n")
+        size = history.path.stat().st_size
+        exporter = StatsExporter(config, history)
+
+        result = {"rows": args.rows, "history_mb": round(size / 1024 / 1024, 1)}
+        expected = args.rows
+        failures = []
+        for fmt in StatsExporter.FORMATS:
+            rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            exported = exporter.export(fmt)
+            peak_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+
+            # Artımlı: sadece imleçten sonra eklenenler
+            for i in range(args.increment):
+                history.append({"t": round(time.time(), 1), "queue_wait": 60.0, "played": False})
+            incremental = exporter.export(fmt)
+
+            result[fmt] = {
+                "seconds": exported["seconds"],
+                "rows_per_second": round(exported["history_rows"] / exported["seconds"]),
+                "mb_per_second": round(size / 1024 / 1024 / exported["seconds"], 1),
+                "output_mb": round(Path(exported["history_file"]).stat().st_size / 1024 / 1024, 1),
+                "peak_rss_growth_mb": round(peak_growth / 1024, 1),
+                "incremental_rows": incremental["history_rows"],
+                "incremental_seconds": incremental["seconds"]
+            }
+            if exported["history_rows"] != expected:
+                failures.append(f"{fmt}: {exported['history_rows']} satır != {expected}")
+            if incremental["history_rows"] != args.increment:
+                failures.append(f"{fmt}: artımlı {incremental['history_rows']} satır != {args.increment}")
+            expected += args.increment
+    result["failures"] = failures
+    return result
+
+def bench_autoqueue(args):
+    """Faz tetiklemeli otomatik arama: lobby'de geçen ölü süre ve kazanılan süre"""
+    process, port, token = start_simulator(
+        "--no-auto-queue", "--queue-time", args.queue_time, "--champ-select", args.champ_select,
+        "--game", args.game, "--lobby-ready", args.lobby_ready,
+        "--search-reject-rate", args.search_reject_rate,
+        "--latency", args.latency, "--jitter", args.jitter, "--seed", args.seed
+    )
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            config, client, engine = headless_engine(port, token, config_dir)
+            config.set('auto_queue.baseline_seconds', args.countdown)
+            config.set('auto_queue.min_delay', args.min_delay)
+            engine.set_auto_accept(True)
+            engine.set_auto_queue(True)
+            engine.start()
+            time.sleep(args.duration)
+            engine.stop(timeout=10)
+            config.close()
+            stats = sim_stats(client)
+            report = engine.auto_queue.report()
+            app_stats = config.get('stats', {})
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+    # Simülatör tarafı: lobby'ye giriş -> arama (ilk lobby dahil)
+    lobby_waits = stats["lobby_waits"]
+    dead_over_ready = [max(wait - args.lobby_ready, 0) for wait in lobby_waits]
+    result = {
+        "searches": stats["searches"],
+        "queue_sessions": app_stats.get('queue_sessions', 0),
+        "matches_accepted": app_stats.get('matches_accepted', 0),
+        "lobby_wait_s": summarize(lobby_waits),
+        "dead_time_after_ready_s": summarize(dead_over_ready),
+        "auto_queue": report,
+        "saved_vs_countdown_s": report["saved_seconds"],
+        "missed_ready_checks": stats["missed_ready_checks"]
+    }
+    failures = []
+    if not lobby_waits:
+        failures.append("hiç arama başlatılmadı")
+    elif args.max_dead_time is not None and max(dead_over_ready) > args.min_delay + args.max_dead_time:
+        failures.append(f"lobby hazır olduktan sonra {max(dead_over_ready):.1f} sn beklendi")
+    result["failures"] = failures
+    return result
+
+def bench_hooks(args):
+    """Kullanıcı hook'ları: asılı / yavaş / taşkın hook'lar varken ready check -> kabul yolu"""
+    result = {}
+    failures = []
+    for mode in ("none", "hostile"):
+        process, port, token = start_simulator(
+            "--queue-time", args.queue_time, "--champ-select", 1, "--game", 2, "--lobby-time", 0.5,
+            "--seed", args.seed
+        )
+        try:
+            with tempfile.TemporaryDirectory() as config_dir:
+                config, client, engine = headless_engine(port, token, config_dir)
+                config.set('hooks.timeout', args.hook_timeout)
+                config.set('hooks.queue', args.hook_queue)
+                if mode == "hostile":
+                    config.set('hooks.commands', {
+                        "match_found": ["sleep 30", "true"],
+                        "accepted": ["sleep 30"],
+                        "champ_select": [],
+                        "game_start": ["true"]
+                    })
+
+                    def hung_hook(event, data):
+                        time.sleep(3600)
+
+                    def slow_hook(event, data):
+                        time.sleep(0.5)
+
+                    engine.hooks.register("match_found", hung_hook)
+                    for _ in range(args.flood):
+                        engine.hooks.register("accepted", slow_hook)
+
+                # Kabul yolu: yeni ready check okundu -> kabul isteği döndü
+                seen = []
+                accept_path = []
+                get_status, accept = client.get_ready_check_status, client.accept_match
+
+                def timed_status():
+                    status = get_status()
+                    if status and status.get("state") == "InProgress" and status.get("playerResponse") == "None":
+                        seen.append(time.perf_counter())
+                    return status
+
+                def timed_accept():
+                    accepted = accept()
+                    if seen:
+                        accept_path.append((time.perf_counter() - seen.pop()) * 1000)
+                    return accepted
+
+                client.get_ready_check_status, client.accept_match = timed_status, timed_accept
+                engine.set_auto_accept(True)
+                engine.start()
+                time.sleep(args.duration)
+                report = engine.hooks.report()
+                engine.stop(timeout=10)
+                config.close()
+                stats = sim_stats(client)
+        finally:
+            process.terminate()
+            process.wait(timeout=5)
+        result[mode] = {
+            "accepted": len(accept_path),
+            "accept_path_ms": summarize(accept_path),
+            "sim_accept_latency_ms": summarize(stats["accept_latencies_ms"]),
+            "missed_ready_checks": stats["missed_ready_checks"],
+            "hooks": report
+        }
+        if not accept_path:
+            failures.append(f"{mode}: hiç kabul yapılmadı")
+    hostile, baseline = result["hostile"], result["none"]
+    if hostile["accept_path_ms"].get("max") is not None and baseline["accept_path_ms"].get("max") is not None:
+        slowdown = hostile["accept_path_ms"]["max"] - baseline["accept_path_ms"]["max"]
+        result["accept_path_slowdown_ms"] = round(slowdown, 2)
+        if args.max_slowdown_ms is not None and slowdown > args.max_slowdown_ms:
+            failures.append(f"hook'lar kabul yolunu {slowdown:.1f} ms yavaşlattı")
+    result["failures"] = failures
+    return result
+
+def bench_postgame(args):
+    """Oyun sonu ekranlarını geçme: oyun bitişi -> lobby süresi ve saatlik oyun sayısı"""
+    process, port, token = start_simulator(
+        "--no-auto-queue", "--queue-time", args.queue_time, "--champ-select", args.champ_select,
+        "--game", args.game, "--lobby-ready", args.lobby_ready, "--post-game", args.post_game,
+        "--latency", args.latency, "--jitter", args.jitter, "--seed", args.seed
+    )
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            config, client, engine = headless_engine(port, token, config_dir)
+            engine.set_auto_accept(True)
+            engine.set_auto_queue(True)
+            engine.set_end_of_game_skip(not args.no_skip)
+            engine.start()
+            time.sleep(args.duration)
+            engine.stop(timeout=10)
+            config.close()
+            stats = sim_stats(client)
+            report = engine.end_of_game.report()
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+    waits = stats["post_game_waits"]
+    steps = {}
+    for run in report["runs"]:
+        for name, seconds in run["steps"].items():
+            steps.setdefault(name, []).append(seconds)
+    result = {
+        "games": stats["games"],
+        "games_per_hour": round(stats["games"] * 3600 / args.duration, 1),
+        "post_game_to_lobby_s": summarize(waits),
+        "steps_s": {name: summarize(values) for name, values in steps.items()},
+        "searches": stats["searches"]
+    }
+    failures = []
+    if not args.no_skip:
+        if not waits:
+            failures.append("oyun sonundan lobby'ye hiç dönülmedi")
+        elif args.max_post_game is not None and max(waits) > args.max_post_game:
+            failures.append(f"oyun sonu -> lobby {max(waits):.1f} sn sürdü")
+    result["failures"] = failures
+    return result
+
+def bench_lobby(args):
+    """Ana ekrandan lobby oluştur + ara: istek sayısı, gecikme ve sürüme bağlı kuyruk önbelleği"""
+    failures = []
+    result = {}
+    with tempfile.TemporaryDirectory() as config_dir:
+        cache_path = Path(config_dir) / "queues.json"
+
+        def session(version, label):
+            """Yeni simülatör + yeni client: `rounds` kez ana ekran -> lobby -> arama"""
+            process, port, token = start_simulator(
+                "--start-phase", "None", "--no-auto-queue", "--queue-time", "600",
+                "--game-version", version, "--latency", args.latency, "--seed", args.seed
+            )
+            try:
+                client = LoLClient()
+                client.queues = QueueCatalog(cache_path)
+                client.connect(port, token)
+                started = time.perf_counter()
+                client.queues.ensure(client)
+                warmup_ms = (time.perf_counter() - started) * 1000
+                latencies = []
+                for _ in range(args.rounds):
+                    client.session.post(f"https://127.0.0.1:{port}/__sim/phase",
+                                        json={"phase": "None"}, timeout=5)
+                    client.check_game_status()
+                    before = sim_stats(client)["requests"]
+                    started = time.perf_counter()
+                    if not client.queue_up(args.queue_id):
+                        failures.append(f"{label}: lobby oluşturulup aranamadı")
+                        break
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    after = sim_stats(client)["requests"]
+                    sent = sum(after.get("None", {}).values()) - sum(before.get("None", {}).values())
+                    sent += sum(after.get("Lobby", {}).values()) - sum(before.get("Lobby", {}).values())
+                    if sent != 2:
+                        failures.append(f"{label}: lobby + arama {sent} istek sürdü")
+                        break
+                stats = sim_stats(client)
+                rejected = not client.create_lobby(args.invalid_queue_id)
+                after = sim_stats(client)["requests"]
+                if not rejected or after != stats["requests"]:
+                    failures.append(f"{label}: geçersiz kuyruk LCU'ya gönderildi")
+            finally:
+                process.terminate()
+                process.wait(timeout=5)
+            queue_fetches = sum(phase.get("GET /lol-game-queues/v1/queues", 0)
+                                for phase in stats["requests"].values())
+            return {
+                "version": version,
+                "catalog_warmup_ms": round(warmup_ms, 1),
+                "queue_up_ms": summarize(latencies),
+                "queue_fetches": queue_fetches,
+                "searches": stats["searches"],
+                "phase": stats["phase"]
+            }
+
+        # İlk çalıştırma listeyi indirir; aynı sürümde yeniden başlatma diskten okur; yama yeniden indirir
+        runs = [("cold", args.version, 1), ("warm_restart", args.version, 0), ("patched", args.new_version, 1)]
+        for label, version, expected_fetches in runs:
+            result[label] = session(version, label)
+            if result[label]["queue_fetches"] != expected_fetches:
+                failures.append(f"{label}: kuyruk listesi {result[label]['queue_fetches']} kez indirildi "
+                                f"(beklenen {expected_fetches})")
+        result["cache_bytes"] = cache_path.stat().st_size if cache_path.exists() else 0
+    result["failures"] = failures
+    return result
+
+def bench_champselect(args):
+    """Simüle draft: sıra başlangıcı -> ban / kilit gecikmesi, karar süresi ve indeks maliyeti"""
+    process, port, token = start_simulator(
+        "--queue-time", args.queue_time, "--game", args.game, "--lobby-time", "1",
+        "--draft", args.turn, "--draft-planning", args.planning, "--draft-timeout", args.timeout,
+        "--owned-rate", args.owned_rate, "--latency", args.latency, "--jitter", args.jitter, "--seed", args.seed
+    )
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            config, client, engine = headless_engine(port, token, config_dir)
+            engine.champ_select.set_lists(args.picks.split(","), args.bans.split(","))
+            engine.set_auto_accept(True)
+            engine.set_champ_select(True)
+            engine.start()
+            time.sleep(args.duration)
+            engine.stop(timeout=10)
+            config.close()
+            stats = sim_stats(client)
+            report = engine.champ_select.report()
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+    turns = stats["draft_turns"]
+    index_fetches = sum(phase.get("GET /lol-game-data/assets/v1/champion-summary.json", 0)
+                        for phase in stats["requests"].values())
+    result = {
+        "games": stats["games"],
+        "turn_to_action_ms": {kind: summarize([t["ms"] for t in turns if t["type"] == kind and not t["timed_out"]])
+                              for kind in ("ban", "pick")},
+        "timed_out": sum(1 for t in turns if t["timed_out"]),
+        "hovers": stats["hovers"],
+        "index_fetches": index_fetches,
+        "assistant": report,
+        "session_polls_per_champ_select": round(
+            sum(phase.get("GET /lol-champ-select/v1/session", 0) for phase in stats["requests"].values())
+            / max(len([t for t in turns if t["type"] == "pick"]), 1), 1)
+    }
+    failures = []
+    if not turns:
+        failures.append("hiç draft sırası gelmedi")
+    if result["timed_out"]:
+        failures.append(f"{result['timed_out']} sıra zaman aşımına uğradı")
+    slowest = max((t["ms"] for t in turns if not t["timed_out"]), default=0)
+    if args.max_turn_ms is not None and slowest > args.max_turn_ms:
+        failures.append(f"sıra başı -> aksiyon {slowest:.0f} ms sürdü")
+    if index_fetches > 1:
+        failures.append(f"şampiyon indeksi {index_fetches} kez kuruldu")
+    result["failures"] = failures
+    return result
+
+def bench_discovery(args):
+    """Client kapalıyken saatlik uyanma ve client açılışından bağlantıya geçen süre (tarama vs olay)"""
+    result = {}
+    for mode in ("polling", "watch"):
+        with tempfile.TemporaryDirectory() as config_dir, tempfile.TemporaryDirectory() as install_dir:
+            config = ConfigManager(config_dir)
+            config.set('client.install_dirs', [install_dir])
+            config.set('client.watch', mode == "watch")
+            client = LoLClient()
+            engine = MonitorEngine(client, config)
+            engine.start()
+            sources = engine.watcher.sources if engine.watcher else []
+            # Client kapalı: motor ve watcher thread'lerinin uyanmalarını say
+            meter_before = dict(engine.meter.wakeups)
+            watcher_before = engine.watcher.counters["wakeups"] if engine.watcher else 0
+            time.sleep(args.idle)
+            # "watcher" kaynağı olay dağıtımıdır; thread uyanmaları aşağıda ayrıca sayılır
+            wakeups = {source: count - meter_before.get(source, 0) for source, count in engine.meter.wakeups.items()
+                       if source != "watcher"}
+            if engine.watcher:
+                wakeups["watcher_thread"] = engine.watcher.counters["wakeups"] - watcher_before
+
+            lockfile = Path(install_dir) / "lockfile"
+            process, _, _ = start_simulator("--lockfile", lockfile, "--seed", args.seed)
+            try:
+                written = lockfile.stat().st_mtime
+                deadline = time.monotonic() + args.timeout
+                while not client.connected and time.monotonic() < deadline:
+                    time.sleep(0.001)
+                connect_ms = (time.time() - written) * 1000 if client.connected else None
+            finally:
+                engine.stop(timeout=5)
+                config.close()
+                process.terminate()
+                process.wait(timeout=5)
+            result[mode] = {
+                "sources": sources,
+                "disconnected_wakeups_per_hour": round(sum(wakeups.values()) * 3600 / args.idle, 1),
+                "wakeups": wakeups,
+                "connect_ms": round(connect_ms, 1) if connect_ms is not None else None,
+                "watcher": dict(engine.watcher.counters) if engine.watcher else None
+            }
+    failures = []
+    watch = result["watch"]
+    if not watch["sources"]:
+        failures.append("olay kaynağı açılamadı (Linux + inotify gerekir)")
+    elif watch["connect_ms"] is None:
+        failures.append("client açılışı algılanmadı")
+    elif args.max_connect_ms is not None and watch["connect_ms"] > args.max_connect_ms:
+        failures.append(f"lockfile -> bağlantı {watch['connect_ms']:.0f} ms sürdü")
+    result["failures"] = failures
+    return result
+
+def bench_reconnect(args):
+    """Client yeni portta yeniden başlar / askıda kalır / uyku: yeni client'a bağlanma süresi
+
+    watch: lockfile olayları açık (varsayılan ayar) - client hazır olduktan sonra ölçülür.
+    poll: yalnızca bağlantı sağlığı takibi - kopma fark edildikten (reset) sonra ölçülür,
+    fark etme süresi izleme aralığına bağlıdır.
+    """
+    result = {}
+    failures = []
+    for mode, scenario in itertools.product(args.modes.split(","), args.scenarios.split(",")):
+        with tempfile.TemporaryDirectory() as config_dir, tempfile.TemporaryDirectory() as install_dir:
+            lockfile = Path(install_dir) / "lockfile"
+            config = ConfigManager(config_dir)
+            config.set('client.install_dirs', [install_dir])
+            config.set('client.watch', mode == "watch")
+            old, _, _ = start_simulator("--lockfile", lockfile, "--queue-time", "600", "--seed", args.seed)
+            new = None
+            client = LoLClient()
+            engine = MonitorEngine(client, config)
+            engine.set_auto_accept(True)
+            engine.start()
+            try:
+                deadline = time.monotonic() + 5
+                while not client.connected and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                old_port = client.port
+                time.sleep(args.settle)
+
+                if scenario == "restart":
+                    # Patch sonrası yeniden başlatma: eski süreç kapanır, yeni client başka portta açılır
+                    old.terminate()
+                    old.wait(timeout=5)
+                    time.sleep(args.gap)
+                else:
+                    # Askıdaki client: eski port yanıt vermez (RST yok, zaman aşımı)
+                    os.kill(old.pid, signal.SIGSTOP)
+                    if scenario == "resume":
+                        offset = args.sleep_seconds
+                        engine.wall_clock = lambda: time.time() + offset
+                new, new_port, _ = start_simulator(
+                    "--lockfile", lockfile, "--lobby-time", "0.2", "--queue-time", "0.5", "--seed", args.seed
+                )
+                available = time.monotonic()
+                deadline = available + args.timeout
+                detected = None
+                while not (client.connected and client.port == new_port) and time.monotonic() < deadline:
+                    if detected is None and client.resets:
+                        detected = time.monotonic()
+                    time.sleep(0.002)
+                connected_at = time.monotonic()
+                reconnect_ms = (connected_at - available) * 1000 if client.port == new_port else None
+                recovery_ms = (connected_at - (detected or connected_at)) * 1000
+                accepted_ms = accept_latency = None
+                while time.monotonic() < deadline:
+                    latencies = sim_stats(client)["accept_latencies_ms"] if client.port == new_port else None
+                    if latencies:
+                        accepted_ms = (time.monotonic() - available) * 1000
+                        accept_latency = latencies[0]
+                        break
+                    time.sleep(0.05)
+            finally:
+                engine.stop(timeout=5)
+                config.close()
+                for process in (old, new):
+                    if process and process.poll() is None:
+                        process.kill()
+                        process.wait(timeout=5)
+            name = f"{mode}.{scenario}"
+            result[name] = {
+                "old_port": old_port,
+                "reconnect_ms": round(reconnect_ms, 1) if reconnect_ms is not None else None,
+                "recovery_ms": round(recovery_ms, 1),
+                "first_accept_ms": round(accepted_ms, 1) if accepted_ms is not None else None,
+                "accept_latency_ms": accept_latency,
+                "resets": client.resets
+            }
+            measured = reconnect_ms if mode == "watch" else recovery_ms
+            if reconnect_ms is None:
+                failures.append(f"{name}: yeni client'a bağlanılamadı")
+            elif accepted_ms is None:
+                failures.append(f"{name}: yeni client'ta kabul yapılmadı")
+            elif args.max_reconnect_ms is not None and measured > args.max_reconnect_ms:
+                failures.append(f"{name}: yeniden bağlanma {measured:.0f} ms sürdü")
+    result["failures"] = failures
+    return result
+
+CONFIG_WRITER = """
+import sys
+sys.path.insert(0, {root!r})
+from berightback import ConfigManager
+config = ConfigManager({config_dir!r})
+print("READY", flush=True)
+count = 0
+while True:
+    count += 1
+    config.set("stats.matches_found", count)
+    config.flush()
+"""
+
+def bench_shutdown(args):
+    """Kapanış: yavaş LCU'ya istekler uçuştayken kapatma süresi, config.json bütünlüğü
+
+    lifecycle: Lifecycle.shutdown (sinyal + istek iptali + bekleme + tek yazma).
+    naive: motor / timer durdurulup thread'ler beklenir - uçuştaki istek timeout'unu doldurur.
+    kill: config'e sürekli yazan süreç rastgele anda SIGKILL ile öldürülür, dosya hâlâ okunmalı.
+    """
+    result = {}
+    failures = []
+    for mode in ("lifecycle", "naive"):
+        rounds = []
+        for index in range(args.rounds):
+            process, port, token = start_simulator("--queue-time", 600, "--seed", args.seed + index)
+            try:
+                with tempfile.TemporaryDirectory() as config_dir:
+                    config, client, engine = headless_engine(port, token, config_dir)
+                    timer = MatchmakingTimer()
+                    lifecycle = Lifecycle()
+                    lifecycle.add("engine", engine.stop, lambda: [engine.monitor_thread])
+                    lifecycle.add("client", client.close)
+                    lifecycle.add("timer", timer.stop_timer, lambda: [timer.timer_thread])
+                    lifecycle.on_flush("config", config.close)
+
+                    # Uçuştaki LCU istekleri
+                    in_flight = [0]
+                    send = client._send
+
+                    def counted_send(*send_args, **kwargs):
+                        in_flight[0] += 1
+                        try:
+                            return send(*send_args, **kwargs)
+                        finally:
+                            in_flight[0] -= 1
+
+                    client._send = counted_send
+                    engine.set_auto_accept(True)
+                    engine.start()
+                    timer.start_timer(5, 0)
+                    time.sleep(args.settle)
+                    client.session.post(f"https://127.0.0.1:{port}/__sim/latency", json={"ms": args.latency},
+                                        timeout=5)
+                    deadline = time.monotonic() + 5
+                    while not in_flight[0] and time.monotonic() < deadline:
+                        time.sleep(0.005)
+                    time.sleep(args.in_flight)
+                    busy = in_flight[0]
+                    config.set('window.width', 1234 + index, save=False)
+
+                    started = time.perf_counter()
+                    if mode == "lifecycle":
+                        report = lifecycle.shutdown()
+                    else:
+                        engine.stop(timeout=10)
+                        timer.stop_timer()
+                        timer.timer_thread.join(10)
+                        config.flush()
+                        report = {"stragglers": [], "errors": {}}
+                    elapsed = (time.perf_counter() - started) * 1000
+                    saved = json.loads((Path(config_dir) / "config.json").read_text(encoding='utf-8'))
+                    rounds.append({
+                        "shutdown_ms": round(elapsed, 1),
+                        "in_flight": busy,
+                        "stragglers": report["stragglers"],
+                        "errors": report["errors"],
+                        "flushed": saved["window"]["width"] == 1234 + index
+                    })
+            finally:
+                process.terminate()
+                process.wait(timeout=5)
+        result[mode] = {
+            "shutdown_ms": summarize([entry["shutdown_ms"] for entry in rounds]),
+            "rounds_in_flight": sum(1 for entry in rounds if entry["in_flight"]),
+            "stragglers": sorted({name for entry in rounds for name in entry["stragglers"]}),
+            "errors": [entry["errors"] for entry in rounds if entry["errors"]],
+            "not_flushed": sum(1 for entry in rounds if not entry["flushed"])
+        }
+        if mode == "lifecycle":
+            values = result[mode]
+            if values["shutdown_ms"]["max"] > args.max_shutdown_ms:
+                failures.append(f"kapanış {values['shutdown_ms']['max']} ms sürdü")
+            if values["stragglers"] or values["errors"]:
+                failures.append(f"beklenmeyen thread / hata: {values['stragglers']} {values['errors']}")
+            if values["not_flushed"]:
+                failures.append(f"{values['not_flushed']} turda config kapanışta yazılmadı")
+            if not values["rounds_in_flight"]:
+                failures.append("hiçbir turda uçuşta istek yoktu")
+
+    # Yazma sırasında öldürülen süreç config.json'u bozmamalı
+    corrupted = 0
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as config_dir:
+        code = CONFIG_WRITER.format(root=str(ROOT), config_dir=config_dir)
+        for _ in range(args.kills):
+            writer = subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE, text=True)
+            writer.stdout.readline()
+            time.sleep(rng.uniform(0.01, 0.1))
+            writer.kill()
+            writer.wait(timeout=5)
+            writer.stdout.close()
+            try:
+                json.loads((Path(config_dir) / "config.json").read_text(encoding='utf-8'))
+            except ValueError:
+                corrupted += 1
+    result["kill"] = {"kills": args.kills, "corrupted": corrupted}
+    if corrupted:
+        failures.append(f"{corrupted}/{args.kills} öldürmede config.json bozuldu")
+    result["failures"] = failures
+    return result
+
+def bench_metrics(args):
+    """Filo metrikleri: kabul yolu ek yükü, collector kesintisinde sınırlı tampon, gzip oranı, filo toplamları"""
+    result = {}
+    failures = []
+
+    # Kayıt maliyeti (kabul yolunda yapılan tek iş)
+    registry = MetricsRegistry()
+    count = 200000
+    started = time.perf_counter()
+    for _ in range(count):
+        registry.inc("engine.accepts")
+    inc_ns = (time.perf_counter() - started) / count * 1e9
+    started = time.perf_counter()
+    for index in range(count):
+        registry.observe("lcu.request_ms", 0.5 + index % 100)
+    observe_ns = (time.perf_counter() - started) / count * 1e9
+    result["record_ns"] = {"inc": round(inc_ns), "observe": round(observe_ns)}
+
+    for mode in ("off", "on"):
+        process, port, token = start_simulator(
+            "--queue-time", args.queue_time, "--champ-select", 1, "--game", 2, "--lobby-time", 0.5,
+            "--seed", args.seed
+        )
+        collector = None
+        collector_port = free_port()
+        try:
+            with tempfile.TemporaryDirectory() as config_dir:
+                if mode == "on":
+                    preset = ConfigManager(config_dir)
+                    preset.set('metrics', {
+                        "endpoint": f"http://127.0.0.1:{collector_port}/metrics",
+                        "interval": args.interval, "buffer": args.buffer, "machine": "bench-1"
+                    })
+                    preset.close()
+                config, client, engine = headless_engine(port, token, config_dir)
+
+                # Kabul yolu: yeni ready check okundu -> kabul isteği döndü
+                seen = []
+                accept_path = []
+                get_status, accept = client.get_ready_check_status, client.accept_match
+
+                def timed_status():
+                    status = get_status()
+                    if status and status.get("state") == "InProgress" and status.get("playerResponse") == "None":
+                        seen.append(time.perf_counter())
+                    return status
+
+                def timed_accept():
+                    accepted = accept()
+                    if seen:
+                        accept_path.append((time.perf_counter() - seen.pop()) * 1000)
+                    return accepted
+
+                client.get_ready_check_status, client.accept_match = timed_status, timed_accept
+                engine.set_auto_accept(True)
+                engine.start()
+                pusher_thread = engine.pusher.thread
+
+                # Collector ilk `outage` saniye kapalı: partiler tamponda bekler
+                max_pending = 0
+                started = time.monotonic()
+                while time.monotonic() - started < args.duration:
+                    if mode == "on" and collector is None and time.monotonic() - started >= args.outage:
+                        collector, _ = start_collector(collector_port)
+                        engine.pusher._retry_at = 0  # Backoff'u beklemeden bir sonraki turda dene
+                    max_pending = max(max_pending, len(engine.pusher.pending))
+                    time.sleep(0.05)
+                engine.stop(timeout=5)
+                config.close()
+                if pusher_thread:
+                    pusher_thread.join(5)
+                stats = sim_stats(client)
+                entry = {
+                    "accepted": len(accept_path),
+                    "accept_path_ms": summarize(accept_path),
+                    "sim_accepted": len(stats["accept_latencies_ms"])
+                }
+                if mode == "on":
+                    report = engine.pusher.report()
+                    fleet = engine.pusher.session.get(f"http://127.0.0.1:{collector_port}/stats", timeout=5).json()
+                    local = engine.pusher.registry.counters
+                    entry.update({
+                        "pusher": report,
+                        "max_pending": max_pending,
+                        "compression_ratio": round(report["raw_bytes"] / report["bytes"], 1) if report["bytes"] else None,
+                        "collector": fleet["received"],
+                        "fleet_totals": {name: fleet["totals"].get(name) for name in sorted(local)},
+                        "fleet_histograms": fleet["histograms"]
+                    })
+                    mismatched = [name for name, value in local.items() if fleet["totals"].get(name) != value]
+                    if mismatched:
+                        failures.append(f"collector toplamları yerel sayaçlarla uyuşmuyor: {mismatched}")
+                    if max_pending > args.buffer:
+                        failures.append(f"tampon sınırı aşıldı: {max_pending} > {args.buffer}")
+                    if report["pending"]:
+                        failures.append(f"kapanışta {report['pending']} parti gönderilmedi")
+                    if not report["failed"]:
+                        failures.append("collector kesintisi gözlenmedi")
+                result[mode] = entry
+        finally:
+            for child in (process, collector):
+                if child:
+                    child.terminate()
+                    child.wait(timeout=5)
+        if not accept_path:
+            failures.append(f"{mode}: hiç kabul yapılmadı")
+
+    on, off = result["on"]["accept_path_ms"], result["off"]["accept_path_ms"]
+    if on.get("p50") is not None and off.get("p50") is not None:
+        slowdown = on["p50"] - off["p50"]
+        result["accept_path_slowdown_ms"] = round(slowdown, 3)
+        if args.max_slowdown_ms is not None and slowdown > args.max_slowdown_ms:
+            failures.append(f"metrikler kabul yolunu {slowdown:.2f} ms yavaşlattı")
+    result["failures"] = failures
+    return result
+
+def bench_queuestatus(args):
+    """Kuyruk durumu paneli: simüle akşam boyunca faz başına istek sayısı (panel açık / kapalı)
+
+    İki motor aynı anda, aynı tohumlu iki simülatöre karşı çalışır. Arama durumu yalnızca
+    Matchmaking'de sorgulanmalı; ReadyCheck'e düşen istekler faz geçişiyle yarışan son sorgulardır.
+    """
+    runs = {}
+    directories = []
+    try:
+        for mode in ("off", "on"):
+            process, port, token = start_simulator(
+                "--queue-time", args.queue_time, "--champ-select", args.champ_select, "--game", args.game,
+                "--lobby-time", args.lobby_time, "--seed", args.seed
+            )
+            directory = tempfile.TemporaryDirectory()
+            directories.append(directory)
+            runs[mode] = {"process": process}
+            preset = ConfigManager(directory.name)
+            preset.set('queue_status', {"enabled": mode == "on"})
+            preset.close()
+            config, client, engine = headless_engine(port, token, directory.name)
+            updates = []
+            engine.bus.subscribe(lambda event, updates=updates: updates.append(event.data), kinds=["queue_status"],
+                                 notify=lambda subscription: subscription.drain())
+            engine.set_auto_accept(True)
+            runs[mode].update(client=client, engine=engine, updates=updates)
+        for run in runs.values():
+            run["engine"].start()
+        time.sleep(args.duration)
+        for run in runs.values():
+            run["engine"].stop(timeout=10)
+            run["stats"] = sim_stats(run["client"])
+    finally:
+        for run in runs.values():
+            run["process"].terminate()
+            run["process"].wait(timeout=5)
+        for directory in directories:
+            directory.cleanup()
+
+    result = {}
+    failures = []
+    search = "GET /lol-matchmaking/v1/search"
+    for mode, run in runs.items():
+        stats = run["stats"]
+        searches = {phase: endpoints.get(search, 0) for phase, endpoints in stats["requests"].items()}
+        samples = [update for update in run["updates"] if update["time_in_queue"] is not None]
+        result[mode] = {
+            "games": stats["games"],
+            "searches_started": stats["searches"],
+            "ready_checks": stats["ready_checks"],
+            "phase_seconds": {phase: round(seconds, 1) for phase, seconds in stats["phase_seconds"].items()},
+            "search_requests": {phase: count for phase, count in searches.items() if count},
+            "requests_per_hour": per_hour(stats["requests"], stats["phase_seconds"]),
+            "queue_status_events": len(run["updates"]),
+            "time_in_queue_samples": [round(update["time_in_queue"], 1) for update in samples[:20]]
+        }
+        outside = {phase: count for phase, count in searches.items()
+                   if count and phase not in ("Matchmaking", "ReadyCheck")}
+        if mode == "off" and any(searches.values()):
+            failures.append(f"panel kapalıyken {sum(searches.values())} arama durumu isteği")
+        if mode == "on":
+            if outside:
+                failures.append(f"Matchmaking dışında arama durumu isteği: {outside}")
+            if stats["searches"] and not samples:
+                failures.append("kuyrukta geçen süre hiç örneklenmedi")
+
+    # Faz başına saatlik istek farkı (açık - kapalı); Matchmaking dışında ~0 olmalı
+    on, off = result["on"]["requests_per_hour"], result["off"]["requests_per_hour"]
+    result["extra_requests_per_hour"] = {
+        phase: round(on[phase]["total"] - off.get(phase, {}).get("total", 0), 1) for phase in on
+    }
+    matchmaking_seconds = result["on"]["phase_seconds"].get("Matchmaking", 0)
+    total_searches = sum(result["on"]["search_requests"].values())
+    result["search_requests_per_matchmaking_minute"] = (
+        round(total_searches * 60 / matchmaking_seconds, 2) if matchmaking_seconds else None
+    )
+    result["failures"] = failures
+    return result
+
+def legacy_get(tree, key, default=None):
+    """3.0 ConfigManager.get: her çağrıda anahtarı böl, iç içe sözlüklerde yürü"""
+    value = tree
+    for k in key.split('.'):
+        value = value.get(k, default)
+        if value is None:
+            return default
+    return value
+
+def per_call_ns(function, calls):
+    """Bir çağrının ortalama süresi (ns)"""
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return round((time.perf_counter() - start) * 1e9 / calls, 1)
+
+def bench_settings(args):
+    """Ayar deposu: get / set maliyeti, uzun istatistik geçmişli büyük config yükleme, kayıt birleştirme, geçişler"""
+    rng = random.Random(args.seed)
+    failures = []
+    result = {}
+    with tempfile.TemporaryDirectory() as config_dir:
+        # Uzun geçmiş: çok sayıda geniş dağılımlı sketch + export imleçleri
+        seed = ConfigManager(config_dir)
+        sketches = {}
+        for index in range(args.sketches):
+            sketch = QuantileSketch()
+            for _ in range(args.samples):
+                sketch.add(rng.lognormvariate(0, 4))
+            sketches[f"measure_{index}"] = sketch.to_dict()
+        seed.set('sketches', sketches)
+        seed.set('export.cursors', {fmt: args.samples for fmt in StatsExporter.FORMATS})
+        seed.close()
+        config_file = Path(config_dir) / "config.json"
+
+        load_ms, json_ms = [], []
+        for _ in range(args.loads):
+            start = time.perf_counter()
+            config = ConfigManager(config_dir)
+            load_ms.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            json.loads(config_file.read_text(encoding='utf-8'))
+            json_ms.append((time.perf_counter() - start) * 1000)
+        result["load"] = {
+            "config_bytes": config_file.stat().st_size,
+            "load_ms": summarize(load_ms),
+            "json_only_ms": summarize(json_ms),
+            "writes": config.writes
+        }
+        if config.writes:
+            failures.append("Geçerli config yüklenirken yeniden yazıldı")
+
+        # Okuma: önceden hesaplanmış erişim vs her çağrıda bölüp yürüme
+        tree = config.snapshot()
+        get = {}
+        for label, key in (("leaf", "performance.sample_interval"), ("section", "stats"),
+                           ("dynamic", "export.cursors.csv")):
+            get[label] = {
+                "ns": per_call_ns(lambda: config.get(key, 0), args.gets),
+                "legacy_ns": per_call_ns(lambda: legacy_get(tree, key, 0), args.gets)
+            }
+            if config.get(key) != legacy_get(tree, key):
+                failures.append(f"get({key!r}) eski okumayla aynı değeri vermedi")
+        result["get"] = get
+        for label in ("leaf", "section"):
+            if get[label]["ns"] > get[label]["legacy_ns"]:
+                failures.append(f"{label} okuma eskisinden yavaş: {get[label]['ns']} ns "
+                                f"(eski {get[label]['legacy_ns']} ns)")
+        # Bölüm görünümü yalnızca bölümde değişiklik olunca yeniden kurulur
+        config.set('stats.matches_found', config.get('stats.matches_found') + 1)
+        get["section_after_set_ns"] = per_call_ns(
+            lambda: (config.set('stats.matches_found', config.get('stats.matches_found') + 1, save=False),
+                     config.get('stats')), args.gets // 10)
+        if config.get('stats')['matches_found'] != config.get('stats.matches_found'):
+            failures.append("Bölüm görünümü set() sonrası bayat kaldı")
+
+        # Yazma: bildirim + birleşen kayıt vs her set'te tam dosya yazımı
+        notified = []
+        config.watch(notified.append)
+        counter = itertools.count(1)
+        writes = config.writes
+        set_ns = per_call_ns(lambda: config.set('stats.matches_found', next(counter)), args.sets)
+        increment_ns = per_call_ns(lambda: config.increment('stats.queue_sessions'), args.sets)
+        unchanged = config.get('stats.matches_found')
+        unchanged_ns = per_call_ns(lambda: config.set('stats.matches_found', unchanged), args.sets)
+        time.sleep(ConfigManager.SAVE_DELAY * 2.5)
+        coalesced = config.writes - writes
+
+        def legacy_set(value):
+            tree['stats']['matches_found'] = value
+            temp_file = config_file.with_name(config_file.name + ".tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(tree, f, indent=2, ensure_ascii=False)
+            os.replace(temp_file, config_file)
+
+        legacy_ns = per_call_ns(lambda: legacy_set(next(counter)), args.legacy_sets)
+        result["set"] = {
+            "ns": set_ns,
+            "unchanged_ns": unchanged_ns,
+            "increment_ns": increment_ns,
+            "legacy_ns": legacy_ns,
+            "sets": args.sets,
+            "writes": coalesced,
+            "notifications": len(notified)
+        }
+        if len(notified) != args.sets * 2:
+            failures.append(f"{args.sets * 2} değişiklik için {len(notified)} bildirim")
+        if coalesced > 3:
+            failures.append(f"{args.sets} set {coalesced} dosya yazımına yol açtı")
+        config.close()
+
+    # Sürümsüz, elle düzenlenmiş dosya: geçiş + doğrulama + bilinmeyen anahtarların korunması
+    with tempfile.TemporaryDirectory() as config_dir:
+        config_file = Path(config_dir) / "config.json"
+        config_file.write_text(json.dumps({
+            "language": "de",
+            "window": {"width": "1200", "height": 800},
+            "stats": {"matches_found": 12},
+            "hooks": {"commands": {"accepted": "notify-send kabul"}},
+            "champ_select": {"picks": "Ahri, Lux"},
+            "plugin": {"enabled": True}
+        }), encoding='utf-8')
+        config = ConfigManager(config_dir)
+        config.close()
+        saved = json.loads(config_file.read_text(encoding='utf-8'))
+        checks = {
+            "version": saved.get("version") == ConfigManager.VERSION,
+            "invalid_reset": (config.get('language'), config.get('window.width')) == ("tr", 1000),
+            "valid_kept": (config.get('window.height'), config.get('stats.matches_found')) == (800, 12),
+            "hooks_migrated": config.get('hooks.commands.accepted') == ["notify-send kabul"],
+            "picks_migrated": config.get('champ_select.picks') == ["Ahri", "Lux"],
+            "unknown_kept": saved.get("plugin") == {"enabled": True}
+        }
+        result["migration"] = checks
+        failures.extend(f"Geçiş / doğrulama: {name}" for name, ok in checks.items() if not ok)
+
+    result["failures"] = failures
+    return result
+
+def max_in_window(times, window=1.0):
+    """Herhangi bir `window` saniyelik aralıktaki en fazla olay sayısı"""
+    times = sorted(times)
+    best = start = 0
+    for end, t in enumerate(times):
+        while t - times[start] > window:
+            start += 1
+        best = max(best, end - start + 1)
+    return best
+
+def bench_ratelimit(args):
+    """Patlamalı çağıranlar altında LCU hız sınırı ve kritik isteklerin bekleme süresi"""
+    process, port, token = start_simulator("--latency", args.latency, "--seed", args.seed)
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            _, client, _ = headless_engine(port, token, config_dir)
+            client.cache = None  # Sınırlayıcıyı doğrudan yükle
+            if args.no_limit:
+                client.limiter = None
+            else:
+                client.limiter = RateLimiter()
+
+            sent = {"poll": [], "critical": []}
+            send = client._send
+
+            def counting_send(method, path, timeout, **kwargs):
+                kind = "critical" if method != "GET" else "poll"
+                response = send(method, path, timeout, **kwargs)
+                sent[kind].append(time.monotonic())
+                return response
+
+            client._send = counting_send
+            stop = threading.Event()
+            critical_latency = []
+
+            def poller(seed):
+                rng = random.Random(seed)
+                while not stop.is_set():
+                    for _ in range(rng.randint(5, 30)):
+                        try:
+                            client._request("GET", "/lol-gameflow/v1/gameflow-phase")
+                        except Exception:
+                            pass
+                    stop.wait(rng.uniform(0, 0.5))
+
+            def critical():
+                rng = random.Random(args.seed)
+                while not stop.wait(rng.uniform(0.5, 1.0)):
+                    for _ in range(rng.randint(1, 2)):
+                        started = time.perf_counter()
+                        try:
+                            client._request("POST", "/lol-matchmaking/v1/ready-check/accept")
+                        except Exception:
+                            pass
+                        critical_latency.append((time.perf_counter() - started) * 1000)
+
+            threads = [threading.Thread(target=poller, args=(args.seed + i,), daemon=True)
+                       for i in range(args.pollers)]
+            threads.append(threading.Thread(target=critical, daemon=True))
+            wall_start = time.monotonic()
+            for thread in threads:
+                thread.start()
+            time.sleep(args.duration)
+            stop.set()
+            for thread in threads:
+                thread.join(timeout=10)
+            wall = time.monotonic() - wall_start
+            limiter_stats = client.limiter.stats() if client.limiter else None
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+    rates = dict(RateLimiter.BUDGETS)
+    cap = sum(rate for rate, _ in rates.values())
+    # 1 sn'lik pencerede: dolum + kova kapasiteleri + kritik borç
+    window_bound = cap + sum(burst for _, burst in rates.values()) + RateLimiter.BORROW_LIMIT
+    total = len(sent["poll"]) + len(sent["critical"])
+    result = {
+        "requests": {kind: len(times) for kind, times in sent.items()},
+        "requests_per_second": round(total / wall, 1),
+        "cap_per_second": cap,
+        "max_in_1s_window": max_in_window(sent["poll"] + sent["critical"]),
+        "window_bound": window_bound,
+        "critical_latency_ms": summarize(critical_latency),
+        "limiter": limiter_stats
+    }
+    failures = []
+    if not args.no_limit:
+        if result["requests_per_second"] > cap * 1.05:
+            failures.append(f"ortalama {result['requests_per_second']}/s > sınır {cap}/s")
+        if result["max_in_1s_window"] > window_bound:
+            failures.append(f"1 sn penceresi {result['max_in_1s_window']} > {window_bound}")
+        if limiter_stats["critical"]["wait_ms_max"] > args.max_critical_wait_ms:
+            failures.append(f"kritik bekleme {limiter_stats['critical']['wait_ms_max']} ms")
+    result["failures"] = failures
+    return result
+
+def compare(result, baseline_path):
+    """Önceki sonuçla karşılaştır ve farkları yazdır"""
+    baseline = json.loads(Path(baseline_path).read_text(encoding='utf-8'))
+
+    def flatten(data, prefix=""):
+        for key, value in data.items():
+            if isinstance(value, dict):
+                yield from flatten(value, f"{prefix}{key}.")
+            elif isinstance(value, (int, float)):
+                yield f"{prefix}{key}", value
+
+    old = dict(flatten(baseline.get("results", {})))
+    print(f"\nKarşılaştırma: {baseline.get('version')} -> {result['version']}")
+    for key, value in flatten(result["results"]):
+        if key in old and old[key] != value:
+            base = old[key]
+            change = f"{(value - base) * 100 / base:+.1f}%" if base else "n/a"
+            print(f"  {key}: {base} -> {value} ({change})")
+
+# Hızlı doğrulama: eşik / davranış kontrolü olan tüm benchmark'lar kısa sürelerle (CI / commit öncesi)
+# replay kayıt dosyası ister - ayrıca çalıştırılır
+CHECKS = {
+    "lobby": ["--rounds", "2"],
+    "reconnect": ["--modes", "watch", "--settle", "0.3", "--gap", "0.3"],
+    "shutdown": ["--rounds", "1", "--settle", "0.3", "--latency", "1000", "--kills", "5"],
+    "settings": ["--sketches", "10", "--samples", "5000", "--loads", "5", "--gets", "50000",
+                 "--sets", "5000", "--legacy-sets", "20"],
+    "bus": ["--events", "20000", "--burst", "200"],
+    "analytics": ["--days", "30", "--repeat", "3"],
+    "export": ["--rows", "20000", "--increment", "200"],
+    "ratelimit": ["--duration", "5"],
+    "discovery": ["--idle", "3", "--timeout", "5"],
+    "hooks": ["--duration", "5", "--queue-time", "0.5"],
+    "metrics": ["--duration", "8", "--outage", "2"],
+    "autoqueue": ["--duration", "30", "--queue-time", "2-3", "--game", "3"],
+    "postgame": ["--duration", "30", "--queue-time", "2-3", "--game", "3", "--post-game", "10"],
+    "champselect": ["--duration", "20", "--queue-time", "2-3", "--game", "3"],
+    "queuestatus": ["--duration", "30", "--queue-time", "3-5", "--game", "5"],
+}
+
+def bench_check(args):
+    """Hızlı duman testi: CHECKS'teki her benchmark kısa sürelerle, eşikleri ve davranış kontrolleriyle"""
+    parser = build_parser()
+    names = args.only.split(",") if args.only else list(CHECKS)
+    result = {}
+    failures = []
+    for name in names:
+        if name not in CHECKS:
+            failures.append(f"{name}: bilinmeyen kontrol")
+            continue
+        options = parser.parse_args([name, *CHECKS[name]])
+        started = time.perf_counter()
+        try:
+            errors = BENCHMARKS[name](options)["failures"]
+        except Exception as e:
+            errors = [f"hata: {e!r}"]
+        result[name] = {"seconds": round(time.perf_counter() - started, 1), "failures": errors}
+        failures += [f"{name}: {error}" for error in errors]
+    result["failures"] = failures
+    return result
+
+BENCHMARKS = {
+    "latency": bench_latency,
+    "record": bench_record,
+    "replay": bench_replay,
+    "sketch": bench_sketch,
+    "bus": bench_bus,
+    "analytics": bench_analytics,
+    "export": bench_export,
+    "ratelimit": bench_ratelimit,
+    "autoqueue": bench_autoqueue,
+    "hooks": bench_hooks,
+    "postgame": bench_postgame,
+    "lobby": bench_lobby,
+    "champselect": bench_champselect,
+    "discovery": bench_discovery,
+    "reconnect": bench_reconnect,
+    "shutdown": bench_shutdown,
+    "metrics": bench_metrics,
+    "queuestatus": bench_queuestatus,
+    "settings": bench_settings,
+    "check": bench_check,
+}
+
+def build_parser():
+    """Komut satırı: ortak seçenekler + benchmark başına alt komut"""
+    parser = argparse.ArgumentParser(description="BeRightBack benchmark suite")
+    parser.add_argument("--output", help="Sonuç JSON dosyası (varsayılan: benchmarks/results/)")
+    parser.add_argument("--baseline", help="Karşılaştırılacak önceki sonuç JSON'u")
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--trace", type=Path, help="Maç döngülerini Chrome trace JSON olarak yaz (latency / replay)")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    latency = subparsers.add_parser("latency", help=bench_latency.__doc__)
+    latency.add_argument("--duration", type=float, default=120, help="Saniye")
+    latency.add_argument("--queue-time", default="5-10")
+    latency.add_argument("--champ-select", default="5")
+    latency.add_argument("--game", default="10")
+    latency.add_argument("--lobby-time", default="2")
+    latency.add_argument("--latency", type=float, default=2, help="LCU gecikmesi (ms)")
+    latency.add_argument("--jitter", type=float, default=3, help="LCU jitter (ms)")
+    latency.add_argument("--failure-rate", type=float, default=0.0)
+    latency.add_argument("--seed", type=int, default=1)
+    latency.add_argument("--readers", type=int, default=0,
+                         help="Faz / lobby'yi 4 Hz okuyan ek thread sayısı")
+    latency.add_argument("--no-cache", action="store_true", help="LCU yanıt önbelleğini kapat")
+
+    record = subparsers.add_parser("record", help=bench_record.__doc__)
+    record.add_argument("recording", type=Path)
+    record.add_argument("--duration", type=float, default=120, help="Saniye")
+    record.add_argument("--queue-time", default="5-10")
+    record.add_argument("--champ-select", default="5")
+    record.add_argument("--game", default="10")
+    record.add_argument("--lobby-time", default="2")
+    record.add_argument("--seed", type=int, default=1)
+
+    replay = subparsers.add_parser("replay", help=bench_replay.__doc__)
+    replay.add_argument("recording", type=Path)
+    replay.add_argument("--speed", type=float, default=None,
+                        help="Gerçek zamana göre hız (1 = gerçek); verilmezse beklemeden oynatır")
+    replay.add_argument("--max-accept-ms", type=float, default=None)
+    replay.add_argument("--max-requests", type=int, default=None)
+    replay.add_argument("--expect-accepted", type=int, default=None)
+    replay.add_argument("--allow-missed", action="store_true")
+
+    sketch = subparsers.add_parser("sketch", help=bench_sketch.__doc__)
+    sketch.add_argument("--samples", type=int, default=1_000_000)
+    sketch.add_argument("--seed", type=int, default=1)
+
+    bus = subparsers.add_parser("bus", help=bench_bus.__doc__)
+    bus.add_argument("--events", type=int, default=200_000)
+    bus.add_argument("--burst", type=int, default=2000, help="Yavaş aboneye gönderilen olay")
+    bus.add_argument("--slow-ms", type=float, default=5, help="Yavaş abonenin olay başı süresi")
+    bus.add_argument("--queue", type=int, default=64, help="Yavaş abonenin kuyruk sınırı")
+    bus.add_argument("--max-publish-us", type=float, default=100)
+
+    analytics = subparsers.add_parser("analytics", help=bench_analytics.__doc__)
+    analytics.add_argument("--days", type=float, default=365)
+    analytics.add_argument("--cycles-per-day", type=float, default=20)
+    analytics.add_argument("--repeat", type=int, default=10)
+    analytics.add_argument("--max-ms", type=float, default=100)
+    analytics.add_argument("--seed", type=int, default=1)
+
+    export = subparsers.add_parser("export", help=bench_export.__doc__)
+    export.add_argument("--rows", type=int, default=2_000_000)
+    export.add_argument("--increment", type=int, default=1000)
+    export.add_argument("--seed", type=int, default=1)
+
+    ratelimit = subparsers.add_parser("ratelimit", help=bench_ratelimit.__doc__)
+    ratelimit.add_argument("--duration", type=float, default=20, help="Saniye")
+    ratelimit.add_argument("--pollers", type=int, default=8, help="Patlamalı sorgu thread sayısı")
+    ratelimit.add_argument("--latency", type=float, default=2, help="LCU gecikmesi (ms)")
+    ratelimit.add_argument("--max-critical-wait-ms", type=float, default=0)
+    ratelimit.add_argument("--no-limit", action="store_true", help="Karşılaştırma için sınırlayıcıyı kapat")
+    ratelimit.add_argument("--seed", type=int, default=1)
+
+    autoqueue = subparsers.add_parser("autoqueue", help=bench_autoqueue.__doc__)
+    autoqueue.add_argument("--duration", type=float, default=90, help="Saniye")
+    autoqueue.add_argument("--queue-time", default="5-10")
+    autoqueue.add_argument("--champ-select", default="5")
+    autoqueue.add_argument("--game", default="10")
+    autoqueue.add_argument("--lobby-ready", type=float, default=3,
+                           help="Oyun sonrası lobby'nin aranabilir olma süresi (sn)")
+    autoqueue.add_argument("--search-reject-rate", type=float, default=0.2)
+    autoqueue.add_argument("--min-delay", type=float, default=0)
+    autoqueue.add_argument("--countdown", type=float, default=60,
+                           help="Karşılaştırılan sabit geri sayım (sn)")
+    autoqueue.add_argument("--max-dead-time", type=float, default=5,
+                           help="Lobby hazır olduktan sonra izin verilen en fazla gecikme (sn)")
+    autoqueue.add_argument("--latency", type=float, default=2, help="LCU gecikmesi (ms)")
+    autoqueue.add_argument("--jitter", type=float, default=3, help="LCU jitter (ms)")
+    autoqueue.add_argument("--seed", type=int, default=1)
+
+    hooks = subparsers.add_parser("hooks", help=bench_hooks.__doc__)
+    hooks.add_argument("--duration", type=float, default=30, help="Mod başına saniye")
+    hooks.add_argument("--queue-time", type=float, default=1)
+    hooks.add_argument("--hook-timeout", type=float, default=1)
+    hooks.add_argument("--hook-queue", type=int, default=4)
+    hooks.add_argument("--flood", type=int, default=8, help="accepted olayına eklenen yavaş hook sayısı")
+    hooks.add_argument("--max-slowdown-ms", type=float, default=5)
+    hooks.add_argument("--seed", type=int, default=1)
+
+    postgame = subparsers.add_parser("postgame", help=bench_postgame.__doc__)
+    postgame.add_argument("--duration", type=float, default=90, help="Saniye")
+    postgame.add_argument("--queue-time", default="5-10")
+    postgame.add_argument("--champ-select", default="5")
+    postgame.add_argument("--game", default="10")
+    postgame.add_argument("--lobby-ready", type=float, default=0)
+    postgame.add_argument("--post-game", type=float, default=60,
+                          help="Kullanıcının oyun sonu ekranlarında geçirdiği süre (sn, inf = gözetimsiz)")
+    postgame.add_argument("--max-post-game", type=float, default=5,
+                          help="Oyun bitişi -> lobby için izin verilen en fazla süre (sn)")
+    postgame.add_argument("--no-skip", action="store_true", help="Karşılaştırma için ekranları geçme")
+    postgame.add_argument("--latency", type=float, default=2, help="LCU gecikmesi (ms)")
+    postgame.add_argument("--jitter", type=float, default=3, help="LCU jitter (ms)")
+    postgame.add_argument("--seed", type=int, default=1)
+
+    lobby = subparsers.add_parser("lobby", help=bench_lobby.__doc__)
+    lobby.add_argument("--rounds", type=int, default=20)
+    lobby.add_argument("--queue-id", type=int, default=420)
+    lobby.add_argument("--invalid-queue-id", type=int, default=900, help="Kapalı kuyruk - istek gönderilmemeli")
+    lobby.add_argument("--version", default="14.20.628.3781")
+    lobby.add_argument("--new-version", default="14.21.631.2155")
+    lobby.add_argument("--latency", type=float, default=2, help="LCU gecikmesi (ms)")
+    lobby.add_argument("--seed", type=int, default=1)
+
+    champselect = subparsers.add_parser("champselect", help=bench_champselect.__doc__)
+    champselect.add_argument("--duration", type=float, default=60, help="Saniye")
+    champselect.add_argument("--queue-time", default="3-5")
+    champselect.add_argument("--game", default="5")
+    champselect.add_argument("--turn", type=float, default=1.0, help="Diğer oyuncuların aksiyon süresi (sn)")
+    champselect.add_argument("--planning", type=float, default=2.0)
+    champselect.add_argument("--timeout", type=float, default=30.0, help="Kendi sıramızın süresi (sn)")
+    champselect.add_argument("--owned-rate", type=float, default=0.7)
+    champselect.add_argument("--picks", default="Ahri,Lux,Syndra,Orianna,Annie")
+    champselect.add_argument("--bans", default="Yasuo,Zed,Yone,Master Yi")
+    champselect.add_argument("--max-turn-ms", type=float, default=400,
+                             help="Sıra başından ban / kilide izin verilen en fazla süre (ms)")
+    champselect.add_argument("--latency", type=float, default=2, help="LCU gecikmesi (ms)")
+    champselect.add_argument("--jitter", type=float, default=3, help="LCU jitter (ms)")
+    champselect.add_argument("--seed", type=int, default=1)
+
+    discovery = subparsers.add_parser("discovery", help=bench_discovery.__doc__)
+    discovery.add_argument("--idle", type=float, default=30, help="Client kapalı geçen süre (sn)")
+    discovery.add_argument("--timeout", type=float, default=10, help="Bağlantı için en fazla bekleme (sn)")
+    discovery.add_argument("--max-connect-ms", type=float, default=100)
+    discovery.add_argument("--seed", type=int, default=1)
+
+    reconnect = subparsers.add_parser("reconnect", help=bench_reconnect.__doc__)
+    reconnect.add_argument("--modes", default="watch,poll")
+    reconnect.add_argument("--scenarios", default="restart,hang,resume")
+    reconnect.add_argument("--settle", type=float, default=1.0, help="Bağlandıktan sonra bekleme (sn)")
+    reconnect.add_argument("--gap", type=float, default=2.0, help="restart: eski kapanış -> yeni açılış (sn)")
+    reconnect.add_argument("--sleep-seconds", type=float, default=600, help="resume: duvar saati sıçraması (sn)")
+    reconnect.add_argument("--timeout", type=float, default=15)
+    reconnect.add_argument("--max-reconnect-ms", type=float, default=1000)
+    reconnect.add_argument("--seed", type=int, default=1)
+
+    shutdown = subparsers.add_parser("shutdown", help=bench_shutdown.__doc__)
+    shutdown.add_argument("--rounds", type=int, default=5)
+    shutdown.add_argument("--settle", type=float, default=1.0, help="Bağlandıktan sonra bekleme (sn)")
+    shutdown.add_argument("--latency", type=float, default=4000, help="Kapanıştan önce LCU yanıt gecikmesi (ms)")
+    shutdown.add_argument("--in-flight", type=float, default=0.2, help="İstek uçuştayken bekleme (sn)")
+    shutdown.add_argument("--kills", type=int, default=20)
+    shutdown.add_argument("--max-shutdown-ms", type=float, default=200)
+    shutdown.add_argument("--seed", type=int, default=1)
+
+    metrics = subparsers.add_parser("metrics", help=bench_metrics.__doc__)
+    metrics.add_argument("--duration", type=float, default=30)
+    metrics.add_argument("--queue-time", default="1")
+    metrics.add_argument("--interval", type=float, default=0.25, help="Gönderim aralığı (sn)")
+    metrics.add_argument("--buffer", type=int, default=8, help="Bekleyen en fazla parti")
+    metrics.add_argument("--outage", type=float, default=4, help="Collector'ın kapalı kaldığı ilk süre (sn)")
+    metrics.add_argument("--max-slowdown-ms", type=float, default=0.5)
+    metrics.add_argument("--seed", type=int, default=1)
+
+    queuestatus = subparsers.add_parser("queuestatus", help=bench_queuestatus.__doc__)
+    queuestatus.add_argument("--duration", type=float, default=240, help="Simüle akşam süresi (sn)")
+    queuestatus.add_argument("--queue-time", default="10-30")
+    queuestatus.add_argument("--champ-select", default="5")
+    queuestatus.add_argument("--game", default="30")
+    queuestatus.add_argument("--lobby-time", type=float, default=2)
+    queuestatus.add_argument("--seed", type=int, default=1)
+
+    settings = subparsers.add_parser("settings", help=bench_settings.__doc__)
+    settings.add_argument("--sketches", type=int, default=40, help="Kalıcı ölçüm sayısı")
+    settings.add_argument("--samples", type=int, default=20000, help="Ölçüm başına örnek")
+    settings.add_argument("--loads", type=int, default=20)
+    settings.add_argument("--gets", type=int, default=200000)
+    settings.add_argument("--sets", type=int, default=20000)
+    settings.add_argument("--legacy-sets", type=int, default=100)
+    settings.add_argument("--seed", type=int, default=1)
+
+    check = subparsers.add_parser("check", help=bench_check.__doc__)
+    check.add_argument("--only", help=f"Virgülle ayrılmış alt küme ({','.join(CHECKS)})")
+    return parser
+
+def main(argv=None):
+    """Benchmark'ı çalıştır ve sonucu kaydet"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    # Uygulama logger'ları kendi seviyelerini INFO yapar, filtre handler'da
+    logging.basicConfig()
+    logging.getLogger().handlers[0].setLevel(logging.INFO if args.verbose else logging.WARNING)
+
+    options = {key: value for key, value in vars(args).items()
+               if key not in ("output", "baseline", "verbose", "benchmark", "trace")}
+    result = {
+        "benchmark": args.benchmark,
+        "version": berightback.__version__,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "options": options,
+        "results": BENCHMARKS[args.benchmark](args)
+    }
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"{args.benchmark}-{result['version']}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2, ensure_ascii=False, default=str), encoding='utf-8')
+    print(json.dumps(result["results"], indent=2, ensure_ascii=False))
+    print(f"\nSonuç kaydedildi: {output}")
+
+    if args.baseline:
+        compare(result, args.baseline)
+
+    if result["results"].get("failures"):
+        print("\nBAŞARISIZ:\n  " + "\n  ".join(result["results"]["failures"]))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -6,22 +6,50 @@ Enhanced Version with Console, Language Support & Persistent Settings
 """
 
 import os
+import io
+import ssl
+import csv
 import sys
+import gzip
+import copy
 import json
+import math
+import gc
 import time
+import bisect
+import shlex
+import signal
+import ctypes
+import select
+import socket
+import struct
+import weakref
 import logging
+import functools
+import argparse
+import subprocess
 import threading
+import cProfile
+import pstats
+import tracemalloc
+import faulthandler
 from datetime import datetime
+from contextlib import contextmanager
 from typing import Tuple, Optional, Dict, Any
 from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import urlsplit
 import queue
+import tkinter as tk
+from collections import deque
+
+__version__ = "3.0.0"
 
 try:
     import customtkinter as ctk
     from PIL import Image, ImageTk
 except ImportError:
     print("Gerekli modüller yükleniyor...")
-    import subprocess
     subprocess.check_call([sys.executable, "-m", "pip", "install", "customtkinter", "pillow"])
     import customtkinter as ctk
     from PIL import Image, ImageTk
@@ -30,6 +58,12 @@ import requests
 import psutil
 import urllib3
 from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+
+try:
+    import numpy as np  # Opsiyonel: sadece geçmiş analitiği için
+except ImportError:
+    np = None
 
 # SSL uyarılarını devre dışı bırak
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -38,105 +72,592 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+def atomic_write_json(path, data, sync=False, **options):
+    """Geçici dosyaya yaz ve yer değiştir - yarıda kesilen yazma hedef dosyayı bozamaz"""
+    path = Path(path)
+    temp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")   # Aynı dosyayı yazan süreçler çakışmasın
+    try:
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, **options)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_file, path)
+    except BaseException:
+        try:
+            temp_file.unlink()
+        except OSError:
+            pass
+        raise
+
+class Setting:
+    """Şemadaki tek ayar - tam anahtar, izin verilen tipler, varsayılan ve isteğe bağlı kontrol"""
+
+    __slots__ = ("key", "path", "prefixes", "types", "default", "check")
+
+    def __init__(self, key, types, default, check=None):
+        self.key = key
+        self.path = tuple(key.split('.'))
+        self.prefixes = tuple('.'.join(self.path[:depth]) for depth in range(len(self.path)))  # '' dahil
+        self.types = types if isinstance(types, tuple) else (types,)
+        self.default = default
+        self.check = check
+
+    def valid(self, value) -> bool:
+        """Tip (bool int sayılmaz) ve değer kontrolü"""
+        if isinstance(value, bool) and bool not in self.types:
+            return False
+        return isinstance(value, self.types) and (self.check is None or self.check(value))
+
+    def fresh_default(self):
+        """Varsayılanın kopyası - liste / sözlük varsayılanlar paylaşılmasın"""
+        return copy.deepcopy(self.default)
+
+_NUMBER = (int, float)
+
+def _positive(value):
+    return value > 0
+
+def _non_negative(value):
+    return value >= 0
+
+def _section_paths(schema) -> Dict:
+    """Bölüm ön eki -> [(bölüm içindeki yol, tam anahtar)]; '' tüm ağaç"""
+    sections = {}
+    for setting in schema.values():
+        for depth, prefix in enumerate(setting.prefixes):
+            sections.setdefault(prefix, []).append((setting.path[depth:], setting.key))
+    return sections
+
+def _migrate_v1(data):
+    """Sürümsüz (≤ 3.0) dosyalar: elle yazılmış tek komut / virgüllü şampiyon listesi -> liste"""
+    commands = data.get("hooks", {}).get("commands")
+    if isinstance(commands, dict):
+        for event, command in commands.items():
+            if isinstance(command, str):
+                commands[event] = [command]
+    champ_select = data.get("champ_select")
+    if isinstance(champ_select, dict):
+        for key in ("picks", "bans"):
+            if isinstance(champ_select.get(key), str):
+                champ_select[key] = [name.strip() for name in champ_select[key].split(',') if name.strip()]
+
 class ConfigManager:
-    """Ayarları yönetir"""
-    
-    def __init__(self):
-        self.config_dir = Path.home() / "Documents" / "BeRightBack"
+    """Ayarları yönetir
+
+    Değerler şemadaki tam anahtarla (ör. 'stats.matches_found') düz bir sözlükte tutulur:
+    yaprak okuma tek sözlük araması, bölüm okuma ('stats') önbellekteki salt okunur görünüm -
+    görünüm yalnızca bölümdeki bir ayar değişince yeniden kurulur. Dosya yüklenirken sürüm geçişleri uygulanır, her değer tipine /
+    aralığına göre doğrulanır, geçersiz olanlar varsayılana döner. Değişen anahtarlar
+    watch() ile kaydolan dinleyicilere bildirilir; kayıtlar SAVE_DELAY içinde birleşir.
+    """
+
+    VERSION = 1
+    MIGRATIONS = {0: _migrate_v1}   # kaynak sürüm -> bir sonraki sürüme yükselten fonksiyon
+    SAVE_DELAY = 1.0
+
+    SCHEMA = {setting.key: setting for setting in (
+        Setting("language", str, "tr", lambda value: value in ("tr", "en")),
+        Setting("console_visible", bool, False),
+        Setting("stats.matches_found", int, 0, _non_negative),
+        Setting("stats.matches_accepted", int, 0, _non_negative),
+        Setting("stats.queue_sessions", int, 0, _non_negative),
+        Setting("window.width", int, 1000, _positive),
+        Setting("window.height", int, 700, _positive),
+        Setting("sketches", dict, {}),
+        Setting("performance.cpu_budget", _NUMBER, 5.0, _positive),
+        Setting("performance.auto_throttle", bool, True),
+        Setting("performance.sample_interval", _NUMBER, 5, _positive),
+        Setting("performance.history_size", int, 60, _positive),
+        Setting("performance.log_interval", _NUMBER, 300, _positive),
+        Setting("auto_queue.enabled", bool, False),
+        Setting("auto_queue.min_delay", _NUMBER, 0, _non_negative),
+        Setting("auto_queue.max_retries", int, 3, _non_negative),
+        Setting("auto_queue.baseline_seconds", _NUMBER, 300, _non_negative),
+        Setting("end_of_game.skip", bool, False),
+        Setting("lobby.queue_id", (int, type(None)), 420),
+        Setting("queue_status.enabled", bool, True),
+        Setting("client.install_dirs", list, []),
+        Setting("client.watch", bool, True),
+        Setting("champ_select.enabled", bool, False),
+        Setting("champ_select.picks", list, []),
+        Setting("champ_select.bans", list, []),
+        Setting("champ_select.hover", bool, True),
+        Setting("hooks.workers", int, 2, _positive),
+        Setting("hooks.queue", int, 16, _positive),
+        Setting("hooks.timeout", _NUMBER, 10, _positive),
+        Setting("hooks.commands.match_found", list, []),
+        Setting("hooks.commands.accepted", list, []),
+        Setting("hooks.commands.champ_select", list, []),
+        Setting("hooks.commands.game_start", list, []),
+        Setting("export.format", str, "csv", lambda value: value in StatsExporter.FORMATS),
+        Setting("export.directory", str, ""),
+        Setting("export.interval_minutes", _NUMBER, 0, _non_negative),
+        Setting("export.cursors", dict, {}),     # ≤ 3.0 imleçleri - yalnızca okunur, yeni imleç çıktı klasöründe
+        Setting("metrics.endpoint", str, ""),
+        Setting("metrics.interval", _NUMBER, 60, _positive),
+        Setting("metrics.buffer", int, 120, _positive),
+        Setting("metrics.machine", str, ""),
+    )}
+    SECTIONS = _section_paths(SCHEMA)
+
+    def __init__(self, config_dir=None):
+        self.config_dir = Path(config_dir) if config_dir else Path.home() / "Documents" / "BeRightBack"
         self.config_file = self.config_dir / "config.json"
+        self.lock = threading.RLock()   # Motor / GUI / hook thread'leri aynı anda yazabilir
+        self.closed = False
+        self.values = {}                # tam anahtar -> değer
+        self.extra = {}                 # şemada olmayan anahtarlar (yeni sürümden / elle eklenmiş) korunur
+        self.watchers = ()              # Bildirimde kilitsiz okunur, değişimde kopyalanır
+        self.writes = 0
+        self._dynamic = {}              # 'export.cursors.csv' -> ('export.cursors', '.', 'csv'), ilk çağrıda çözülür
+        self._views = {}                # bölüm -> salt okunur görünüm, bölümde set() olunca silinir
+        self._dirty = False
+        self._write_lock = threading.Lock()
+        self._pending = threading.Event()
+        self._closing = threading.Event()
+        self._saver = None
         self.ensure_config_dir()
-        self.config = self.load_config()
+        self.load_config()
     
     def ensure_config_dir(self):
         """Config klasörünü oluştur"""
         self.config_dir.mkdir(parents=True, exist_ok=True)
     
-    def load_config(self) -> dict:
-        """Config dosyasını yükle"""
-        default_config = {
-            "language": "tr",
-            "console_visible": False,
-            "stats": {
-                "matches_found": 0,
-                "matches_accepted": 0,
-                "queue_sessions": 0
-            },
-            "window": {
-                "width": 1000,
-                "height": 700
-            }
-        }
-        
+    def load_config(self):
+        """Config dosyasını yükle: sürüm geçişleri, doğrulama, eksiklere varsayılan"""
+        data = {}
         try:
             if self.config_file.exists():
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    # Merge with defaults
-                    for key, value in default_config.items():
-                        if key not in loaded_config:
-                            loaded_config[key] = value
-                        elif isinstance(value, dict):
-                            for subkey, subvalue in value.items():
-                                if subkey not in loaded_config[key]:
-                                    loaded_config[key][subkey] = subvalue
-                    return loaded_config
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    raise ValueError("Kök bir JSON nesnesi değil")
         except Exception as e:
             print(f"Config load error: {e}")
-        
-        return default_config
+            data = {}
+
+        version = data.pop("version", 0 if data else self.VERSION)
+        migrated = isinstance(version, int) and version < self.VERSION
+        while isinstance(version, int) and version < self.VERSION:
+            self.MIGRATIONS[version](data)
+            version += 1
+
+        invalid = []
+        missing = object()
+        for key, setting in self.SCHEMA.items():
+            node = data
+            for part in setting.path:
+                node = node.get(part, missing) if isinstance(node, dict) else missing
+            if node is missing:
+                self.values[key] = setting.fresh_default()
+            elif setting.valid(node):
+                self.values[key] = node
+            else:
+                invalid.append(key)
+                self.values[key] = setting.fresh_default()
+        self.extra = self._unknown(data, "")
+        if invalid:
+            print(f"Config: geçersiz değerler varsayılana döndü: {', '.join(invalid)}")
+        if migrated or invalid:
+            self._dirty = True
+            self.save_config()
+
+    def _unknown(self, data, prefix):
+        """Şemanın tanımadığı anahtarları iç içe yapısıyla topla"""
+        extra = {}
+        for name, value in data.items():
+            key = f"{prefix}.{name}" if prefix else name
+            if key in self.SCHEMA:
+                continue
+            if key in self.SECTIONS and isinstance(value, dict):
+                nested = self._unknown(value, key)
+                if nested:
+                    extra[name] = nested
+            elif key not in self.SECTIONS:
+                extra[name] = value
+        return extra
+
+    def _section(self, prefix) -> dict:
+        """Bölümü iç içe sözlük olarak kur (yapraklar paylaşılır, sözlükler yenidir)"""
+        values = self.values
+        result = {}
+        for path, key in self.SECTIONS[prefix]:
+            node = result
+            for part in path[:-1]:
+                node = node.setdefault(part, {})
+            node[path[-1]] = values[key]
+        return result
+
+    def _view(self, prefix):
+        """Bölümün salt okunur görünümü (alt bölümler de görünüm) - önbellekte yoksa kur"""
+        with self.lock:
+            view = self._views.get(prefix)
+            if view is None:
+                children = {}
+                for path, key in self.SECTIONS[prefix]:
+                    if path[0] not in children:
+                        children[path[0]] = (self.values[key] if len(path) == 1
+                                             else self._view(f"{prefix}.{path[0]}" if prefix else path[0]))
+                view = self._views[prefix] = MappingProxyType(children)
+            return view
+
+    def snapshot(self) -> dict:
+        """Diske yazılacak tam ağaç: şema değerleri + korunan bilinmeyen anahtarlar + sürüm"""
+        with self.lock:
+            data = self._section("")
+            stack = [(data, self.extra)]
+            while stack:
+                target, extra = stack.pop()
+                for name, value in extra.items():
+                    if isinstance(value, dict) and isinstance(target.get(name), dict):
+                        stack.append((target[name], value))
+                    else:
+                        target[name] = value
+            data["version"] = self.VERSION
+            return data
+
+    def watch(self, callback):
+        """callback(changed): set() ile değişen tam anahtarlar (frozenset), yazan thread'de çağrılır"""
+        with self.lock:
+            self.watchers = self.watchers + (callback,)
+
+    def unwatch(self, callback):
+        """Dinleyiciyi kaldır"""
+        with self.lock:
+            self.watchers = tuple(watcher for watcher in self.watchers if watcher != callback)
     
     def save_config(self):
-        """Config dosyasını kaydet"""
+        """Kaydı planla - SAVE_DELAY içindeki değişiklikler tek yazmada birleşir (kapatıldıysa yalnızca bellekte kalır)"""
+        with self.lock:
+            if self.closed:
+                return
+            if self._saver is None:
+                self._saver = threading.Thread(target=self._save_worker, daemon=True, name="config-save")
+                self._saver.start()
+        self._pending.set()
+
+    def _save_worker(self):
+        """Bekleyen değişiklikleri SAVE_DELAY aralıklarla diske aktar"""
+        while self._pending.wait() and not self._closing.wait(self.SAVE_DELAY):
+            self._pending.clear()
+            self.flush()
+
+    def flush(self):
+        """Bekleyen değişiklikleri hemen yaz"""
+        with self._write_lock:
+            with self.lock:
+                if self.closed or not self._dirty:
+                    return
+                self._dirty = False
+                data = self.snapshot()
+            if not self._write(data):
+                with self.lock:
+                    self._dirty = True
+    
+    def _write(self, data, sync=False) -> bool:
+        """Atomik yaz - yarıda kesilen yazma config.json'u bozamaz"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            atomic_write_json(self.config_file, data, sync=sync, indent=2)
+            self.writes += 1
+            return True
         except Exception as e:
             print(f"Config save error: {e}")
+            return False
+    
+    def close(self):
+        """Bekleyen değişiklikleri bir kez diske yaz; sonraki set() çağrıları dosyaya dokunmaz
+
+        Değişiklik yoksa dosyaya dokunulmaz - ayarı değiştirmeyen bir süreç (ör. zamanlanmış
+        dışa aktarma) çalışan GUI'nin yazdıklarını eski kopyasıyla ezmesin.
+        """
+        with self._write_lock:
+            with self.lock:
+                if self.closed:
+                    return
+                self.closed = True
+                data = self.snapshot() if self._dirty else None
+            self._closing.set()
+            self._pending.set()
+            if data is not None:
+                self._write(data, sync=True)
     
     def get(self, key, default=None):
-        """Config değeri al"""
-        keys = key.split('.')
-        value = self.config
-        for k in keys:
-            value = value.get(k, default)
-            if value is None:
-                return default
-        return value
+        """Config değeri al - yaprak için tek sözlük araması, bölüm için önbellekteki görünüm"""
+        value = self.values.get(key, self._dynamic)    # _dynamic hiçbir ayarın değeri olamaz: "yok" işareti
+        if value is self._dynamic:
+            view = self._views.get(key)
+            if view is not None:
+                return view
+            if key in self.SECTIONS:
+                return self._view(key)
+            route = self._dynamic.get(key)
+            if route is None:
+                route = self._dynamic[key] = key.rpartition('.')
+            value = self.values.get(route[0])
+            value = value.get(route[2]) if isinstance(value, dict) else None
+        return default if value is None else value
     
-    def set(self, key, value):
-        """Config değeri ayarla"""
-        keys = key.split('.')
-        config = self.config
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-        config[keys[-1]] = value
-        self.save_config()
+    def set(self, key, value, save=True):
+        """Config değeri ayarla (save=False: bir sonraki kayda / kapanışa bırak)
+
+        Tek ayar için yaprak anahtarı kullanın ('stats.matches_found'); bölüm anahtarı ('stats')
+        verilen yaprakları günceller. Sözlük tipli yaprağın altındaki
+        dinamik anahtar ('export.cursors.csv') sözlüğü kopyalayıp değiştirir. Bilinmeyen
+        anahtar ya da geçersiz değer ValueError verir; değişmeyen değer kayıt / bildirim üretmez.
+        """
+        with self.lock:
+            if key in self.SCHEMA:
+                updates = {key: value}
+            elif key in self.SECTIONS:
+                if not isinstance(value, (dict, MappingProxyType)):
+                    raise ValueError(f"Ayar bölümü sözlük olmalı: {key}")
+                updates = {}
+                self._flatten(key, value, updates)
+            else:
+                parent, _, name = key.rpartition('.')
+                if parent not in self.SCHEMA or not isinstance(self.values[parent], dict):
+                    raise ValueError(f"Bilinmeyen ayar: {key}")
+                updates = {parent: {**self.values[parent], name: value}}
+            changed = self._apply(updates)
+        self._changed(changed, save)
+
+    def increment(self, key, step=1):
+        """Sayaç ayarını kilit altında artır - thread'ler arası oku-değiştir-yaz yarışı olmaz"""
+        with self.lock:
+            value = self.values[key] + step
+            changed = self._apply({key: value})
+        self._changed(changed, True)
+        return value
+
+    def _apply(self, updates) -> frozenset:
+        """Doğrula, değişenleri yaz, etkilenen bölüm görünümlerini düşür (kilit altında)"""
+        for name, new in updates.items():
+            if not self.SCHEMA[name].valid(new):
+                raise ValueError(f"Geçersiz ayar değeri: {name}={new!r}")
+        changed = frozenset(
+            name for name, new in updates.items()
+            if not (type(new) is type(self.values[name]) and new == self.values[name]
+                    and (new is not self.values[name] or not isinstance(new, (list, dict))))
+        )
+        for name in changed:
+            self.values[name] = updates[name]
+            for prefix in self.SCHEMA[name].prefixes:
+                self._views.pop(prefix, None)
+        if changed:
+            self._dirty = True
+        return changed
+
+    def _changed(self, changed, save):
+        """Kaydı planla ve dinleyicileri bilgilendir (kilit dışında)"""
+        if not changed:
+            return
+        if save:
+            self.save_config()
+        for callback in self.watchers:
+            try:
+                callback(changed)
+            except Exception:
+                logging.getLogger('BeRightBack').exception("Ayar dinleyicisi hata verdi")
+
+    def _flatten(self, prefix, value, updates):
+        """Bölüm sözlüğünü tam anahtarlı yapraklara aç"""
+        for name, child in value.items():
+            key = f"{prefix}.{name}"
+            if key in self.SCHEMA:
+                updates[key] = child
+            elif key in self.SECTIONS and isinstance(child, (dict, MappingProxyType)):
+                self._flatten(key, child, updates)
+            else:
+                raise ValueError(f"Bilinmeyen ayar: {key}")
+
+class Event:
+    """Bus olayı - tür, birleştirme anahtarı, veri ve yayın zamanı"""
+
+    __slots__ = ("kind", "key", "data", "time")
+
+    def __init__(self, kind, key, data, published):
+        self.kind = kind
+        self.key = key
+        self.data = data
+        self.time = published
+
+    def __repr__(self):
+        return f"Event({self.kind!r}, {self.data!r})"
+
+class Subscription:
+    """Bir abonenin sınırlı kuyruğu ve backpressure sayaçları
+
+    Birleşen (durum) olaylar kuyrukta tek yer tutar: teslim edilmeden yenisi gelirse veri
+    yerinde değişir. Kuyruk doluysa en eski olay atılır - yayıncı hiçbir zaman beklemez.
+    """
+
+    def __init__(self, bus, callback, kinds, maxsize, notify):
+        self.bus = bus
+        self.callback = callback
+        self.kinds = frozenset(kinds) if kinds else None
+        self.maxsize = maxsize
+        self.notify = notify        # notify(subscription): kuyruk boşken olay gelince (ör. Tk after ile drain)
+        self.queue = deque()        # Event ya da birleşen olay için (kind, key)
+        self.latest = {}            # (kind, key) -> kuyruktaki en güncel Event
+        self.lock = threading.Lock()
+        self.published = 0
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.errors = 0
+        self.high_watermark = 0
+        self.max_wait = 0.0
+
+    def offer(self, event, coalesce):
+        """Olayı kuyruğa koy (yayıncı thread'inden) - kuyruk boşsa True döner"""
+        with self.lock:
+            self.published += 1
+            was_empty = not self.queue
+            if coalesce:
+                slot = (event.kind, event.key)
+                if slot in self.latest:
+                    self.latest[slot] = event
+                    self.coalesced += 1
+                    return False
+                self.latest[slot] = event
+                entry = slot
+            else:
+                entry = event
+            if len(self.queue) >= self.maxsize:
+                oldest = self.queue.popleft()
+                if isinstance(oldest, tuple):
+                    del self.latest[oldest]
+                self.dropped += 1
+            self.queue.append(entry)
+            if len(self.queue) > self.high_watermark:
+                self.high_watermark = len(self.queue)
+            return was_empty
+
+    def drain(self, limit=None):
+        """Bekleyen olayları abonenin thread'inde teslim et, teslim edilen sayıyı döndür"""
+        count = 0
+        now = time.monotonic()
+        while limit is None or count < limit:
+            with self.lock:
+                if not self.queue:
+                    break
+                entry = self.queue.popleft()
+                event = self.latest.pop(entry) if isinstance(entry, tuple) else entry
+            wait = now - event.time
+            if wait > self.max_wait:
+                self.max_wait = wait
+            try:
+                self.callback(event)
+            except Exception as e:
+                self.errors += 1
+                self.bus.logger.error(f"❌ Olay abonesi hatası ({event.kind}): {e}")
+            count += 1
+        self.delivered += count
+        if limit is not None and count == limit and self.queue and self.notify:
+            # Sınırdan kalanlar bir sonraki turda - abone thread'i tek seferde kilitlenmesin
+            self.notify(self)
+        return count
+
+    def pending(self) -> int:
+        return len(self.queue)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "published": self.published,
+            "delivered": self.delivered,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "pending": len(self.queue),
+            "high_watermark": self.high_watermark,
+            "max_wait_ms": round(self.max_wait * 1000, 2)
+        }
+
+class EventBus:
+    """Motor / timer / log -> GUI yayın-abone kanalı
+
+    publish() yalnızca abone kuyruklarına ekler; teslimat abonenin kendi thread'inde
+    drain() ile yapılır. Böylece yavaş bir abone (ör. yoğun Tk) motor thread'ini bekletmez.
+    """
+
+    # Olay türü -> (alanlar, birleşir mi). Birleşen olaylarda yalnızca son durum önemlidir.
+    EVENTS = {
+        "state_changed": ({"connected", "in_game"}, True),
+        "phase_changed": ({"phase", "previous"}, True),
+        "ready_check": ({"ready_check_id"}, False),
+        "accepted": ({"ready_check_id"}, False),
+        "queue_started": (set(), False),
+        "settings_changed": ({"section"}, True),
+        "history_changed": (set(), True),
+        "resources_sampled": (set(), True),
+        "timer_tick": ({"remaining", "total"}, True),
+        "queue_status": ({"time_in_queue", "estimated", "queue_id"}, True),
+        "timer_complete": ({"success", "message", "level"}, False),
+        "log_record": ({"message", "level"}, False),
+    }
+
+    def __init__(self):
+        self.subscriptions = ()     # Yayın sırasında kilitsiz okunur, değişimde kopyalanır
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger('BeRightBack')
+
+    def subscribe(self, callback, kinds=None, maxsize=256, notify=None) -> Subscription:
+        """callback(event) - kinds verilmezse tüm olaylar"""
+        unknown = set(kinds or ()) - self.EVENTS.keys()
+        if unknown:
+            raise ValueError(f"Bilinmeyen olay türü: {', '.join(sorted(unknown))}")
+        subscription = Subscription(self, callback, kinds, maxsize, notify)
+        with self.lock:
+            self.subscriptions += (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            self.subscriptions = tuple(s for s in self.subscriptions if s is not subscription)
+
+    def publish(self, kind, key=None, **data):
+        """Olayı yayınla - alanlar EVENTS ile eşleşmeli; hiçbir zaman bloklamaz"""
+        fields, coalesce = self.EVENTS[kind]
+        if data.keys() != fields:
+            raise TypeError(f"{kind} alanları {sorted(fields)} olmalı, gelen: {sorted(data)}")
+        event = Event(kind, key, data, time.monotonic())
+        for subscription in self.subscriptions:
+            if subscription.kinds is not None and kind not in subscription.kinds:
+                continue
+            if subscription.offer(event, coalesce) and subscription.notify:
+                subscription.notify(subscription)
+        return event
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Abone başına backpressure sayaçları"""
+        return {getattr(s.callback, "__name__", repr(s.callback)): s.stats() for s in self.subscriptions}
 
 class ConsoleHandler(logging.Handler):
-    """GUI konsolu için log handler"""
-    
-    def __init__(self, console_callback):
+    """GUI konsolu için log handler - kayıtlar bus üzerinden Tk thread'ine gider"""
+
+    def __init__(self, bus):
         super().__init__()
-        self.console_callback = console_callback
-    
+        self.bus = bus
+
     def emit(self, record):
-        log_entry = self.format(record)
-        if self.console_callback:
-            self.console_callback(log_entry)
+        try:
+            self.bus.publish("log_record", message=self.format(record), level=record.levelname)
+        except Exception:
+            self.handleError(record)
 
 class MatchmakingTimer:
     """LoL tarzı matchmaking timer sistemi"""
     
-    def __init__(self, gui_callback=None):
-        self.gui_callback = gui_callback
+    def __init__(self, bus=None):
+        self.bus = bus  # Saniyelik timer_tick olayları (GUI kendi thread'inde çizer)
         self.timer_running = False
         self.timer_paused = False
         self.timer_thread = None
         self.remaining_time = 0
         self.total_time = 0
         self.on_timer_complete = None
+        self._stop_event = threading.Event()    # Durdurulunca saniyelik bekleme hemen biter
         
         # Logger
         self.logger = logging.getLogger('Timer')
@@ -152,10 +673,12 @@ class MatchmakingTimer:
         self.on_timer_complete = callback
         self.timer_running = True
         self.timer_paused = False
+        # Her çalıştırmanın kendi olayı - durdurulup hemen yeniden başlatılan timer eski thread'i canlandırmaz
+        self._stop_event = threading.Event()
         
         self.logger.info(f"🕒 Timer başlatıldı: {minutes}:{seconds:02d}")
         
-        self.timer_thread = threading.Thread(target=self._timer_worker, daemon=True)
+        self.timer_thread = threading.Thread(target=self._timer_worker, args=(self._stop_event,), daemon=True)
         self.timer_thread.start()
         return True
     
@@ -166,6 +689,7 @@ class MatchmakingTimer:
         self.timer_running = False
         self.timer_paused = False
         self.remaining_time = 0
+        self._stop_event.set()
     
     def pause_timer(self):
         """Timer duraklat"""
@@ -177,12 +701,15 @@ class MatchmakingTimer:
         self.timer_paused = False
         self.logger.info("▶️ Timer devam ettiriliyor")
     
-    def _timer_worker(self):
+    def _timer_worker(self, stop_event):
         """Timer worker thread"""
         while self.timer_running and self.remaining_time > 0:
-            time.sleep(1)
+            if stop_event.wait(1):
+                return
             if self.timer_running and not self.timer_paused:
                 self.remaining_time -= 1
+                if self.bus:
+                    self.bus.publish("timer_tick", remaining=self.remaining_time, total=self.total_time)
         
         if self.timer_running and self.remaining_time <= 0:
             self.logger.info("⏰ Timer tamamlandı! Matchmaking başlatılıyor...")
@@ -206,23 +733,597 @@ class MatchmakingTimer:
             return 0
         return 1 - (self.remaining_time / self.total_time)
 
+class RateLimited(requests.RequestException):
+    """Bekleme süresi istek zaman aşımını aşacağı için istek gönderilmedi"""
+
+class RateLimiter:
+    """LCU'yu koruyan token bucket - durum sorguları ve kritik aksiyonlar için ayrı bütçe
+    
+    Kritik istekler kendi kovası boşsa sorgu kovasından borç alır (kova eksiye düşer,
+    sorgular borcu bekleyerek öder); sorgu bekleyenlerin arkasında sırada durmazlar.
+    """
+    
+    BUDGETS = {
+        "poll": (10.0, 10),      # (saniyede token, kova kapasitesi)
+        "critical": (5.0, 5),
+    }
+    BORROW_LIMIT = 10            # Sorgu kovasının en fazla eksiye düşebileceği token
+    # Ready check okuması kabul gecikmesini doğrudan belirler
+    CRITICAL_PATHS = {"/lol-matchmaking/v1/ready-check", "/lol-champ-select/v1/session"}
+    
+    def __init__(self, budgets=None, borrow_limit=None, clock=time.monotonic, sleep=time.sleep):
+        budgets = budgets or self.BUDGETS
+        self.rates = {kind: float(rate) for kind, (rate, _) in budgets.items()}
+        self.capacity = {kind: float(burst) for kind, (_, burst) in budgets.items()}
+        self.tokens = dict(self.capacity)
+        self.borrow_limit = self.BORROW_LIMIT if borrow_limit is None else borrow_limit
+        self.clock = clock
+        self.sleep = sleep
+        self.lock = threading.Lock()
+        self._updated = clock()
+        self.metrics = {
+            kind: {"allowed": 0, "throttled": 0, "borrowed": 0, "rejected": 0,
+                   "wait_ms_total": 0.0, "wait_ms_max": 0.0}
+            for kind in budgets
+        }
+    
+    def classify(self, method, path):
+        return "critical" if method != "GET" or path in self.CRITICAL_PATHS else "poll"
+    
+    def _refill(self):
+        now = self.clock()
+        elapsed = now - self._updated
+        self._updated = now
+        for kind, rate in self.rates.items():
+            self.tokens[kind] = min(self.capacity[kind], self.tokens[kind] + elapsed * rate)
+    
+    def _take(self, kind):
+        """Token al -> 0, alınamıyorsa gereken bekleme süresi (lock altında)"""
+        if self.tokens[kind] >= 1:
+            self.tokens[kind] -= 1
+            return 0.0
+        if kind == "critical" and self.tokens["poll"] - 1 >= -self.borrow_limit:
+            self.tokens["poll"] -= 1
+            self.metrics[kind]["borrowed"] += 1
+            return 0.0
+        return (1 - self.tokens[kind]) / self.rates[kind]
+    
+    def acquire(self, kind, timeout=None) -> float:
+        """Token gelene kadar bekle, beklenen süreyi döndür (saniye)"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill()
+                wait = self._take(kind)
+                metrics = self.metrics[kind]
+                if not wait:
+                    metrics["allowed"] += 1
+                    if waited:
+                        metrics["throttled"] += 1
+                        metrics["wait_ms_total"] += waited * 1000
+                        metrics["wait_ms_max"] = max(metrics["wait_ms_max"], waited * 1000)
+                    return waited
+                if timeout is not None and waited + wait > timeout:
+                    metrics["rejected"] += 1
+                    raise RateLimited(f"LCU hız sınırı: {kind} için {waited + wait:.1f}s beklenmeli")
+            # Lock dışında uyu - kritik istekler bu sırada token alabilir
+            self.sleep(wait)
+            waited += wait
+    
+    def stats(self) -> Dict:
+        with self.lock:
+            return {
+                kind: {**values, "wait_ms_total": round(values["wait_ms_total"], 1),
+                       "wait_ms_max": round(values["wait_ms_max"], 1)}
+                for kind, values in self.metrics.items()
+            }
+
+class ResponseCache:
+    """LCU GET yanıtları için kısa TTL'li önbellek
+    
+    Aynı endpoint'e eş zamanlı gelen istekler tek istekte birleşir (single-flight);
+    herhangi bir mutasyon (POST / PUT / PATCH / DELETE) tüm önbelleği geçersiz kılar.
+    """
+    
+    # Saniye - listede olmayan endpoint'ler önbelleğe alınmaz
+    TTLS = {
+        "/lol-summoner/v1/current-summoner": 10.0,
+        "/lol-gameflow/v1/gameflow-phase": 0.5,
+        "/lol-matchmaking/v1/ready-check": 0.25,
+        "/lol-lobby/v2/lobby": 1.0,
+    }
+    
+    class _Flight:
+        def __init__(self):
+            self.event = threading.Event()
+            self.response = None
+            self.error = None
+    
+    def __init__(self, ttls=None, clock=time.monotonic):
+        self.ttls = dict(self.TTLS if ttls is None else ttls)
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.entries = {}      # path -> (son geçerlilik, response)
+        self.inflight = {}     # path -> _Flight
+        self.generation = 0    # Her geçersiz kılmada artar
+        self.counters = {"hits": 0, "misses": 0, "coalesced": 0, "invalidations": 0}
+        self.by_path = {}
+    
+    def _count(self, path, kind):
+        self.counters[kind] += 1
+        counts = self.by_path.setdefault(path, {"hits": 0, "misses": 0, "coalesced": 0})
+        counts[kind] += 1
+    
+    def fetch(self, path, loader):
+        """Önbellekten ya da loader() ile getir - eş zamanlı çağrılar tek loader'ı bekler"""
+        ttl = self.ttls.get(path)
+        if not ttl:
+            return loader()
+        
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry and entry[0] > self.clock():
+                self._count(path, "hits")
+                return entry[1]
+            flight = self.inflight.get(path)
+            leader = flight is None
+            if leader:
+                flight = self.inflight[path] = self._Flight()
+                generation = self.generation
+                self._count(path, "misses")
+            else:
+                self._count(path, "coalesced")
+        
+        if not leader:
+            flight.event.wait()
+            if flight.error:
+                raise flight.error
+            return flight.response
+        
+        try:
+            flight.response = loader()
+            return flight.response
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self.lock:
+                if self.inflight.get(path) is flight:
+                    del self.inflight[path]
+                # Sadece başarılı yanıtları ve arada mutasyon olmadıysa sakla
+                if (flight.error is None and flight.response.status_code == 200
+                        and generation == self.generation):
+                    self.entries[path] = (self.clock() + ttl, flight.response)
+            flight.event.set()
+    
+    def invalidate(self):
+        """Tüm kayıtları düşür; uçuştaki istekler sonuçlarını saklamaz"""
+        with self.lock:
+            self.entries.clear()
+            self.inflight.clear()
+            self.generation += 1
+            self.counters["invalidations"] += 1
+    
+    def stats(self) -> Dict:
+        with self.lock:
+            lookups = self.counters["hits"] + self.counters["misses"] + self.counters["coalesced"]
+            saved = self.counters["hits"] + self.counters["coalesced"]
+            return {
+                **self.counters,
+                "hit_rate": round(saved / lookups, 3) if lookups else None,
+                "by_path": {path: dict(counts) for path, counts in self.by_path.items()}
+            }
+
+class QueueCatalog:
+    """Kuyruk meta verisi (/lol-game-queues/v1/queues) - client sürümüne göre diskte önbelleklenir
+    
+    Liste büyüktür ve yalnızca yamayla değişir; bağlantı başına tek bir sürüm sorgusu yeterlidir.
+    """
+    
+    FIELDS = ("name", "description", "gameMode", "mapId", "queueAvailability", "isRanked")
+    
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self.version = None
+        self.queues = {}        # queueId -> FIELDS
+        self.session = None     # Sürümün doğrulandığı bağlantı (port, token)
+        self.lock = threading.Lock()
+        self.fetches = 0
+        self.logger = logging.getLogger('BeRightBack')
+    
+    def ensure(self, client) -> bool:
+        """Katalog bu bağlantı için doğrulanmış mı - gerekirse diskten ya da client'tan yükle"""
+        with self.lock:
+            session = (client.port, client.token)
+            if self.queues and self.session == session:
+                return True
+            try:
+                response = client._request("GET", "/lol-patch/v1/game-version")
+                if response.status_code != 200:
+                    return bool(self.queues)
+                version = response.json()
+                if version != self.version:
+                    self.queues = {}
+                    self.version = version
+                    self._load()
+                if not self.queues:
+                    self._fetch(client)
+            except Exception as e:
+                self.logger.error(f"❌ Kuyruk listesi alınamadı: {e}")
+            if self.queues:
+                self.session = session
+            return bool(self.queues)
+    
+    def _load(self):
+        """Aynı sürüm için diskteki kopyayı kullan"""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == self.version:
+                self.queues = {int(queue_id): queue for queue_id, queue in data["queues"].items()}
+        except Exception as e:
+            self.logger.warning(f"⚠️ Kuyruk önbelleği okunamadı: {e}")
+    
+    def _fetch(self, client):
+        """Listeyi client'tan al, gereken alanları diske yaz"""
+        response = client._request("GET", "/lol-game-queues/v1/queues", timeout=10)
+        if response.status_code != 200:
+            return
+        self.fetches += 1
+        self.queues = {
+            queue["id"]: {field: queue.get(field) for field in self.FIELDS}
+            for queue in response.json() if "id" in queue
+        }
+        self.logger.info(f"📋 Kuyruk listesi güncellendi ({len(self.queues)} kuyruk, sürüm {self.version})")
+        if self.path:
+            try:
+                atomic_write_json(self.path, {"version": self.version, "queues": self.queues})
+            except OSError as e:
+                self.logger.warning(f"⚠️ Kuyruk listesi diske yazılamadı: {e}")
+    
+    def get(self, queue_id) -> Optional[Dict]:
+        return self.queues.get(queue_id)
+    
+    def name(self, queue_id) -> str:
+        queue = self.queues.get(queue_id)
+        return (queue.get("description") or queue.get("name")) if queue else str(queue_id)
+
+class ClientWatcher:
+    """Client'ın açılışını olayla algılar (Linux) - bağlantı yokken zamanlı taramaya gerek kalmaz
+    
+    Kurulum dizinlerinde lockfile için inotify, izin varsa süreç başlangıcı için proc connector
+    (netlink, CAP_NET_ADMIN gerekir). Olaylar `on_event(kaynak, değer)` ile bildirilir; izleme
+    beklenmedik şekilde biterse `on_event("stopped", None)` gelir, motor zamanlı taramaya döner.
+    """
+    
+    LOCKFILE = "lockfile"
+    PROCESS_PREFIX = "LeagueClientUx"  # /proc/<pid>/comm 15 karakterle kesilir
+    
+    # inotify maskeleri
+    IN_CLOSE_WRITE = 0x008     # IN_CREATE değil: oluşturulduğu anda dosya henüz boş
+    IN_MOVED_TO = 0x080
+    IN_DELETE = 0x200
+    
+    # proc connector (linux/connector.h, linux/cn_proc.h)
+    NETLINK_CONNECTOR = 11
+    CN_IDX_PROC = 1
+    CN_VAL_PROC = 1
+    PROC_CN_MCAST_LISTEN = 1
+    PROC_EVENT_EXEC = 0x2
+    NLMSG_DONE = 3
+    
+    MAX_ERRORS = 5             # Art arda bu kadar okuma hatası: tanımlayıcılar kullanılamaz sayılır
+    
+    def __init__(self, directories, on_event, watch_exec=True):
+        self.directories = [Path(directory) for directory in directories]
+        self.on_event = on_event
+        self.watch_exec = watch_exec
+        self.inotify_fd = None
+        self.watches = {}       # wd -> dizin
+        self.netlink = None
+        self.thread = None
+        self.running = False
+        self.failed = False     # Dinleme hata ile bitti - motor zamanlı taramaya döner
+        self._stop_r, self._stop_w = None, None
+        self.counters = {"wakeups": 0, "lockfile": 0, "exec": 0, "exec_ignored": 0, "errors": 0}
+        self.logger = logging.getLogger('BeRightBack')
+    
+    @staticmethod
+    def available() -> bool:
+        return sys.platform.startswith("linux")
+    
+    @property
+    def alive(self) -> bool:
+        """Dinleme thread'i çalışıyor mu (hata ile bittiyse False)"""
+        return self.thread is not None and self.thread.is_alive() and not self.failed
+    
+    @property
+    def sources(self):
+        return [name for name, active in (("inotify", self.watches), ("proc_connector", self.netlink)) if active]
+    
+    def start(self) -> bool:
+        """Kullanılabilir kaynakları aç ve dinleme thread'ini başlat"""
+        if not self.available():
+            return False
+        self._open_inotify()
+        if self.watch_exec:
+            self._open_proc_connector()
+        if not self.sources:
+            return False
+        self._stop_r, self._stop_w = os.pipe()
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        self.logger.info(f"👀 Client olayla izleniyor: {', '.join(self.sources)}")
+        return True
+    
+    def stop(self):
+        """Dinlemeyi durdur ve tanımlayıcıları kapat"""
+        if not self.running:
+            return
+        self.running = False
+        os.write(self._stop_w, b"x")
+        if self.thread:
+            self.thread.join(1)
+        for fd in (self._stop_r, self._stop_w, self.inotify_fd):
+            if fd is not None:
+                os.close(fd)
+        if self.netlink:
+            self.netlink.close()
+        self.inotify_fd, self.netlink, self.watches = None, None, {}
+    
+    def _open_inotify(self):
+        existing = [directory for directory in self.directories if directory.is_dir()]
+        if not existing:
+            return
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1")
+            mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_DELETE
+            for directory in existing:
+                wd = libc.inotify_add_watch(fd, os.fsencode(directory), mask)
+                if wd >= 0:
+                    self.watches[wd] = directory
+            self.inotify_fd = fd
+        except (OSError, AttributeError) as e:
+            self.logger.warning(f"⚠️ inotify kullanılamıyor: {e}")
+    
+    def _open_proc_connector(self):
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, self.NETLINK_CONNECTOR)
+            sock.bind((0, self.CN_IDX_PROC))
+            if self._kernel_version() >= (6, 6):
+                # proc_input: çekirdek yalnızca exec olaylarını gönderir (fork / exit uyandırmaz)
+                payload = struct.pack("=II", self.PROC_CN_MCAST_LISTEN, self.PROC_EVENT_EXEC)
+            else:
+                payload = struct.pack("=I", self.PROC_CN_MCAST_LISTEN)
+            message = struct.pack("=IIIIHH", self.CN_IDX_PROC, self.CN_VAL_PROC, 0, 0, len(payload), 0) + payload
+            sock.send(struct.pack("=IHHII", 16 + len(message), self.NLMSG_DONE, 0, 0, 0) + message)
+            self.netlink = sock
+        except (OSError, AttributeError):
+            # Yetki yok (CAP_NET_ADMIN) - lockfile izlemesi yeterli
+            self.netlink = None
+    
+    @staticmethod
+    def _kernel_version() -> Tuple[int, ...]:
+        try:
+            return tuple(int(part) for part in os.uname().release.split("-")[0].split(".")[:2])
+        except (ValueError, AttributeError):
+            return (0, 0)
+    
+    def _run(self):
+        """Olay gelene kadar select() içinde bekle - zaman aşımı yok"""
+        fds = [self._stop_r] + [fd for fd in (self.inotify_fd, self.netlink) if fd is not None]
+        errors = 0
+        try:
+            while self.running:
+                readable, _, _ = select.select(fds, [], [])
+                if self._stop_r in readable:
+                    return
+                self.counters["wakeups"] += 1
+                try:
+                    if self.inotify_fd in readable:
+                        self._read_inotify()
+                    if self.netlink in readable:
+                        self._read_proc_connector()
+                    errors = 0
+                except Exception:
+                    # Bozuk / kısa paket ya da on_event hatası tek olayı kaybettirir, izlemeyi değil
+                    self.counters["errors"] += 1
+                    errors += 1
+                    self.logger.exception("💥 Client olay izleme hatası - izleme devam ediyor")
+                    if errors >= self.MAX_ERRORS:
+                        return
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"⚠️ Client olay izleme tanımlayıcıları kullanılamıyor: {e}")
+        finally:
+            if self.running:
+                self.failed = True
+                self.logger.warning("⚠️ Client olay izleme durdu - zamanlı taramaya dönülüyor")
+                self.on_event("stopped", None)
+    
+    def _read_inotify(self):
+        try:
+            data = os.read(self.inotify_fd, 4096)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset + 16 <= len(data):
+            wd, mask, _, length = struct.unpack_from("=iIII", data, offset)
+            name = data[offset + 16:offset + 16 + length].rstrip(b"\0").decode(errors="replace")
+            offset += 16 + length
+            if name != self.LOCKFILE or wd not in self.watches:
+                continue
+            self.counters["lockfile"] += 1
+            path = self.watches[wd] / name
+            self.on_event("lockfile_removed" if mask & self.IN_DELETE else "lockfile", path)
+    
+    def _read_proc_connector(self):
+        try:
+            data = self.netlink.recv(4096)
+        except OSError:
+            return
+        # nlmsghdr (16) + cn_msg (20) + proc_event: what, cpu, timestamp (16) + exec: pid, tgid
+        if len(data) < 60 or struct.unpack_from("=I", data, 36)[0] != self.PROC_EVENT_EXEC:
+            return
+        pid = struct.unpack_from("=I", data, 52)[0]
+        try:
+            with open(f"/proc/{pid}/comm", "r") as f:
+                name = f.read().strip()
+        except OSError:
+            return
+        if not name.startswith(self.PROCESS_PREFIX):
+            self.counters["exec_ignored"] += 1
+            return
+        self.counters["exec"] += 1
+        self.on_event("exec", pid)
+
+class LCUConnectionPool(urllib3.HTTPSConnectionPool):
+    """Açtığı bağlantıları adapter'ın kümesine kaydeden havuz"""
+    
+    def __init__(self, *args, connections=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections = connections
+    
+    def _new_conn(self):
+        connection = super()._new_conn()
+        self.connections.add(connection)
+        return connection
+
+class LCUAdapter(HTTPAdapter):
+    """LCU transport'u - self-signed sertifika doğrulanmaz
+    
+    ssl_context verilmezse urllib3 her yeni bağlantı havuzunda sistem CA deposunu yükler (~40 ms);
+    client açılır açılmaz yapılan ilk istek bunu beklemesin.
+    """
+    
+    def init_poolmanager(self, *args, **kwargs):
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        kwargs["ssl_context"] = context
+        super().init_poolmanager(*args, **kwargs)
+        # Kapanışta uçuştaki istekler (5 sn timeout) beklenmeden kesilebilsin
+        self.connections = weakref.WeakSet()
+        self.poolmanager.pool_classes_by_scheme = {
+            **self.poolmanager.pool_classes_by_scheme,
+            "https": functools.partial(LCUConnectionPool, connections=self.connections)
+        }
+    
+    def abort(self):
+        """Açık soketleri kapat - bloklanmış okuma hemen hata ile döner"""
+        for connection in list(self.connections):
+            sock = getattr(connection, 'sock', None)
+            if sock is None:
+                continue
+            try:
+                # SSLSocket.shutdown TLS nesnesini düşürür; okuyan thread'in altından çekilmesin
+                socket.socket.shutdown(sock, socket.SHUT_RDWR)
+            except OSError:
+                pass
+
 class LoLClient:
     """LoL Client API wrapper"""
     
+    # lockfile burada aranır; Linux (Wine / Lutris) kurulumları config'den eklenir
+    DEFAULT_INSTALL_DIRS = ["C:/Riot Games/League of Legends"]
+    CONNECT_TIMEOUT = 0.5   # LCU yerel - bağlantı kurulamıyorsa beklemeye değmez
+    HEALTH_TIMEOUT = 1.0    # Sağlık kontrolü istekleri (current-summoner, gameflow-phase, ready-check)
+    FAILURE_LIMIT = 2       # Bu kadar ardışık transport hatasında bağlantı düşürülür
+    
     def __init__(self):
         self.port = None
         self.token = None
-        self.session = requests.Session()
-        self.session.verify = False
+        self.session = self._new_session()
         self.connected = False
         self.in_game = False
+        self.phase = None
+        self.recorder = None
+        self.tracer = None
+        self.metrics = None     # MetricsRegistry - yalnızca metrik gönderimi açıkken
+        self.cache = ResponseCache()
+        self.limiter = RateLimiter()
+        self.queues = QueueCatalog()
+        self.install_dirs = [Path(directory) for directory in self.DEFAULT_INSTALL_DIRS]
+        self.failures = 0           # Ardışık transport hatası
+        self.resets = 0
+        self.reset_lock = threading.Lock()
+        self.closed = False
         
         # Logger
         self.logger = logging.getLogger('LoLClient')
         self.logger.setLevel(logging.INFO)
     
-    def find_client(self) -> bool:
-        """LoL Client bul ve bağlan"""
+    def _new_session(self, old=None) -> requests.Session:
+        """Yeni session; eski session'ın adapter'ları (kayıt / replay) havuzları kapatılıp taşınır"""
+        session = requests.Session()
+        session.verify = False
+        # REQUESTS_CA_BUNDLE / proxy ortam değişkenleri verify=False'u ezmesin
+        session.trust_env = False
+        if old is None:
+            session.mount("https://", LCUAdapter())
+        else:
+            for prefix, adapter in old.adapters.items():
+                adapter.close()
+                session.mount(prefix, adapter)
+        return session
+    
+    def reset_connection(self, reason):
+        """Bağlantıyı düşür: bayat session / havuz / önbellek atılır, yeniden keşif başlar"""
+        with self.reset_lock:
+            if not self.connected or self.closed:
+                return
+            self.connected = False
+            self.in_game = False
+            self.phase = None
+            self.failures = 0
+            self.resets += 1
+            self.session = self._new_session(self.session)
+            if self.cache:
+                self.cache.invalidate()
+        self.logger.warning(f"🔴 LoL Client bağlantısı kesildi ({reason})")
+    
+    def _on_transport_error(self, error):
+        """Ardışık hataları say; lockfile başka bir client'ı gösteriyorsa beklemeden düşür"""
+        if not self.connected or self.closed:
+            return
+        self.failures += 1
+        lockfile = self.read_lockfile()
+        reason = error.args[0].reason if error.args and hasattr(error.args[0], 'reason') else None
+        if lockfile is not None and lockfile != (self.port, self.token):
+            self.reset_connection("client yeniden başlatıldı")
+        elif isinstance(reason, urllib3.exceptions.NewConnectionError):
+            # Yerel port bağlantıyı reddediyor - client kapanmış, tekrar denemeye gerek yok
+            self.reset_connection("client kapandı")
+        elif self.failures >= self.FAILURE_LIMIT:
+            self.reset_connection(f"{self.failures} ardışık hata: {type(error).__name__}")
+    
+    def read_lockfile(self) -> Optional[Tuple[str, str]]:
+        """Kurulum dizinlerindeki lockfile'dan (port, token) - süreç taramasından çok daha ucuz"""
+        for directory in self.install_dirs:
+            try:
+                content = (directory / ClientWatcher.LOCKFILE).read_text(encoding='utf-8').strip()
+            except OSError:
+                continue
+            # LeagueClient:pid:port:password:protocol
+            parts = content.split(":")
+            if len(parts) >= 5:
+                return parts[2], parts[3]
+        return None
+    
+    def find_client(self, scan=True) -> bool:
+        """LoL Client bul ve bağlan (scan=False: yalnızca lockfile, süreç taraması yok)"""
+        if self.closed:
+            return False
+        lockfile = self.read_lockfile()
+        if lockfile and self.connect(*lockfile):
+            return True
+        if not scan:
+            return False
         try:
             for process in psutil.process_iter(['pid', 'name', 'cmdline']):
                 try:
@@ -240,14 +1341,8 @@ class LoLClient:
                             elif "--remoting-auth-token=" in arg:
                                 token = arg.split("=")[1]
                         
-                        if port and token:
-                            self.port = port
-                            self.token = token
-                            self.session.auth = HTTPBasicAuth("riot", token)
-                            if self.test_connection():
-                                if not self.connected:
-                                    self.logger.info(f"🟢 LoL Client'a bağlanıldı (Port: {port})")
-                                return True
+                        if port and token and self.connect(port, token):
+                            return True
                             
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
@@ -258,14 +1353,77 @@ class LoLClient:
             self.logger.warning("🔴 LoL Client bağlantısı kesildi")
         self.connected = False
         self.in_game = False
+        self.phase = None
+        return False
+    
+    def connect(self, port, token) -> bool:
+        """Bilinen port / token ile bağlan"""
+        was_connected = self.connected
+        if self.cache and (port, token) != (self.port, self.token):
+            self.cache.invalidate()
+        self.port = port
+        self.token = token
+        self.session.auth = HTTPBasicAuth("riot", token)
+        if self.test_connection():
+            if not was_connected:
+                self.logger.info(f"🟢 LoL Client'a bağlanıldı (Port: {port})")
+            return True
         return False
     
+    def _request(self, method, path, timeout=5, **kwargs):
+        """LCU isteği gönder - tüm endpoint çağrıları buradan geçer"""
+        if not self.cache:
+            return self._send(method, path, timeout, **kwargs)
+        if method == "GET" and not kwargs:
+            return self.cache.fetch(path, lambda: self._send(method, path, timeout))
+        try:
+            return self._send(method, path, timeout, **kwargs)
+        finally:
+            if method != "GET":
+                # Mutasyon LCU durumunu değiştirir - önbellekteki okumalar artık bayat
+                self.cache.invalidate()
+    
+    def close(self):
+        """Kapanış: yeni istek gönderilmez, uçuştaki istekler soketten kesilir"""
+        self.closed = True
+        for adapter in list(self.session.adapters.values()):
+            if hasattr(adapter, 'abort'):
+                adapter.abort()
+    
+    def _send(self, method, path, timeout, **kwargs):
+        if self.closed:
+            raise requests.ConnectionError("LCU istemcisi kapatıldı")
+        waited = self.limiter.acquire(self.limiter.classify(method, path), timeout) if self.limiter else 0
+        url = f"https://127.0.0.1:{self.port}{path}"
+        timeout = (min(self.CONNECT_TIMEOUT, timeout), timeout)
+        metrics = self.metrics
+        started = time.perf_counter() if metrics else 0
+        try:
+            if not self.tracer:
+                response = self.session.request(method, url, timeout=timeout, **kwargs)
+            else:
+                with self.tracer.span(f"{method} {path}", "lcu") as span_args:
+                    if waited:
+                        span_args["throttled_ms"] = round(waited * 1000, 1)
+                    response = self.session.request(method, url, timeout=timeout, **kwargs)
+                    span_args["status"] = response.status_code
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if metrics:
+                metrics.inc("lcu.transport_errors")
+            self._on_transport_error(e)
+            raise
+        self.failures = 0
+        if metrics:
+            metrics.inc("lcu.requests")
+            metrics.observe("lcu.request_ms", (time.perf_counter() - started) * 1000)
+            if response.status_code >= 500:
+                metrics.inc("lcu.server_errors")
+        return response
+    
     def test_connection(self) -> bool:
         """Bağlantıyı test et"""
         try:
-            url = f"https://127.0.0.1:{self.port}/lol-summoner/v1/current-summoner"
-            response = self.session.get(url, timeout=5)
-            was_connected = self.connected
+            response = self._request("GET", "/lol-summoner/v1/current-summoner", timeout=self.HEALTH_TIMEOUT)
             self.connected = response.status_code == 200
             
             if self.connected:
@@ -273,71 +1431,2812 @@ class LoLClient:
             
             return self.connected
         except Exception:
+            if self.connected:
+                self.reset_connection("bağlantı testi başarısız")
             self.connected = False
             self.in_game = False
             return False
     
-    def check_game_status(self):
-        """Oyun durumunu kontrol et"""
-        try:
-            url = f"https://127.0.0.1:{self.port}/lol-gameflow/v1/gameflow-phase"
-            response = self.session.get(url, timeout=5)
-            if response.status_code == 200:
-                phase = response.json()
-                was_in_game = self.in_game
-                self.in_game = phase in ["InProgress", "GameStart", "WaitingForStats"]
-                
-                if self.in_game and not was_in_game:
-                    self.logger.info("🎮 Oyuna girdi")
-                elif not self.in_game and was_in_game:
-                    self.logger.info("🏠 Oyundan çıktı")
-                    
-        except Exception:
-            pass
+    def check_game_status(self):
+        """Oyun durumunu kontrol et"""
+        try:
+            response = self._request("GET", "/lol-gameflow/v1/gameflow-phase", timeout=self.HEALTH_TIMEOUT)
+            if response.status_code == 200:
+                phase = response.json()
+                self.phase = phase
+                was_in_game = self.in_game
+                # WaitingForStats oyun sonudur - özellikler açık kalsın (oyun sonu ekranları geçilebilir)
+                self.in_game = phase in ["InProgress", "GameStart"]
+                
+                if self.in_game and not was_in_game:
+                    self.logger.info("🎮 Oyuna girdi")
+                elif not self.in_game and was_in_game:
+                    self.logger.info("🏠 Oyundan çıktı")
+                    
+        except Exception:
+            pass
+    
+    def get_ready_check_status(self) -> Optional[Dict]:
+        """Ready check durumunu al"""
+        try:
+            response = self._request("GET", "/lol-matchmaking/v1/ready-check", timeout=self.HEALTH_TIMEOUT)
+            return response.json() if response.status_code == 200 else None
+        except Exception:
+            return None
+    
+    def get_matchmaking_search(self) -> Optional[Dict]:
+        """Kuyruk araması durumunu al (timeInQueue / estimatedQueueTime)"""
+        try:
+            response = self._request("GET", "/lol-matchmaking/v1/search", timeout=self.HEALTH_TIMEOUT)
+            return response.json() if response.status_code == 200 else None
+        except Exception:
+            return None
+    
+    def get_lobby(self) -> Optional[Dict]:
+        """Mevcut lobby bilgisini al"""
+        try:
+            response = self._request("GET", "/lol-lobby/v2/lobby")
+            return response.json() if response.status_code == 200 else None
+        except Exception:
+            return None
+    
+    def accept_match(self) -> bool:
+        """Maçı kabul et"""
+        try:
+            response = self._request("POST", "/lol-matchmaking/v1/ready-check/accept")
+            success = response.status_code == 204
+            if success:
+                self.logger.info("✅ Maç kabul edildi!")
+            return success
+        except Exception as e:
+            self.logger.error(f"❌ Maç kabul hatası: {e}")
+            return False
+    
+    def start_matchmaking(self) -> bool:
+        """Matchmaking başlat"""
+        try:
+            response = self._request("POST", "/lol-lobby/v2/lobby/matchmaking/search")
+            success = response.status_code == 204
+            if success:
+                self.logger.info("🔍 Matchmaking başlatıldı")
+            return success
+        except Exception as e:
+            self.logger.error(f"❌ Matchmaking başlatma hatası: {e}")
+            return False
+
+    def create_lobby(self, queue_id) -> bool:
+        """Verilen kuyruk için lobby oluştur"""
+        try:
+            if self.queues.ensure(self):
+                queue = self.queues.get(queue_id)
+                if not queue or queue["queueAvailability"] != "Available":
+                    self.logger.warning(f"⚠️ Kuyruk kullanılamıyor: {queue_id}")
+                    return False
+            response = self._request("POST", "/lol-lobby/v2/lobby", json={"queueId": queue_id})
+            success = response.status_code == 200
+            if success:
+                self.phase = "Lobby"
+                self.logger.info(f"🏠 Lobby oluşturuldu: {self.queues.name(queue_id)}")
+            return success
+        except Exception as e:
+            self.logger.error(f"❌ Lobby oluşturma hatası: {e}")
+            return False
+    
+    def queue_up(self, queue_id=None) -> bool:
+        """Ana ekrandaysa önce lobby oluştur, sonra matchmaking başlat"""
+        if queue_id and self.phase == "None":
+            if not self.create_lobby(queue_id):
+                return False
+        return self.start_matchmaking()
+    
+    def get_champion_summary(self) -> Optional[list]:
+        """Tüm şampiyonlar (id, isim, alias) - yamayla değişir"""
+        try:
+            response = self._request("GET", "/lol-game-data/assets/v1/champion-summary.json", timeout=10)
+            return response.json() if response.status_code == 200 else None
+        except Exception:
+            return None
+    
+    def get_owned_champions(self) -> Optional[list]:
+        """Hesabın sahip olduğu şampiyonlar"""
+        try:
+            response = self._request("GET", "/lol-champions/v1/owned-champions-minimal", timeout=10)
+            return response.json() if response.status_code == 200 else None
+        except Exception:
+            return None
+    
+    def get_champ_select_session(self) -> Optional[Dict]:
+        """Champ select oturumu (aksiyonlar, takım, süre)"""
+        try:
+            response = self._request("GET", "/lol-champ-select/v1/session")
+            return response.json() if response.status_code == 200 else None
+        except Exception:
+            return None
+    
+    def patch_champ_select_action(self, action_id, champion_id, complete=False) -> bool:
+        """Aksiyona şampiyon ata (hover); complete ile kilitle / banla"""
+        try:
+            body = {"championId": champion_id}
+            if complete:
+                body["completed"] = True
+            response = self._request("PATCH", f"/lol-champ-select/v1/session/actions/{action_id}", json=body)
+            return response.status_code in (200, 204)
+        except Exception as e:
+            self.logger.error(f"❌ Champ select aksiyonu gönderilemedi: {e}")
+            return False
+    
+    def skip_honor(self) -> bool:
+        """Onur ekranını oy vermeden geç"""
+        try:
+            ballot = self._request("GET", "/lol-honor-v2/v1/ballot")
+            if ballot.status_code != 200:
+                return True  # Oylama yok - geçilecek ekran yok
+            game_id = ballot.json().get("gameId")
+            response = self._request("POST", "/lol-honor-v2/v1/honor-player",
+                                     json={"gameId": game_id, "honorCategory": "OPT_OUT", "summonerId": 0})
+            return response.status_code in (200, 204)
+        except Exception as e:
+            self.logger.error(f"❌ Onur ekranı geçilemedi: {e}")
+            return False
+    
+    def dismiss_stats(self) -> bool:
+        """Oyun sonu istatistik ekranını kapat"""
+        try:
+            response = self._request("POST", "/lol-end-of-game/v1/state/dismiss-stats")
+            return response.status_code in (200, 204)
+        except Exception as e:
+            self.logger.error(f"❌ İstatistik ekranı kapatılamadı: {e}")
+            return False
+    
+    def play_again(self) -> bool:
+        """Oyun sonundan aynı kuyruğun lobby'sine dön"""
+        try:
+            response = self._request("POST", "/lol-lobby/v2/play-again")
+            success = response.status_code in (200, 204)
+            if success:
+                self.logger.info("🔄 Lobby'ye dönüldü")
+            return success
+        except Exception as e:
+            self.logger.error(f"❌ Lobby'ye dönülemedi: {e}")
+            return False
+
+    def start_recording(self, path):
+        """Tüm istek / yanıtları zamanlarıyla birlikte kaydetmeye başla"""
+        self.recorder = SessionRecorder(path, port=self.port)
+        self.session.mount("https://", RecordingAdapter(self.recorder))
+        self.logger.info(f"⏺️ LCU kaydı başladı: {path}")
+    
+    def stop_recording(self):
+        """Kaydı bitir ve dosyayı kapat"""
+        if self.recorder:
+            self.session.mount("https://", LCUAdapter())
+            self.recorder.close()
+            self.logger.info(f"⏹️ LCU kaydı tamamlandı: {self.recorder.count} istek")
+            self.recorder = None
+
+class SessionRecorder:
+    """LCU istek / yanıtlarını gzip'li JSON Lines dosyasına yazar"""
+
+    FORMAT = "berightback-lcu-recording"
+    FLUSH_EVERY = 100
+
+    def __init__(self, path, port=None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.count = 0
+        self.file = gzip.open(self.path, 'wt', encoding='utf-8')
+        self._write({
+            "format": self.FORMAT, "version": 1, "app_version": __version__,
+            "started": datetime.now().isoformat(timespec="seconds"), "port": port
+        })
+
+    def _write(self, entry):
+        self.file.write(json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n")
+
+    def record(self, started, method, path, status, elapsed, body=None, request_body=None):
+        """Tek kayıt: [t, method, path, status, elapsed_ms, body, request_body]"""
+        entry = [round(started - self.started, 3), method, path, status, round(elapsed * 1000, 1), body]
+        if request_body:
+            entry.append(request_body)
+        with self.lock:
+            if self.file.closed:
+                return
+            self._write(entry)
+            self.count += 1
+            if self.count % self.FLUSH_EVERY == 0:
+                self.file.flush()
+
+    def close(self):
+        """Dosyayı kapat"""
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
+
+class RecordingAdapter(LCUAdapter):
+    """Gönderilen her isteği SessionRecorder'a yazan transport adapter"""
+
+    def __init__(self, recorder):
+        super().__init__()
+        self.recorder = recorder
+
+    def send(self, request, **kwargs):
+        started = time.monotonic()
+        path = urlsplit(request.url).path
+        body = request.body.decode('utf-8') if isinstance(request.body, bytes) else request.body
+        try:
+            response = super().send(request, **kwargs)
+        except Exception as e:
+            self.recorder.record(started, request.method, path, None,
+                                 time.monotonic() - started, type(e).__name__, body)
+            raise
+        self.recorder.record(started, request.method, path, response.status_code,
+                             time.monotonic() - started, response.text or None, body)
+        return response
+
+class SessionReplay:
+    """Kaydedilmiş LCU oturumunu sanal saatle geri oynatır"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.now = 0.0
+        self.index = {}         # (method, path) -> ([t], [entry])
+        self.windows = {}       # ready check GET t -> InProgress penceresinin başlangıcı
+        self.header = {}
+        self.requests = {}      # Replay sırasında gelen istek sayıları
+        self.accepts = []       # (t, pencere başlangıcı)
+        self.accepted_window = None
+        self.duration = 0.0
+        self.load()
+
+    def load(self):
+        """Kaydı oku ve endpoint başına zaman indeksi kur"""
+        window_start = None
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            self.header = json.loads(f.readline())
+            if self.header.get("format") != SessionRecorder.FORMAT:
+                raise ValueError(f"Geçersiz kayıt dosyası: {self.path}")
+            for line in f:
+                entry = json.loads(line)
+                t, method, path = entry[0], entry[1], entry[2]
+                times, entries = self.index.setdefault((method, path), ([], []))
+                times.append(t)
+                entries.append(entry)
+                self.duration = max(self.duration, t)
+
+                # Ready check pencerelerini çıkar (kabul gecikmesi ölçümü için)
+                if method == "GET" and path == "/lol-matchmaking/v1/ready-check":
+                    state = self._json(entry).get("state") if entry[3] == 200 else None
+                    if state == "InProgress":
+                        window_start = t if window_start is None else window_start
+                        self.windows[t] = window_start
+                    else:
+                        window_start = None
+
+    @staticmethod
+    def _json(entry):
+        try:
+            return json.loads(entry[5]) if entry[5] else {}
+        except ValueError:
+            return {}
+
+    def clock(self):
+        """Sanal saat (kayıt başından itibaren saniye)"""
+        return self.now
+
+    def lookup(self, method, path):
+        """Sanal zamandaki durumu temsil eden kaydı bul"""
+        times, entries = self.index.get((method, path), (None, None))
+        if not times:
+            return None
+        if method == "GET":
+            # Şu ana kadarki en son yanıt; kayıt başından önceyse ilk yanıt
+            position = bisect.bisect_right(times, self.now) - 1
+            return entries[max(position, 0)]
+        # Mutasyonlar: zamanca en yakın kayıt
+        position = bisect.bisect_left(times, self.now)
+        candidates = [i for i in (position - 1, position) if 0 <= i < len(times)]
+        return entries[min(candidates, key=lambda i: abs(times[i] - self.now))]
+
+    def respond(self, method, path):
+        """(status, body) döndür; kayıtta olmayan mutasyonlar başarılı sayılır"""
+        key = f"{method} {path}"
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+        entry = self.lookup(method, path)
+        if entry is None:
+            return (204, None) if method != "GET" else (404, None)
+        status, body = entry[3], entry[5]
+        if status is None:
+            raise requests.ConnectionError(f"Recorded failure: {body}")
+
+        if path == "/lol-matchmaking/v1/ready-check" and status == 200:
+            window = self.windows.get(entry[0])
+            if window is not None and window == self.accepted_window:
+                # Replay'de kabul ettik - kayıttaki "None" yanıtını güncelle
+                data = self._json(entry)
+                data["playerResponse"] = "Accepted"
+                body = json.dumps(data)
+        elif path == "/lol-matchmaking/v1/ready-check/accept" and status == 204:
+            current = self.lookup("GET", "/lol-matchmaking/v1/ready-check")
+            window = self.windows.get(current[0]) if current else None
+            if window is not None and window != self.accepted_window:
+                self.accepted_window = window
+                self.accepts.append((self.now, window))
+        return status, body
+
+    def accept_latencies(self):
+        """Her ready check penceresi için görünme -> accept süresi (ms)"""
+        return [round((t - window) * 1000, 1) for t, window in self.accepts]
+
+    def missed_windows(self):
+        """Replay'de kabul edilmeyen ready check pencereleri"""
+        accepted = {window for _, window in self.accepts}
+        return sorted(set(self.windows.values()) - accepted)
+
+    def attach(self, client):
+        """Client'ı replay'e bağla (process taraması olmadan)"""
+        client.session.mount("https://", ReplayAdapter(self))
+        if client.cache:
+            client.cache.clock = self.clock
+        # Sanal saatte bekleme ilerlemez; kayıttaki istek temposu zaten sınırın altında
+        client.limiter = None
+        # Kayıttaki kopmalardan sonra yeniden keşif de replay'e bağlanır
+        port = self.header.get("port") or 0
+        client.find_client = lambda scan=True: client.connect(port, "replay")
+        return client.connect(port, "replay")
+
+    def run(self, engine, speed=None, until=None):
+        """Motoru sanal saatle çalıştır; speed=None en hızlı (deterministik) mod"""
+        engine.clock = self.clock
+        until = self.duration if until is None else until
+        polls = 0
+        while self.now <= until:
+            interval = engine.poll_once()
+            polls += 1
+            if speed:
+                time.sleep(interval / speed)
+            self.now += interval
+        return polls
+
+class ReplayAdapter(HTTPAdapter):
+    """İstekleri ağ yerine SessionReplay'den yanıtlayan transport adapter"""
+
+    def __init__(self, replay):
+        super().__init__()
+        self.replay = replay
+
+    def send(self, request, **kwargs):
+        status, body = self.replay.respond(request.method, urlsplit(request.url).path)
+        response = requests.Response()
+        response.status_code = status
+        response._content = body.encode('utf-8') if body else b""
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+class ActivityMeter:
+    """Uyanma sayısı ve CPU süresi ölçümü (idle / aktif mod karşılaştırması)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.mode = "active"
+        self.mode_started = time.monotonic()
+        self.cpu_started = time.process_time()
+        self.wakeups = {}  # Mevcut moddaki kaynak -> uyanma sayısı
+        self.totals = {
+            "active": {"seconds": 0.0, "cpu": 0.0, "wakeups": 0},
+            "idle": {"seconds": 0.0, "cpu": 0.0, "wakeups": 0}
+        }
+
+    def wakeup(self, source):
+        """Bir döngünün uyandığını kaydet"""
+        with self.lock:
+            self.wakeups[source] = self.wakeups.get(source, 0) + 1
+
+    def set_mode(self, mode) -> Optional[Dict]:
+        """Mod değiştir, biten dönemin özetini döndür"""
+        with self.lock:
+            if mode == self.mode:
+                return None
+            summary = self._close_period()
+            self.mode = mode
+            return summary
+
+    def _close_period(self) -> Dict:
+        """Mevcut dönemi kapat ve toplamlara ekle (lock altında çağrılır)"""
+        now = time.monotonic()
+        cpu = time.process_time()
+        elapsed = max(now - self.mode_started, 1e-6)
+        cpu_used = cpu - self.cpu_started
+        wakeups = sum(self.wakeups.values())
+
+        total = self.totals[self.mode]
+        total["seconds"] += elapsed
+        total["cpu"] += cpu_used
+        total["wakeups"] += wakeups
+
+        summary = {
+            "mode": self.mode,
+            "seconds": elapsed,
+            "wakeups_per_minute": wakeups * 60 / elapsed,
+            "cpu_ms_per_minute": cpu_used * 1000 * 60 / elapsed,
+            "sources": dict(self.wakeups)
+        }
+
+        self.mode_started = now
+        self.cpu_started = cpu
+        self.wakeups = {}
+        return summary
+
+    def report(self) -> Dict:
+        """Tüm çalışma süresi için idle / aktif karşılaştırması"""
+        with self.lock:
+            self._close_period()
+            report = {}
+            for mode, total in self.totals.items():
+                seconds = total["seconds"]
+                if seconds <= 0:
+                    continue
+                report[mode] = {
+                    "seconds": round(seconds, 1),
+                    "wakeups_per_minute": round(total["wakeups"] * 60 / seconds, 2),
+                    "cpu_ms_per_minute": round(total["cpu"] * 1000 * 60 / seconds, 2)
+                }
+            return report
+
+class ResourceMonitor:
+    """Programın kendi kaynak kullanımını ölçer ve CPU bütçesine göre yavaşlatır"""
+
+    MAX_THROTTLE = 3.0      # Aralıklar en fazla bu katsayı ile uzar
+    THROTTLE_STEP = 1.5
+    TRIGGER_SAMPLES = 3     # Art arda bütçe aşımı / altı örnek sayısı
+
+    def __init__(self, config, meter=None):
+        self.config = config
+        self.meter = meter
+        self.process = psutil.Process()
+        self.history = deque(maxlen=config.get('performance.history_size', 60))
+        self.latest = None
+        self.throttle = 1.0
+        self._over_budget = 0
+        self._under_budget = 0
+        self._last_sample = 0
+        self._last_log = time.monotonic()
+        self._last_ctx = None
+        self._last_wakeups = None
+
+        # Ilk cpu_percent çağrısı her zaman 0 döner
+        self.process.cpu_percent(interval=None)
+
+        # Logger
+        self.logger = logging.getLogger('Resources')
+        self.logger.setLevel(logging.INFO)
+
+    def maybe_sample(self) -> Optional[Dict]:
+        """Örnekleme zamanı geldiyse örnekle"""
+        if time.monotonic() - self._last_sample < self.config.get('performance.sample_interval', 5):
+            return None
+        return self.sample()
+
+    def sample(self) -> Dict:
+        """CPU%, RSS, thread sayısı ve uyanma sayısını ölç"""
+        now = time.monotonic()
+        elapsed = max(now - self._last_sample, 1e-6) if self._last_sample else None
+        self._last_sample = now
+
+        with self.process.oneshot():
+            cpu = self.process.cpu_percent(interval=None)
+            rss = self.process.memory_info().rss
+            threads = self.process.num_threads()
+            ctx = self.process.num_ctx_switches().voluntary
+
+        # OS seviyesinde uyanma (voluntary context switch) ve döngü uyanmaları
+        wakeups = sum(self.meter.wakeups.values()) if self.meter else 0
+        os_wakeups_per_sec = None
+        loop_wakeups_per_min = None
+        if elapsed and self._last_ctx is not None:
+            os_wakeups_per_sec = max(ctx - self._last_ctx, 0) / elapsed
+            if wakeups >= self._last_wakeups:
+                loop_wakeups_per_min = (wakeups - self._last_wakeups) * 60 / elapsed
+        self._last_ctx = ctx
+        self._last_wakeups = wakeups
+
+        sample = {
+            "time": time.time(),
+            "cpu_percent": cpu,
+            "rss_mb": rss / (1024 * 1024),
+            "threads": threads,
+            "os_wakeups_per_sec": os_wakeups_per_sec,
+            "loop_wakeups_per_min": loop_wakeups_per_min,
+            "throttle": self.throttle
+        }
+        self.latest = sample
+        self.history.append(sample)
+
+        self._update_throttle(cpu)
+        self._maybe_log(sample)
+        return sample
+
+    def _update_throttle(self, cpu):
+        """CPU bütçesi aşılırsa izleme aralıklarını uzat, rahatlayınca geri al"""
+        if not self.config.get('performance.auto_throttle', True):
+            self.throttle = 1.0
+            return
+
+        budget = self.config.get('performance.cpu_budget', 5.0)
+        if cpu > budget:
+            self._over_budget += 1
+            self._under_budget = 0
+        elif cpu < budget / 2:
+            self._under_budget += 1
+            self._over_budget = 0
+        else:
+            self._over_budget = self._under_budget = 0
+
+        if self._over_budget >= self.TRIGGER_SAMPLES and self.throttle < self.MAX_THROTTLE:
+            self.throttle = min(self.throttle * self.THROTTLE_STEP, self.MAX_THROTTLE)
+            self._over_budget = 0
+            self.logger.warning(f"🐢 CPU bütçesi aşıldı (%{cpu:.1f} > %{budget}), aralıklar x{self.throttle:.2f}")
+        elif self._under_budget >= self.TRIGGER_SAMPLES and self.throttle > 1.0:
+            self.throttle = max(self.throttle / self.THROTTLE_STEP, 1.0)
+            self._under_budget = 0
+            self.logger.info(f"🐇 CPU bütçe altında, aralıklar x{self.throttle:.2f}")
+
+    def _maybe_log(self, sample):
+        """Metrikleri periyodik olarak log'a yaz"""
+        now = time.monotonic()
+        if now - self._last_log < self.config.get('performance.log_interval', 300):
+            return
+        self._last_log = now
+        self.logger.info(f"📈 {self.format_summary(sample)}")
+
+    def format_summary(self, sample=None) -> str:
+        """Durum çubuğu / log için kısa özet"""
+        sample = sample or self.latest
+        if not sample:
+            return ""
+        text = f"CPU {sample['cpu_percent']:.1f}% · RAM {sample['rss_mb']:.0f} MB · {sample['threads']} thr"
+        if sample['os_wakeups_per_sec'] is not None:
+            text += f" · {sample['os_wakeups_per_sec']:.1f} wk/s"
+        if sample['throttle'] > 1.0:
+            text += f" · x{sample['throttle']:.1f}"
+        return text
+
+    def get_metrics(self) -> Dict:
+        """Son örnek ve kısa geçmişin ortalamaları"""
+        if not self.history:
+            return {}
+        samples = list(self.history)
+        return {
+            "latest": dict(self.latest),
+            "avg_cpu_percent": sum(s["cpu_percent"] for s in samples) / len(samples),
+            "max_rss_mb": max(s["rss_mb"] for s in samples),
+            "samples": len(samples),
+            "throttle": self.throttle
+        }
+
+class SessionProfiler:
+    """--profile modu: monitor / Tk thread profili, bellek snapshot'ları ve Tk gecikmesi
+
+    Python 3.12+ süreç başına tek profil aracına izin verir (sys.monitoring): cProfile yalnızca
+    monitor thread'inde çalışır, Tk thread'i sys._current_frames() ile örneklenir.
+    """
+
+    LAG_PROBE_INTERVAL = 500    # ms - Tk event loop gecikme ölçümü
+    SAMPLE_INTERVAL = 0.01      # s - Tk stack örnekleme aralığı
+    SAMPLE_DEPTH = 40           # Örnek başına en fazla frame
+    SNAPSHOT_INTERVAL = 300     # s - tracemalloc snapshot aralığı
+    FREEZE_THRESHOLD = 2.0      # s - bu kadar cevapsız kalan Tk donmuş sayılır
+
+    def __init__(self, base_dir):
+        self.output_dir = Path(base_dir) / f"profile-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.started = time.monotonic()
+
+        self.profiles = {}
+        self.profile_locks = {}
+        self.unavailable = set()    # Başka profil aracı aktifken profilsiz çalışan isimler
+        self.tk_thread = None
+        self.sampler = None
+        self.tk_stacks = {}         # (frame, ...) kökten yaprağa -> örnek sayısı
+        self.tk_samples = 0
+        self.sample_errors = 0
+        self.lag_samples = deque(maxlen=20000)  # ms
+        self.max_lag = 0.0
+        self.stalls = 0
+        self.freezes = 0
+        self.snapshot_count = 0
+        self._last_probe = time.monotonic()
+        self._previous_snapshot = None
+        self._stop_event = threading.Event()
+
+        # Logger
+        self.logger = logging.getLogger('BeRightBack')
+
+    def start(self, root=None):
+        """Bellek izleme, watchdog ve Tk gecikme ölçümünü başlat"""
+        tracemalloc.start(1)  # Tek frame - düşük overhead
+        threading.Thread(target=self._background_worker, daemon=True).start()
+        if root is not None:
+            self.root = root
+            self.tk_thread = threading.get_ident()
+            self.sampler = threading.Thread(target=self._sampler_worker, daemon=True, name="tk-sampler")
+            self.sampler.start()
+            self._schedule_probe()
+        self.logger.info(f"🔬 Profil modu aktif: {self.output_dir}")
+
+    def run(self, name, func, *args):
+        """Fonksiyonu ilgili thread'in profiline ekleyerek çalıştır
+
+        Başka bir profil aracı aktifse (3.12+ ValueError) bir kez uyarıp profilsiz devam eder -
+        profil modu izlemeyi asla durdurmamalı.
+        """
+        if name in self.unavailable:
+            return func(*args)
+        if name not in self.profiles:
+            self.profiles[name] = cProfile.Profile()
+            self.profile_locks[name] = threading.Lock()
+        with self.profile_locks[name]:
+            profile = self.profiles[name]
+            try:
+                profile.enable()
+            except ValueError as e:
+                self.unavailable.add(name)
+                self.logger.warning(f"⚠️ {name} profili açılamadı ({e}) - profilsiz devam ediliyor")
+                return func(*args)
+            try:
+                return func(*args)
+            finally:
+                profile.disable()
+
+    def _sampler_worker(self):
+        """Tk thread'inin stack'ini SAMPLE_INTERVAL aralıkla örnekle"""
+        while not self._stop_event.wait(self.SAMPLE_INTERVAL):
+            try:
+                frame = sys._current_frames().get(self.tk_thread)
+                if frame is None:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < self.SAMPLE_DEPTH:
+                    code = frame.f_code
+                    stack.append(f"{Path(code.co_filename).name}:{code.co_name}:{frame.f_lineno}")
+                    frame = frame.f_back
+                key = tuple(reversed(stack))
+                self.tk_stacks[key] = self.tk_stacks.get(key, 0) + 1
+                self.tk_samples += 1
+            except Exception:
+                # 10 ms aralıkla log taşmasın: ilk hata traceback'le, sonrakiler yalnızca sayılır
+                if not self.sample_errors:
+                    self.logger.exception("💥 Tk örneklemesi başarısız - örnekleme devam ediyor")
+                self.sample_errors += 1
+
+    def _write_tk_samples(self):
+        """Tk örneklerini flamegraph (collapsed) ve en sık görülen fonksiyonlar olarak yaz"""
+        stacks = sorted(self.tk_stacks.items(), key=lambda item: item[1], reverse=True)
+        with open(self.output_dir / "tk.collapsed", 'w', encoding='utf-8') as f:
+            for stack, count in stacks:
+                f.write(f"{';'.join(stack)} {count}\n")
+        own, total = {}, {}
+        for stack, count in stacks:
+            own[stack[-1]] = own.get(stack[-1], 0) + count
+            for frame in set(stack):
+                total[frame] = total.get(frame, 0) + count
+        lines = [f"# Tk thread: {self.tk_samples} örnek, {self.SAMPLE_INTERVAL * 1000:.0f} ms aralık", "",
+                 "## Kendi süresi (örnek, %)"]
+        lines += [f"{count:8d} {count * 100 / self.tk_samples:6.1f}%  {frame}"
+                  for frame, count in sorted(own.items(), key=lambda item: item[1], reverse=True)[:40]]
+        lines += ["", "## Toplam (örnek, %)"]
+        lines += [f"{count:8d} {count * 100 / self.tk_samples:6.1f}%  {frame}"
+                  for frame, count in sorted(total.items(), key=lambda item: item[1], reverse=True)[:40]]
+        (self.output_dir / "tk.txt").write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+    def _schedule_probe(self):
+        """Bir sonraki gecikme ölçümünü planla"""
+        expected = time.monotonic() + self.LAG_PROBE_INTERVAL / 1000
+        self.root.after(self.LAG_PROBE_INTERVAL, self._probe, expected)
+
+    def _probe(self, expected):
+        """Planlanan ve gerçekleşen after() zamanı farkını kaydet"""
+        now = time.monotonic()
+        lag = max(now - expected, 0) * 1000
+        self.lag_samples.append(lag)
+        self.max_lag = max(self.max_lag, lag)
+        if lag > 100:
+            self.stalls += 1
+        self._last_probe = now
+        if not self._stop_event.is_set():
+            self._schedule_probe()
+
+    def _background_worker(self):
+        """Donma watchdog'u ve periyodik tracemalloc snapshot'ları"""
+        last_snapshot = time.monotonic()
+        frozen = False
+        while not self._stop_event.wait(1.0):
+            now = time.monotonic()
+            try:
+                # Tk uzun süre cevap vermezse tüm thread stack'lerini kaydet
+                stalled = hasattr(self, 'root') and now - self._last_probe > self.FREEZE_THRESHOLD
+                was_frozen, frozen = frozen, stalled
+                if stalled and not was_frozen:
+                    self.freezes += 1
+                    with open(self.output_dir / "freezes.txt", 'a', encoding='utf-8') as f:
+                        f.write(f"=== Donma #{self.freezes} - {datetime.now().isoformat()} "
+                                f"(Tk {now - self._last_probe:.1f}s cevapsız) ===\n")
+                        f.flush()
+                        faulthandler.dump_traceback(f, all_threads=True)
+
+                if now - last_snapshot >= self.SNAPSHOT_INTERVAL:
+                    last_snapshot = now
+                    self.take_snapshot()
+            except Exception:
+                # Yazma hatası (disk dolu, klasör silinmiş...) watchdog'u oturum boyunca kapatmasın
+                self.logger.exception("💥 Profil watchdog / snapshot hatası - izleme devam ediyor")
+
+    def take_snapshot(self):
+        """tracemalloc snapshot al, en büyük ve en çok büyüyen satırları yaz"""
+        if not tracemalloc.is_tracing():
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+        ))
+        self.snapshot_count += 1
+        current, peak = tracemalloc.get_traced_memory()
+
+        lines = [f"# Snapshot {self.snapshot_count} - {datetime.now().isoformat()}",
+                 f"# Current: {current / 1024:.0f} KiB, Peak: {peak / 1024:.0f} KiB", "", "## Top 25"]
+        lines += [str(stat) for stat in snapshot.statistics('lineno')[:25]]
+        if self._previous_snapshot is not None:
+            lines += ["", "## Growth since previous snapshot"]
+            lines += [str(stat) for stat in snapshot.compare_to(self._previous_snapshot, 'lineno')[:25]]
+        self._previous_snapshot = snapshot
+
+        path = self.output_dir / f"tracemalloc-{self.snapshot_count:03d}.txt"
+        path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+    def lag_summary(self) -> Dict:
+        """Tk event loop gecikme istatistikleri (ms)"""
+        samples = sorted(self.lag_samples)
+        if not samples:
+            return {"samples": 0}
+
+        def pick(q):
+            return round(samples[min(int(q * len(samples)), len(samples) - 1)], 2)
+
+        return {
+            "samples": len(samples),
+            "mean": round(sum(samples) / len(samples), 2),
+            "p50": pick(0.50),
+            "p95": pick(0.95),
+            "p99": pick(0.99),
+            "max": round(self.max_lag, 2),
+            "stalls_over_100ms": self.stalls,
+            "freezes": self.freezes
+        }
+
+    def write_report(self):
+        """Rapor paketini yaz"""
+        self._stop_event.set()
+
+        for name, profile in self.profiles.items():
+            if name in self.unavailable:
+                continue
+            # Thread o an profil içindeyse uzun beklemeden atla
+            if not self.profile_locks[name].acquire(timeout=1.0):
+                self.logger.warning(f"⚠️ {name} profili meşgul, atlandı")
+                continue
+            try:
+                profile.dump_stats(str(self.output_dir / f"{name}.prof"))
+                stream = io.StringIO()
+                pstats.Stats(profile, stream=stream).sort_stats("cumulative").print_stats(40)
+                (self.output_dir / f"{name}.txt").write_text(stream.getvalue(), encoding='utf-8')
+            finally:
+                self.profile_locks[name].release()
+
+        if self.sampler is not None:
+            self.sampler.join(1.0)
+        if self.tk_samples:
+            self._write_tk_samples()
+
+        self.take_snapshot()
+        tracemalloc.stop()
+
+        summary = {
+            "duration_seconds": round(time.monotonic() - self.started, 1),
+            "tk_lag_ms": self.lag_summary(),
+            "tk_samples": self.tk_samples,
+            "tk_sample_errors": self.sample_errors,
+            "tracemalloc_snapshots": self.snapshot_count,
+            "profiles": sorted(set(self.profiles) - self.unavailable),
+            "profiles_unavailable": sorted(self.unavailable)
+        }
+        with open(self.output_dir / "summary.json", 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        self.logger.info(f"🔬 Profil raporu yazıldı: {self.output_dir}")
+
+class Tracer:
+    """Chrome trace-event formatında span kaydı - bellekte sınırlı tampon"""
+
+    CYCLE_TID = 1   # Maç döngüsü span'leri için sanal thread
+
+    def __init__(self, max_events=50000, clock=time.monotonic):
+        self.events = deque(maxlen=max_events)
+        self.clock = clock
+        self.origin = clock()
+        self.pid = os.getpid()
+        self.thread_names = {self.CYCLE_TID: "Match cycle"}
+        self.open_spans = {}  # Döngü span adı -> (başlangıç, args)
+        self.lock = threading.Lock()
+
+    def _ts(self, t):
+        """Monotonic saniye -> trace mikro saniye"""
+        return round((t - self.origin) * 1e6, 1)
+
+    def _tid(self):
+        """Mevcut thread kimliği, ilk görüşte adını kaydet"""
+        tid = threading.get_ident()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = threading.current_thread().name
+        return tid
+
+    @contextmanager
+    def span(self, name, cat, **args):
+        """Mevcut thread üzerinde iç içe geçebilen span; args yield edilir"""
+        start = self.clock()
+        try:
+            yield args
+        finally:
+            self.complete(name, cat, start, self.clock(), args)
+
+    def complete(self, name, cat, start, end, args=None, tid=None):
+        """Tamamlanmış span ekle ('X' event)"""
+        event = {
+            "name": name, "cat": cat, "ph": "X", "pid": self.pid,
+            "tid": tid if tid is not None else self._tid(),
+            "ts": self._ts(start), "dur": round(max(end - start, 0) * 1e6, 1)
+        }
+        if args:
+            event["args"] = args
+        with self.lock:
+            self.events.append(event)
+
+    def instant(self, name, cat="cycle", tid=None, **args):
+        """Anlık olay ekle ('i' event)"""
+        event = {
+            "name": name, "cat": cat, "ph": "i", "s": "t", "pid": self.pid,
+            "tid": tid if tid is not None else self._tid(), "ts": self._ts(self.clock())
+        }
+        if args:
+            event["args"] = args
+        with self.lock:
+            self.events.append(event)
+
+    def begin(self, name, **args):
+        """Maç döngüsü track'inde uzun süren span başlat"""
+        self.open_spans[name] = (self.clock(), args)
+
+    def end(self, name, **args):
+        """Açık döngü span'ini kapat"""
+        opened = self.open_spans.pop(name, None)
+        if opened:
+            start, start_args = opened
+            self.complete(name, "cycle", start, self.clock(), {**start_args, **args}, tid=self.CYCLE_TID)
+
+    def is_open(self, name):
+        return name in self.open_spans
+
+    def export(self, path):
+        """Chrome trace-event JSON dosyası yaz (chrome://tracing, Perfetto)"""
+        with self.lock:
+            events = list(self.events)
+        # Hâlâ açık olan döngü span'lerini şimdiye kadar göster
+        now = self.clock()
+        for name, (start, args) in self.open_spans.items():
+            events.append({
+                "name": name, "cat": "cycle", "ph": "X", "pid": self.pid, "tid": self.CYCLE_TID,
+                "ts": self._ts(start), "dur": round((now - start) * 1e6, 1), "args": {**args, "open": True}
+            })
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self.thread_names.items()
+        ]
+        metadata.append({"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": "BeRightBack"}})
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f, separators=(",", ":"))
+        return path
+
+class QuantileSketch:
+    """Sabit bellekli quantile tahmini - göreli hata garantili log-bucket histogram (DDSketch)"""
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=1024, min_value=1e-3):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.min_value = min_value
+        self.buckets = {}       # log_gamma(değer) tavanı -> sayı
+        self.zero_count = 0     # min_value altındaki değerler
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self.lock = threading.Lock()
+
+    def add(self, value):
+        """Tek örnek ekle - O(1)"""
+        with self.lock:
+            if value <= self.min_value:
+                self.zero_count += 1
+            else:
+                index = math.ceil(math.log(value) / self.log_gamma)
+                self.buckets[index] = self.buckets.get(index, 0) + 1
+                if len(self.buckets) > self.max_buckets:
+                    self._collapse()
+            self.count += 1
+            self.sum += value
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+
+    def _collapse(self):
+        """Bucket sınırı aşıldı: en küçük iki bucket'ı birleştir (düşük uç hassasiyeti feda edilir)"""
+        lowest, second = sorted(self.buckets)[:2]
+        self.buckets[second] += self.buckets.pop(lowest)
+
+    def merge(self, other):
+        """Başka bir sketch'in örneklerini ekle (aynı göreli hata) - filo / zaman aralığı birleştirme"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Farklı hassasiyetteki sketch'ler birleştirilemez")
+        with self.lock:
+            for index, count in other.buckets.items():
+                self.buckets[index] = self.buckets.get(index, 0) + count
+            while len(self.buckets) > self.max_buckets:
+                self._collapse()
+            self.zero_count += other.zero_count
+            self.count += other.count
+            self.sum += other.sum
+            if other.count:
+                self.min = other.min if self.min is None else min(self.min, other.min)
+                self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def quantile(self, q) -> Optional[float]:
+        """q (0-1) quantile tahmini, veri yoksa None"""
+        with self.lock:
+            if self.count == 0:
+                return None
+            rank = q * (self.count - 1)
+            if rank < self.zero_count:
+                return self.min
+            seen = self.zero_count
+            for index in sorted(self.buckets):
+                seen += self.buckets[index]
+                if seen > rank:
+                    value = 2 * self.gamma ** index / (self.gamma + 1)
+                    return min(max(value, self.min), self.max)
+            return self.max
+
+    def to_dict(self) -> Dict:
+        """Kompakt kalıcı biçim: yoğun sayaç listesi + başlangıç indeksi"""
+        with self.lock:
+            data = {"a": self.relative_accuracy, "n": self.count, "z": self.zero_count,
+                    "s": round(self.sum, 3), "lo": self.min, "hi": self.max}
+            if self.buckets:
+                offset = min(self.buckets)
+                data["o"] = offset
+                data["c"] = [self.buckets.get(i, 0) for i in range(offset, max(self.buckets) + 1)]
+            return data
+
+    @classmethod
+    def from_dict(cls, data) -> 'QuantileSketch':
+        """to_dict çıktısından geri yükle"""
+        sketch = cls(relative_accuracy=data.get("a", 0.01))
+        sketch.count = data.get("n", 0)
+        sketch.zero_count = data.get("z", 0)
+        sketch.sum = data.get("s", 0.0)
+        sketch.min = data.get("lo")
+        sketch.max = data.get("hi")
+        offset = data.get("o", 0)
+        sketch.buckets = {offset + i: c for i, c in enumerate(data.get("c", [])) if c}
+        return sketch
+
+class MatchCycleTracker:
+    """Gameflow fazlarından maç döngüsünü (kuyruk -> ready check -> oyun -> oyun sonu) takip eder"""
+
+    PHASE_SPANS = {
+        "Matchmaking": "queue",
+        "ReadyCheck": "ready_check",
+        "ChampSelect": "champ_select",
+        "GameStart": "game_start",
+        "InProgress": "in_game",
+        "WaitingForStats": "post_game",
+        "PreEndOfGame": "post_game",
+        "EndOfGame": "post_game"
+    }
+
+    def __init__(self, tracer=None, clock=time.monotonic, on_measure=None, on_cycle=None):
+        self.tracer = tracer
+        self.clock = clock
+        self.on_measure = on_measure  # callback(name, seconds)
+        self.on_cycle = on_cycle      # callback(record) - döngü bitince geçmiş kaydı
+        self.phase = None
+        self.current = None           # Devam eden döngünün geçmiş kaydı
+
+        # Ölçüm zamanları
+        self.queue_started = None
+        self.ready_check_seen = None
+        self.cycle_started = None
+        self.reached_game = False
+
+    def _measure(self, name, seconds):
+        if seconds < 0:
+            return
+        if self.current is not None:
+            self.current[name] = round(seconds, 3)
+        if self.on_measure:
+            self.on_measure(name, seconds)
+
+    def on_phase(self, phase):
+        """Faz değişimini işle, ölçümleri ve span'leri güncelle"""
+        if phase == self.phase:
+            return
+        now = self.clock()
+        previous_phase = self.phase
+        previous = self.PHASE_SPANS.get(previous_phase)
+        current = self.PHASE_SPANS.get(phase)
+        self.phase = phase
+
+        # Kuyruk bekleme / döngü süresi ölçümleri
+        if phase == "Matchmaking":
+            self.queue_started = now
+        elif phase == "ReadyCheck":
+            if previous_phase == "Matchmaking" and self.queue_started is not None:
+                self._measure("queue_wait", now - self.queue_started)
+            self.queue_started = None
+            self.ready_check_seen = now
+        elif phase == "InProgress":
+            self.reached_game = True
+            if self.current is not None:
+                self.current["played"] = True
+
+        if current and self.cycle_started is None:
+            self.cycle_started = now
+            self.reached_game = False
+            self.current = {"t": round(time.time(), 1)}
+        elif not current and self.cycle_started is not None:
+            if self.reached_game:
+                self._measure("cycle_length", now - self.cycle_started)
+            self._finish_cycle()
+            self.cycle_started = None
+            self.queue_started = None
+
+        if not self.tracer or previous == current:
+            return
+        if previous:
+            self.tracer.end(previous)
+        if current:
+            if not self.tracer.is_open("cycle"):
+                self.tracer.begin("cycle")
+            self.tracer.begin(current, phase=phase)
+        elif self.tracer.is_open("cycle"):
+            # Lobby / bağlantı yok: döngü bitti
+            self.tracer.end("cycle", end_phase=phase)
+
+    def _finish_cycle(self):
+        """Ready check'e ulaşmış döngüyü geçmişe yaz"""
+        record, self.current = self.current, None
+        if record and self.on_cycle and ("queue_wait" in record or record.get("played")):
+            record.setdefault("played", False)
+            self.on_cycle(record)
+
+    def on_accepted(self):
+        """Accept isteği onaylandı - ready check -> accept gecikmesini ölç"""
+        if self.ready_check_seen is not None:
+            self._measure("accept_latency", self.clock() - self.ready_check_seen)
+            self.ready_check_seen = None
+        self.mark("accept_acknowledged")
+
+    def mark(self, name, **args):
+        """Döngü track'ine anlık olay ekle"""
+        if self.tracer:
+            self.tracer.instant(name, tid=Tracer.CYCLE_TID, **args)
+
+class MatchHistory:
+    """Maç döngüsü geçmişi - append-only JSON Lines (satır başına bir döngü)"""
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+    
+    def append(self, record):
+        """Döngü kaydını dosyanın sonuna ekle"""
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self.lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+    
+    def iter_records(self):
+        """Kayıtları sırayla döndür - bozuk satırları atla"""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+    
+    def read_since(self, offset=0):
+        """offset'ten sonraki tam satırları oku -> (kayıtlar, yeni offset)"""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return [], 0
+        end = data.rfind(b"\n") + 1  # Yazılmakta olan yarım satırı bırak
+        records, _ = self._parse_lines(data[:end].splitlines(keepends=True))
+        return records, offset + end
+    
+    def iter_batches(self, offset=0, batch_bytes=1 << 20):
+        """offset'ten itibaren ~batch_bytes'lık parçalar: (kayıtlar, ham satırlar, parça sonu offset'i)
+        
+        Bellek kullanımı dosya boyutundan bağımsız, parça boyutuyla sınırlı.
+        """
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            f.seek(offset)
+            while True:
+                lines = f.readlines(batch_bytes)
+                if lines and not lines[-1].endswith(b"\n"):
+                    lines.pop()  # Yazılmakta olan yarım satır, sonraki turda
+                    if not lines:
+                        return
+                    offset += sum(map(len, lines))
+                    yield (*self._parse_lines(lines), offset)
+                    return
+                if not lines:
+                    return
+                offset += sum(map(len, lines))
+                yield (*self._parse_lines(lines), offset)
+    
+    @staticmethod
+    def _parse_lines(lines):
+        """Satırları ayrıştır -> (kayıtlar, geçerli ham satırlar)"""
+        try:
+            # Tek json.loads çağrısı satır satır ayrıştırmadan belirgin hızlı
+            return json.loads(b"[" + b",".join(lines) + b"]"), lines
+        except ValueError:
+            records, valid = [], []
+            for line in lines:
+                try:
+                    records.append(json.loads(line))
+                    valid.append(line)
+                except ValueError:
+                    continue
+            return records, valid
+    
+    def size(self):
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+class HistoryAnalytics:
+    """Maç geçmişi analitiği - sütun dizileri üzerinde vektörel hesaplar (NumPy)"""
+    
+    ROLLING_WINDOW = 25
+    HOURS_PER_WEEK = 7 * 24
+    QUEUE_NAMES = {
+        400: "Normal Draft", 420: "Ranked Solo/Duo", 430: "Normal Blind",
+        440: "Ranked Flex", 450: "ARAM", 490: "Quickplay", 1700: "Arena", 1900: "URF"
+    }
+    
+    def __init__(self, history):
+        self.history = history
+        self._columns = None
+        self._offset = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def available():
+        return np is not None
+    
+    def load(self):
+        """Geçmişi sütun dizilerine yükle - dosya append-only, sadece yeni satırlar okunur"""
+        with self._lock:
+            if self.history.size() < self._offset:
+                # Dosya silinmiş / kısalmış: baştan oku
+                self._columns, self._offset = None, 0
+            records, self._offset = self.history.read_since(self._offset)
+            if records or self._columns is None:
+                columns = self._to_columns(records)
+                if self._columns is not None:
+                    columns = {key: np.concatenate((self._columns[key], columns[key])) for key in columns}
+                # Append-only dosya normalde zaten sıralı; saat düzeltmelerine karşı garanti
+                if np.any(np.diff(columns["t"]) < 0):
+                    order = np.argsort(columns["t"], kind="stable")
+                    columns = {key: value[order] for key, value in columns.items()}
+                self._columns = columns
+            return self._columns
+    
+    @staticmethod
+    def _to_columns(records):
+        """Kayıt listesini sütun dizilerine çevir (eksik değerler NaN / -1)"""
+        t, queue_id, queue_wait, accept_latency, cycle_length, played = [], [], [], [], [], []
+        nan = float('nan')
+        for record in records:
+            if not isinstance(record, dict) or "t" not in record:
+                continue
+            t.append(record["t"])
+            queue_id.append(record.get("queue_id") or -1)
+            queue_wait.append(record.get("queue_wait", nan))
+            accept_latency.append(record.get("accept_latency", nan))
+            cycle_length.append(record.get("cycle_length", nan))
+            played.append(bool(record.get("played")))
+        columns = {
+            "t": np.array(t, dtype=np.float64),
+            "queue_id": np.array(queue_id, dtype=np.int64),
+            "queue_wait": np.array(queue_wait, dtype=np.float64),
+            "accept_latency": np.array(accept_latency, dtype=np.float64),
+            "cycle_length": np.array(cycle_length, dtype=np.float64),
+            "played": np.array(played, dtype=bool)
+        }
+        return columns
+    
+    @staticmethod
+    def _group_median(groups, values, size):
+        """Grup başına medyan - sıralama + indeksleme, Python döngüsü yok"""
+        order = np.lexsort((values, groups))
+        values = values[order]
+        counts = np.bincount(groups, minlength=size)
+        starts = np.cumsum(counts) - counts
+        result = np.full(size, np.nan)
+        has = counts > 0
+        lo = starts[has] + (counts[has] - 1) // 2
+        hi = starts[has] + counts[has] // 2
+        result[has] = (values[lo] + values[hi]) / 2
+        return result
+    
+    def compute(self, columns=None, utc_offset=None):
+        """Haftanın saati ısı haritası, kayan medyan ve kuyruk tipi kırılımı"""
+        start = time.perf_counter()
+        if columns is None:
+            columns = self.load()
+        if utc_offset is None:
+            utc_offset = time.localtime().tm_gmtoff
+        
+        mask = ~np.isnan(columns["queue_wait"])
+        wait = columns["queue_wait"][mask]
+        local = columns["t"][mask] + utc_offset
+        # 1 Ocak 1970 Perşembe -> Pazartesi = 0
+        weekday = (np.floor_divide(local, 86400).astype(np.int64) + 3) % 7
+        hour = (np.mod(local, 86400) // 3600).astype(np.int64)
+        hour_of_week = weekday * 24 + hour
+        
+        heat_counts = np.bincount(hour_of_week, minlength=self.HOURS_PER_WEEK)
+        heat_median = self._group_median(hour_of_week, wait, self.HOURS_PER_WEEK)
+        
+        if len(wait) >= self.ROLLING_WINDOW:
+            windows = np.lib.stride_tricks.sliding_window_view(wait, self.ROLLING_WINDOW)
+            rolling = np.median(windows, axis=1)
+        else:
+            rolling = np.empty(0)
+        
+        queues = []
+        if len(wait):
+            queue_ids, inverse = np.unique(columns["queue_id"][mask], return_inverse=True)
+            counts = np.bincount(inverse)
+            means = np.bincount(inverse, weights=wait) / counts
+            medians = self._group_median(inverse, wait, len(queue_ids))
+            played = np.bincount(inverse, weights=columns["played"][mask]) / counts
+            queues = [
+                {
+                    "queue_id": int(qid),
+                    "name": self.QUEUE_NAMES.get(int(qid), f"Queue {qid}" if qid >= 0 else "?"),
+                    "count": int(count),
+                    "median_wait": float(median),
+                    "mean_wait": float(mean),
+                    "played_rate": float(rate)
+                }
+                for qid, count, median, mean, rate in zip(queue_ids, counts, medians, means, played)
+            ]
+            queues.sort(key=lambda q: q["count"], reverse=True)
+        
+        return {
+            "cycles": int(len(columns["t"])),
+            "samples": int(len(wait)),
+            "heatmap": heat_median.reshape(7, 24),
+            "heatmap_counts": heat_counts.reshape(7, 24),
+            "rolling_median": rolling,
+            "queues": queues,
+            "elapsed_ms": (time.perf_counter() - start) * 1000
+        }
+
+class StatsExporter:
+    """Maç geçmişi ve metrikleri CSV / JSONL olarak akışla dışa aktarır (sabit bellek)"""
+    
+    FORMATS = ("csv", "jsonl")
+    HISTORY_FIELDS = ("time", "t", "queue_id", "queue_wait", "accept_latency", "cycle_length", "played")
+    METRIC_NAMES = ("queue_wait", "accept_latency", "cycle_length", "post_game")
+    CURSOR_FILE = ".cursors.json"   # Çıktı klasöründe format -> geçmiş offset'i
+    
+    def __init__(self, config, history, resources=None):
+        self.config = config
+        self.history = history
+        self.resources = resources
+        self.lock = threading.Lock()
+        self._last_export = time.monotonic()
+        self.logger = logging.getLogger('BeRightBack')
+    
+    @property
+    def metric_fields(self):
+        fields = ["time", "matches_found", "matches_accepted", "queue_sessions", "history_cursor"]
+        for name in self.METRIC_NAMES:
+            fields += [f"{name}_p50", f"{name}_p90", f"{name}_p99"]
+        return fields + ["cpu_percent", "rss_mb"]
+    
+    def output_dir(self) -> Path:
+        directory = self.config.get('export.directory', '')
+        return Path(directory) if directory else self.config.config_dir / "exports"
+    
+    def history_rows(self, offset=0):
+        """CSV satır parçaları: ([[time, t, ...], ...], parça sonu offset'i)"""
+        fields = self.HISTORY_FIELDS[1:]
+        for records, _, end in self.history.iter_batches(offset):
+            yield [
+                [datetime.fromtimestamp(record.get("t", 0)).isoformat(timespec="seconds")]
+                + [record.get(key) for key in fields]
+                for record in records if isinstance(record, dict)
+            ], end
+    
+    def metrics_row(self, cursor=None) -> Dict:
+        """Sayaçlar, kalıcı sketch'lerden p50/p90/p99 ve kaynak kullanımı - tek satır"""
+        row = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "matches_found": self.config.get('stats.matches_found', 0),
+            "matches_accepted": self.config.get('stats.matches_accepted', 0),
+            "queue_sessions": self.config.get('stats.queue_sessions', 0),
+            "history_cursor": cursor,
+            "cpu_percent": None,
+            "rss_mb": None
+        }
+        sketches = self.config.get('sketches', {})
+        for name in self.METRIC_NAMES:
+            sketch = QuantileSketch.from_dict(sketches[name]) if name in sketches else None
+            for q in (50, 90, 99):
+                row[f"{name}_p{q}"] = round(sketch.quantile(q / 100), 3) if sketch and sketch.count else None
+        latest = self.resources.latest if self.resources else None
+        if latest:
+            row["cpu_percent"] = latest["cpu_percent"]
+            row["rss_mb"] = round(latest["rss_mb"], 1)
+        return row
+    
+    def read_cursor(self, directory, fmt) -> int:
+        """Klasörün imleci; imleç dosyası yoksa eski sürümün config.json'daki imleci (çıktı varsa)"""
+        path = directory / self.CURSOR_FILE
+        try:
+            return json.loads(path.read_text(encoding='utf-8')).get(fmt, 0)
+        except FileNotFoundError:
+            if (directory / f"history.{fmt}").exists():
+                return self.config.get(f'export.cursors.{fmt}', 0)
+            return 0
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.warning(f"⚠️ Dışa aktarma imleci okunamadı ({e}) - baştan aktarılıyor")
+            return 0
+    
+    def write_cursor(self, directory, fmt, cursor):
+        """İmleci çıktının yanına atomik yaz - config.json'a dokunmaz, GUI ile CLI birbirinin ayarlarını ezmez"""
+        path = directory / self.CURSOR_FILE
+        try:
+            cursors = json.loads(path.read_text(encoding='utf-8'))
+            if not isinstance(cursors, dict):
+                cursors = {}
+        except (OSError, ValueError):
+            cursors = {}
+        cursors[fmt] = cursor
+        atomic_write_json(path, cursors)
+    
+    @staticmethod
+    def _open(path, fmt, fields):
+        """Dosyayı ekleme modunda aç -> (dosya, CSV yazıcı veya None)"""
+        new = not path.exists() or path.stat().st_size == 0
+        f = open(path, 'a', encoding='utf-8', newline='')
+        if fmt != "csv":
+            return f, None
+        writer = csv.writer(f)
+        if new:
+            writer.writerow(fields)
+        return f, writer
+    
+    def export(self, fmt=None, full=False, directory=None) -> Dict:
+        """Son imleçten bu yana geçmişi ve bir metrik satırını dışa aktar
+        
+        Artımlı modda history.<fmt> dosyasına eklenir ve formatın imleci ilerler;
+        full=True tüm geçmişi zaman damgalı yeni bir dosyaya yazar, imleç değişmez.
+        """
+        fmt = fmt or self.config.get('export.format', 'csv')
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Bilinmeyen format: {fmt}")
+        directory = Path(directory) if directory else self.output_dir()
+        
+        with self.lock:
+            start = time.perf_counter()
+            directory.mkdir(parents=True, exist_ok=True)
+            cursor = 0 if full else self.read_cursor(directory, fmt)
+            if cursor > self.history.size():
+                # Geçmiş dosyası silinmiş / yeniden oluşturulmuş
+                cursor = 0
+            
+            name = f"history-{datetime.now().strftime('%Y%m%d-%H%M%S')}" if full else "history"
+            history_path = directory / f"{name}.{fmt}"
+            rows = 0
+            end = cursor
+            f, writer = self._open(history_path, fmt, self.HISTORY_FIELDS)
+            with f:
+                if writer:
+                    for batch, end in self.history_rows(cursor):
+                        writer.writerows(batch)
+                        rows += len(batch)
+                else:
+                    for records, lines, end in self.history.iter_batches(cursor):
+                        # Ham satırlar zaten geçerli JSON - yeniden serileştirme yok
+                        f.write(b"".join(lines).decode('utf-8'))
+                        rows += len(records)
+            
+            metrics_path = directory / f"metrics.{fmt}"
+            row = self.metrics_row(end)
+            f, writer = self._open(metrics_path, fmt, self.metric_fields)
+            with f:
+                if writer:
+                    writer.writerow([row.get(key) for key in self.metric_fields])
+                else:
+                    f.write(json.dumps(row, separators=(",", ":"), ensure_ascii=False) + "\n")
+            
+            if not full:
+                self.write_cursor(directory, fmt, end)
+            self._last_export = time.monotonic()
+        
+        return {
+            "format": fmt,
+            "history_rows": rows,
+            "history_file": str(history_path),
+            "metrics_file": str(metrics_path),
+            "cursor": end,
+            "seconds": round(time.perf_counter() - start, 3)
+        }
+    
+    def maybe_export(self) -> Optional[Dict]:
+        """Zamanlanmış dışa aktarma (export.interval_minutes, 0 = kapalı)"""
+        interval = self.config.get('export.interval_minutes', 0)
+        if not interval or time.monotonic() - self._last_export < interval * 60:
+            return None
+        try:
+            result = self.export()
+            self.logger.info(f"💾 Zamanlanmış dışa aktarma: {result['history_rows']} satır -> {result['history_file']}")
+            return result
+        except Exception as e:
+            self._last_export = time.monotonic()
+            self.logger.error(f"❌ Dışa aktarma hatası: {e}")
+            return None
+
+class MetricsRegistry:
+    """Süreç içi sayaçlar ve aralık histogramları - kayıt O(1), okuma push thread'inde"""
+    
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}    # ad -> QuantileSketch (son toplamadan bu yana)
+        self.lock = threading.Lock()
+    
+    def inc(self, name, value=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+    
+    def observe(self, name, value):
+        with self.lock:
+            sketch = self.histograms.get(name)
+            if sketch is None:
+                sketch = self.histograms[name] = QuantileSketch()
+            sketch.add(value)
+    
+    def collect(self) -> Tuple[Dict, Dict]:
+        """(kümülatif sayaçlar, aralığın histogramları) - histogramlar sıfırlanır"""
+        with self.lock:
+            counters = dict(self.counters)
+            histograms, self.histograms = self.histograms, {}
+        return counters, {name: sketch.to_dict() for name, sketch in histograms.items()}
+
+class MetricsPusher:
+    """Opsiyonel filo metrikleri: sayaç / histogram partilerini aralıklarla collector'a gönderir
+    
+    Kabul yolu yalnızca sayaç artırır / sketch'e ekler; toplama, gzip ve ağ kendi thread'inde.
+    Collector'a ulaşılamazken partiler sınırlı kuyrukta bekler, dolunca en eski atılır
+    (sayaçlar kümülatif - kaybolan yalnızca o aralığın histogramlarıdır).
+    """
+    
+    FORMAT = "berightback-metrics"
+    BACKOFF_MAX = 300       # s
+    FINAL_TIMEOUT = 0.1     # s - kapanıştaki son gönderim kapanış süresini uzatmasın
+    
+    def __init__(self, config, sources=(), clock=time.monotonic):
+        self.config = config
+        self.registry = MetricsRegistry()
+        self.sources = list(sources)    # Kümülatif sayaç dict'i döndüren callable'lar
+        self.clock = clock
+        self.pending = deque(maxlen=max(config.get('metrics.buffer', 120), 1))
+        self.machine = config.get('metrics.machine', '') or socket.gethostname()
+        self.instance = os.urandom(6).hex()     # Yeniden başlatmada sayaçlar sıfırlanır - collector ayırt eder
+        self.counters = {"batches": 0, "sent": 0, "failed": 0, "dropped": 0, "rejected": 0, "bytes": 0, "raw_bytes": 0}
+        self.session = None
+        self.thread = None
+        self.seq = 0
+        self._stop_event = threading.Event()
+        self._backoff = 0
+        self._retry_at = 0
+        self.logger = logging.getLogger('BeRightBack')
+    
+    def enabled(self) -> bool:
+        return bool(self.config.get('metrics.endpoint', ''))
+    
+    def start(self) -> bool:
+        """Endpoint ayarlıysa gönderim thread'ini başlat"""
+        if not self.enabled() or self.thread:
+            return False
+        self.session = requests.Session()
+        self._stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="metrics-push", daemon=True)
+        self.thread.start()
+        self.logger.info(
+            f"📡 Metrikler gönderiliyor: {self.config.get('metrics.endpoint')} "
+            f"(her {self.config.get('metrics.interval', 60)} sn, makine {self.machine})"
+        )
+        return True
+    
+    def stop(self):
+        """Bloklamaz - thread son partiyi kısa timeout ile gönderip çıkar"""
+        self._stop_event.set()
+    
+    def _run(self):
+        """Gönderim döngüsü - kaynak / serileştirme hatası thread'i öldürmez"""
+        try:
+            while not self._stop_event.wait(self.config.get('metrics.interval', 60)):
+                try:
+                    self.flush()
+                except Exception:
+                    self.logger.exception("❌ Metrik gönderim hatası")
+            try:
+                self.flush(timeout=self.FINAL_TIMEOUT, force=True)
+            except Exception:
+                self.logger.exception("❌ Son metrik gönderimi başarısız")
+        finally:
+            self.thread = None
+    
+    def collect(self) -> Dict:
+        """Yeni parti: kayıt defteri + kaynakların kümülatif sayaçları"""
+        counters, histograms = self.registry.collect()
+        for source in self.sources:
+            counters.update(source())
+        self.seq += 1
+        return {"seq": self.seq, "time": round(time.time(), 3), "counters": counters, "histograms": histograms}
+    
+    def flush(self, timeout=5.0, force=False) -> bool:
+        """Parti topla ve bekleyenlerle birlikte gönder (backoff süresindeyse yalnızca kuyruğa koy)"""
+        if len(self.pending) == self.pending.maxlen:
+            self.counters["dropped"] += 1
+        self.pending.append(self.collect())
+        self.counters["batches"] += 1
+        if not force and self.clock() < self._retry_at:
+            return False
+        
+        batches = list(self.pending)
+        body = json.dumps({
+            "format": self.FORMAT, "version": 1, "app_version": __version__,
+            "machine": self.machine, "instance": self.instance, "batches": batches
+        }, separators=(",", ":")).encode('utf-8')
+        payload = gzip.compress(body, compresslevel=6)
+        try:
+            response = self.session.post(
+                self.config.get('metrics.endpoint'), data=payload, timeout=(min(1.0, timeout), timeout),
+                headers={"Content-Type": "application/json", "Content-Encoding": "gzip"}
+            )
+            if 400 <= response.status_code < 500:
+                # Collector partileri reddediyor - tekrar göndermek işe yaramaz
+                self.counters["rejected"] += len(batches)
+                self.pending.clear()
+                self.logger.error(f"❌ Metrik collector partileri reddetti: HTTP {response.status_code}")
+                return False
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.counters["failed"] += 1
+            interval = self.config.get('metrics.interval', 60)
+            if not self._backoff:
+                self.logger.warning(f"⚠️ Metrik collector'a ulaşılamıyor ({type(e).__name__}) - partiler bekletiliyor")
+            self._backoff = min(max(self._backoff * 2, interval), self.BACKOFF_MAX)
+            self._retry_at = self.clock() + self._backoff
+            return False
+        
+        for _ in batches:
+            self.pending.popleft()
+        self.counters["sent"] += len(batches)
+        self.counters["bytes"] += len(payload)
+        self.counters["raw_bytes"] += len(body)
+        if self._backoff:
+            self.logger.info(f"📡 Metrik collector'a yeniden ulaşıldı: {len(batches)} parti gönderildi")
+            self._backoff, self._retry_at = 0, 0
+        return True
+    
+    def report(self) -> Dict:
+        return {**self.counters, "pending": len(self.pending), "machine": self.machine, "instance": self.instance}
+
+class ChampSelectAssistant:
+    """Şampiyon seçimi: öncelik listesinden ban / hover / kilitle
+    
+    Şampiyon indeksi (isim -> id) ve sahip olunan şampiyonlar bağlantı başına bir kez kurulur;
+    sıra geldiğinde karar yalnızca küme / sözlük aramasıdır.
+    """
+    
+    INTERVAL = 0.2      # Champ select'te oturum sorgulama aralığı (sn)
+    MAX_FAILURES = 3    # Aynı aksiyon için en fazla başarısız istek
+    
+    def __init__(self, client, config, on_action=None):
+        self.client = client
+        self.config = config
+        self.on_action = on_action  # callback(kind, champion_id, latency)
+        self.enabled = config.get('champ_select.enabled', False)
+        self.session_key = None     # İndeksin kurulduğu bağlantı (port, token)
+        self.index = {}             # normalize isim / alias -> id
+        self.names = {}             # id -> isim
+        self.owned = set()
+        self.pick_ids = []
+        self.ban_ids = []
+        self.index_ms = None
+        self.done = set()           # Bu champ select'te tamamlanan aksiyonlar
+        self.failures = {}
+        self.decisions = deque(maxlen=200)
+        self.logger = logging.getLogger('BeRightBack')
+    
+    @staticmethod
+    def normalize(name) -> str:
+        return "".join(ch for ch in str(name).lower() if ch.isalnum())
+    
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self.config.set('champ_select.enabled', enabled)
+    
+    def set_lists(self, picks, bans):
+        """Öncelik listelerini kaydet ve indekse göre yeniden çöz"""
+        self.config.set('champ_select.picks', list(picks))
+        self.config.set('champ_select.bans', list(bans))
+        if self.index:
+            self._resolve()
+    
+    def _ensure_index(self) -> bool:
+        """İndeks ve sahip olunan şampiyonlar bu bağlantı için kurulu mu - değilse bir kez kur"""
+        key = (self.client.port, self.client.token)
+        if key == self.session_key:
+            return True
+        started = time.perf_counter()
+        summary = self.client.get_champion_summary()
+        owned = self.client.get_owned_champions()
+        if summary is None or owned is None:
+            return False
+        index, names = {}, {}
+        for champion in summary:
+            champion_id = champion.get("id", -1)
+            if champion_id <= 0:
+                continue
+            names[champion_id] = champion.get("name", str(champion_id))
+            index[self.normalize(champion.get("alias", ""))] = champion_id
+            index[self.normalize(champion.get("name", ""))] = champion_id
+        self.index = index
+        self.names = names
+        self.owned = {champion["id"] for champion in owned
+                      if champion.get("ownership", {}).get("owned", True)}
+        self.session_key = key
+        self._resolve()
+        self.index_ms = round((time.perf_counter() - started) * 1000, 2)
+        self.logger.info(f"📚 Şampiyon indeksi hazır: {len(names)} şampiyon, {len(self.owned)} sahip olunan")
+        return True
+    
+    def _resolve(self):
+        """Yapılandırılan isimleri id'lere çevir"""
+        def resolve(names):
+            ids = []
+            for name in names:
+                champion_id = self.index.get(self.normalize(name))
+                if champion_id is None:
+                    self.logger.warning(f"⚠️ Bilinmeyen şampiyon: {name}")
+                elif champion_id not in ids:
+                    ids.append(champion_id)
+            return ids
+        self.pick_ids = resolve(self.config.get('champ_select.picks', []))
+        self.ban_ids = resolve(self.config.get('champ_select.bans', []))
+    
+    def decide(self, session) -> Optional[Tuple[Dict, int, bool]]:
+        """Oturumdan sıradaki aksiyonu seç: (aksiyon, şampiyon, kilitle) ya da None"""
+        cell = session.get("localPlayerCellId")
+        taken = set()
+        mine = []
+        for step in session.get("actions", []):
+            for action in step:
+                if action.get("actorCellId") == cell and not action.get("completed"):
+                    mine.append(action)
+                elif action.get("completed") and action.get("championId"):
+                    taken.add(action["championId"])
+        # Takım arkadaşlarının seçmek istediklerini banlama
+        ally_intents = {member.get("championPickIntent") or member.get("championId")
+                        for member in session.get("myTeam", []) if member.get("cellId") != cell}
+        
+        for action in mine:
+            if action["id"] in self.done or self.failures.get(action["id"], 0) >= self.MAX_FAILURES:
+                continue
+            if action.get("type") == "ban":
+                if not action.get("isInProgress"):
+                    continue
+                champion_id = next((c for c in self.ban_ids if c not in taken and c not in ally_intents), None)
+            elif action.get("type") == "pick":
+                champion_id = next((c for c in self.pick_ids if c not in taken and c in self.owned), None)
+                if not action.get("isInProgress"):
+                    # Sıra gelmeden hover - takıma niyet göster
+                    if (champion_id and action.get("championId") != champion_id and
+                            self.config.get('champ_select.hover', True)):
+                        return action, champion_id, False
+                    continue
+            else:
+                continue
+            return (action, champion_id, True) if champion_id else None
+        return None
+    
+    def step(self, now, phase) -> Optional[float]:
+        """Champ select'teyse oturumu oku ve gerekiyorsa aksiyon gönder"""
+        if phase != "ChampSelect":
+            if self.done or self.failures:
+                self.done.clear()
+                self.failures.clear()
+            return None
+        if not self._ensure_index():
+            return self.INTERVAL
+        session = self.client.get_champ_select_session()
+        if not session:
+            return self.INTERVAL
+        
+        seen = time.perf_counter()
+        decision = self.decide(session)
+        if decision is None:
+            # Sıra değişimi fazın bitişine denk gelir - bir sonraki okumayı oraya hizala
+            left = session.get("timer", {}).get("adjustedTimeLeftInPhase")
+            return min(self.INTERVAL, left / 1000 + 0.01) if left else self.INTERVAL
+        action, champion_id, complete = decision
+        decided = time.perf_counter()
+        success = self.client.patch_champ_select_action(action["id"], champion_id, complete)
+        posted = time.perf_counter()
+        if not success:
+            self.failures[action["id"]] = self.failures.get(action["id"], 0) + 1
+            return self.INTERVAL
+        
+        kind = action["type"] if complete else "hover"
+        self.decisions.append({
+            "kind": kind, "championId": champion_id,
+            "decide_us": round((decided - seen) * 1e6, 1),
+            "post_ms": round((posted - decided) * 1000, 2)
+        })
+        if complete:
+            self.done.add(action["id"])
+            self.logger.info(f"🔒 {'Ban' if kind == 'ban' else 'Kilitlendi'}: {self.names.get(champion_id, champion_id)}")
+        if self.on_action:
+            self.on_action(kind, champion_id, posted - seen)
+        return self.INTERVAL
+    
+    def report(self) -> Dict:
+        def stats(values):
+            return {"mean": round(sum(values) / len(values), 2), "max": round(max(values), 2)} if values else None
+        return {
+            "actions": {kind: sum(1 for d in self.decisions if d["kind"] == kind) for kind in ("ban", "hover", "pick")},
+            "index_ms": self.index_ms,
+            "decide_us": stats([d["decide_us"] for d in self.decisions]),
+            "post_ms": stats([d["post_ms"] for d in self.decisions])
+        }
+
+class EndOfGameSkipper:
+    """Oyun sonu ekranlarını (onur, istatistik) LCU üzerinden geçip lobby'ye döner
+    
+    Adımlar oyun bitişinden (ilk oyun sonu fazı) itibaren zamanlanır; lobby'ye
+    dönüldüğünde otomatik arama devralır.
+    """
+    
+    PHASES = ("WaitingForStats", "PreEndOfGame", "EndOfGame")
+    STEP_INTERVAL = 0.5
+    MAX_ATTEMPTS = 3
+    
+    def __init__(self, client, config, clock=time.monotonic, on_step=None, on_finish=None):
+        self.client = client
+        self.config = config
+        self.clock = clock
+        self.on_step = on_step      # callback(step, seconds)
+        self.on_finish = on_finish  # callback(run) - lobby'ye dönüldü
+        self.enabled = config.get('end_of_game.skip', False)
+        self.run = None
+        self.runs = deque(maxlen=50)
+        self.logger = logging.getLogger('BeRightBack')
+    
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self.config.set('end_of_game.skip', enabled)
+        self.run = None
+    
+    def step(self, now, phase) -> Optional[float]:
+        """Oyun sonu fazındaysa sıradaki ekranı geç; fazdayken kısa kontrol aralığı döndür"""
+        if phase not in self.PHASES:
+            if self.run is not None:
+                self._finish(now, phase)
+            return None
+        if self.run is None:
+            self.run = {"started": now, "steps": {}, "attempts": {}}
+        
+        done = len(self.run["steps"])
+        if phase == "PreEndOfGame":
+            self._do("honor", self.client.skip_honor, now)
+        elif phase == "EndOfGame":
+            if self._do("dismiss_stats", self.client.dismiss_stats, now):
+                self._do("play_again", self.client.play_again, now)
+        # WaitingForStats: istatistikler gelene kadar yapılacak bir şey yok
+        # Bir adım tamamlandıysa sıradaki ekran hemen gelir - beklemeden kontrol et
+        return 0 if len(self.run["steps"]) > done else self.STEP_INTERVAL
+    
+    def _do(self, name, action, now) -> bool:
+        """Adımı bir kez çalıştır; başarısızsa sonraki kontrolde tekrar dene"""
+        run = self.run
+        if name in run["steps"]:
+            return True
+        attempts = run["attempts"].get(name, 0)
+        if attempts >= self.MAX_ATTEMPTS:
+            return False
+        run["attempts"][name] = attempts + 1
+        if not action():
+            if attempts + 1 >= self.MAX_ATTEMPTS:
+                self.logger.warning(f"⚠️ Oyun sonu adımı başarısız: {name}")
+            return False
+        elapsed = self.clock() - run["started"]
+        run["steps"][name] = round(elapsed, 3)
+        if self.on_step:
+            self.on_step(name, elapsed)
+        return True
+    
+    def _finish(self, now, phase):
+        run, self.run = self.run, None
+        run["total"] = round(now - run["started"], 3)
+        run["result"] = phase
+        del run["attempts"]
+        self.runs.append(run)
+        if phase == "Lobby" and run["steps"]:
+            self.logger.info(f"🏁 Oyun sonu ekranları geçildi: {run['total']:.1f} sn sonra lobby'de")
+        if self.on_finish:
+            self.on_finish(run)
+    
+    def report(self) -> Dict:
+        totals = [run["total"] for run in self.runs if run["result"] == "Lobby"]
+        return {
+            "games": len(self.runs),
+            "mean_seconds_to_lobby": round(sum(totals) / len(totals), 2) if totals else None,
+            "runs": list(self.runs)
+        }
+
+class AutoQueue:
+    """Faz tetiklemeli otomatik maç arama
+    
+    Sabit geri sayım yerine gameflow fazını ve lobby durumunu izler; lobby aranabilir
+    olduğu anda (isteğe bağlı en az min_delay sonra) matchmaking başlatır.
+    """
+    
+    RETRY_DELAY = 2.0
+    # Kullanıcı aramayı kendisi iptal ettiyse bir sonraki oyuna kadar tekrar arama
+    CANCEL_TRANSITIONS = {("Matchmaking", "Lobby"), ("ReadyCheck", "Lobby")}
+    
+    def __init__(self, client, config, clock=time.monotonic, on_search=None):
+        self.client = client
+        self.config = config
+        self.clock = clock
+        self.on_search = on_search  # callback(dead_time, saved)
+        self.enabled = config.get('auto_queue.enabled', False)
+        self.phase = None
+        self.lobby_since = None     # Lobby'ye giriş (ya da modun açılması)
+        self.next_attempt = 0.0
+        self.attempts = 0
+        self.held = False           # İptal / deneme limiti: lobby'den çıkana kadar bekle
+        
+        # Oturum metrikleri
+        self.searches = 0
+        self.dead_times = []
+        self.saved_seconds = 0.0
+        
+        self.logger = logging.getLogger('BeRightBack')
+    
+    def set_enabled(self, enabled):
+        """Modu aç/kapat (config'e kaydedilir)"""
+        self.enabled = enabled
+        self.config.set('auto_queue.enabled', enabled)
+        self.lobby_since = None
+        self.held = False
+        self.attempts = 0
+        self.next_attempt = 0.0
+    
+    def step(self, now, phase) -> Optional[float]:
+        """Faz gözlemini işle; lobby'de beklerken bir sonraki kontrol için süre döndür"""
+        previous, self.phase = self.phase, phase
+        if phase != "Lobby":
+            self.lobby_since = None
+            self.held = False
+            self.attempts = 0
+            self.next_attempt = 0.0
+            return None
+        
+        if (previous, phase) in self.CANCEL_TRANSITIONS and not self.held:
+            self.held = True
+            self.logger.info("✋ Arama iptal edildi - otomatik arama bir sonraki oyuna kadar beklemede")
+        if self.held:
+            return None
+        if self.lobby_since is None:
+            self.lobby_since = now
+        
+        min_delay = self.config.get('auto_queue.min_delay', 0)
+        wait = max(self.lobby_since + min_delay - now, self.next_attempt - now)
+        if wait > 0:
+            return wait
+        
+        lobby = self.client.get_lobby()
+        if not lobby or not lobby.get("canStartActivity"):
+            # Parti üyeleri henüz hazır değil - bir sonraki faz kontrolünde tekrar bak
+            return None
+        
+        if self.client.start_matchmaking():
+            dead_time = self.clock() - self.lobby_since
+            baseline = self.config.get('auto_queue.baseline_seconds', 300)
+            saved = max(baseline - dead_time, 0.0)
+            self.searches += 1
+            self.dead_times.append(dead_time)
+            self.saved_seconds += saved
+            self.logger.info(f"⚡ Lobby hazır - {dead_time:.1f} sn sonra aramaya girildi")
+            # Faz Matchmaking'e dönene kadar ikinci POST'u engelle
+            self.attempts = 0
+            self.next_attempt = now + self.RETRY_DELAY
+            if self.on_search:
+                self.on_search(dead_time, saved)
+            return None
+        
+        self.attempts += 1
+        max_retries = self.config.get('auto_queue.max_retries', 3)
+        if self.attempts >= max_retries:
+            self.held = True
+            self.logger.warning(f"⚠️ Matchmaking {self.attempts} denemede başlatılamadı - lobby'den çıkana kadar beklemede")
+            return None
+        self.next_attempt = now + self.RETRY_DELAY * self.attempts
+        self.logger.warning(f"🔁 Matchmaking reddedildi, {self.RETRY_DELAY * self.attempts:.0f} sn sonra tekrar denenecek")
+        return self.next_attempt - now
+    
+    def report(self) -> Dict:
+        """Oturum özeti"""
+        return {
+            "searches": self.searches,
+            "mean_dead_time": round(sum(self.dead_times) / len(self.dead_times), 2) if self.dead_times else None,
+            "saved_seconds": round(self.saved_seconds, 1)
+        }
+
+class QueueStatus:
+    """Matchmaking sırasında kuyrukta geçen ve tahmini kuyruk süresi
+    
+    /lol-matchmaking/v1/search yalnızca faz kontrolü Matchmaking gördüğünde sorgulanır: girişte
+    bir kez, sonra en fazla REFRESH sn'de bir (tahmin değişebilir). Aradaki saniyeleri arayüz
+    yerel saatle ilerletir; başka hiçbir fazda istek atılmaz.
+    """
+    
+    REFRESH = 10.0
+    
+    def __init__(self, client, config, on_update=None):
+        self.client = client
+        self.enabled = config.get('queue_status.enabled', True)
+        self.on_update = on_update  # callback(durum veya None)
+        self.status = None          # {"time_in_queue", "estimated", "queue_id"}
+        self.fetched_at = None
+        self.requests = 0
+    
+    def on_phase(self, now, phase, fetch=True):
+        """Faz kontrolünden sonra çağrılır (fetch=False: yalnızca çıkışı işle, istek atma)"""
+        if phase != "Matchmaking":
+            if self.fetched_at is not None:
+                self.status = self.fetched_at = None
+                if self.on_update:
+                    self.on_update(None)
+            return
+        if not self.enabled or not fetch:
+            return
+        if self.fetched_at is not None and now - self.fetched_at < self.REFRESH:
+            return
+        self.fetched_at = now
+        self.requests += 1
+        search = self.client.get_matchmaking_search()
+        if not search or search.get("searchState", "Searching") != "Searching":
+            return
+        self.status = {
+            "time_in_queue": float(search.get("timeInQueue") or 0),
+            "estimated": search.get("estimatedQueueTime") or None,
+            "queue_id": search.get("queueId")
+        }
+        if self.on_update:
+            self.on_update(self.status)
+
+class HookRunner:
+    """Maç olaylarında kullanıcı komutları / Python çağrıları (ses, bildirim, script)
+
+    Bus olayı yayıncı thread'inde yalnızca kuyruğa alınır; hook'lar sınırlı bir worker havuzunda
+    zaman aşımıyla çalışır. Kuyruk doluysa çağrı atılır, asılı kalan worker'ı ayrı bir denetçi
+    thread havuzdan çıkarıp yerine yenisini açar - yavaş ya da takılan bir hook kabul yolunu
+    hiçbir zaman bekletmez.
+    """
+
+    HOOK_EVENTS = ("match_found", "accepted", "champ_select", "game_start")
+    PHASE_HOOKS = {"ChampSelect": "champ_select", "InProgress": "game_start"}
+    MAX_REPLACEMENTS = 4    # Asılı Python hook'ları yerine açılabilecek en fazla ek worker
+    REAP_INTERVAL = 0.5     # Asılı worker denetimi (saniye)
+
+    def __init__(self, config, bus):
+        self.config = config
+        self.bus = bus
+        self.callables = {event: [] for event in self.HOOK_EVENTS}
+        self.jobs = None
+        self.threads = set()        # Havuzdaki worker'lar
+        self.abandoned = set()      # Zaman aşımına uğramış Python hook'unda asılı worker'lar
+        self.busy = {}              # worker -> (başlangıç, hook adı)
+        self.lock = threading.Lock()
+        self.subscription = None
+        self.stopping = None        # Denetçi thread'in durdurma olayı
+        self.metrics = {}           # hook adı -> sayaçlar + süre sketch'i
+        self.dropped = 0
+        self.logger = logging.getLogger('BeRightBack')
+
+    def register(self, event, callback):
+        """Python hook'u ekle: callback(olay, veri) - worker thread'inde çağrılır"""
+        if event not in self.callables:
+            raise ValueError(f"Bilinmeyen hook olayı: {event}")
+        self.callables[event].append(callback)
+        if self.subscription:
+            self._fill_pool()
+
+    def _hooks(self, event):
+        """Olayın hook'ları: (ad, komut ya da callable)"""
+        commands = self.config.get('hooks.commands', {}).get(event) or []
+        hooks = [(command if isinstance(command, str) else " ".join(command), command) for command in commands]
+        hooks += [(getattr(callback, "__name__", repr(callback)), callback) for callback in self.callables[event]]
+        return hooks
+
+    def configured(self) -> bool:
+        return any(self._hooks(event) for event in self.HOOK_EVENTS)
+
+    def start(self):
+        """Bus'a abone ol; hook varsa worker'ları önceden aç (kabul yolunda thread açılmasın)"""
+        if self.subscription:
+            return
+        self.jobs = queue.Queue(maxsize=self.config.get('hooks.queue', 16))
+        # Teslimat yayıncı thread'inde: _on_event yalnızca kuyruğa koyar
+        self.subscription = self.bus.subscribe(
+            self._on_event, kinds=("ready_check", "accepted", "phase_changed"), maxsize=64,
+            notify=lambda subscription: subscription.drain()
+        )
+        self._fill_pool()
+        self.stopping = threading.Event()
+        threading.Thread(target=self._reaper, args=(self.stopping,), name="hook-reaper", daemon=True).start()
+
+    def stop(self):
+        """Abonelikten çık, boştaki worker'ları kapat (çalışan hook'lar beklenmez)"""
+        if not self.subscription:
+            return
+        self.bus.unsubscribe(self.subscription)
+        self.subscription = None
+        self.stopping.set()
+        with self.lock:
+            workers = len(self.threads)
+            self.threads.clear()
+        for _ in range(workers):
+            try:
+                self.jobs.put_nowait(None)
+            except queue.Full:
+                break
+
+    def _fill_pool(self):
+        """Havuzu ayarlanan worker sayısına tamamla"""
+        if not self.configured():
+            return
+        with self.lock:
+            missing = self.config.get('hooks.workers', 2) - len(self.threads)
+            # Asılı worker'lar da thread tutar - yenileme sayısı sınırlı
+            missing = min(missing, self.MAX_REPLACEMENTS - len(self.abandoned))
+            for _ in range(max(missing, 0)):
+                thread = threading.Thread(target=self._worker, name="hook-worker", daemon=True)
+                self.threads.add(thread)
+                thread.start()
+
+    def _on_event(self, event):
+        """Bus olayı -> hook olayı; çağrılar kuyruğa alınır"""
+        if event.kind == "ready_check":
+            hook_event = "match_found"
+        elif event.kind == "accepted":
+            hook_event = "accepted"
+        else:
+            hook_event = self.PHASE_HOOKS.get(event.data["phase"])
+        if hook_event is None:
+            return
+        hooks = self._hooks(hook_event)
+        if not hooks:
+            return
+        for name, hook in hooks:
+            try:
+                self.jobs.put_nowait((name, hook, hook_event, event.data))
+            except queue.Full:
+                with self.lock:
+                    self.dropped += 1
+                    self._metric(name)["dropped"] += 1
+
+    def _reaper(self, stopping):
+        """Denetçi thread - asılı worker'ları periyodik olarak yenile (yayıncı thread'inde değil)"""
+        while not stopping.wait(self.REAP_INTERVAL):
+            try:
+                self._reap_hung()
+            except Exception:
+                self.logger.exception("❌ Hook denetçi hatası")
+
+    def _reap_hung(self):
+        """Zaman aşımını geçen Python hook'larının worker'larını havuzdan çıkar, yenisini aç"""
+        timeout = self.config.get('hooks.timeout', 10)
+        now = time.monotonic()
+        with self.lock:
+            hung = [(thread, name) for thread, (started, name) in self.busy.items()
+                    if thread in self.threads and now - started > timeout]
+            for thread, name in hung:
+                self.threads.discard(thread)
+                self.abandoned.add(thread)
+                self._metric(name)["timeouts"] += 1
+        for thread, name in hung:
+            self.logger.warning(f"⏱️ Hook zaman aşımı ({name}) - worker yenileniyor")
+        if hung:
+            self._fill_pool()
+
+    def _metric(self, name):
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = {
+                "runs": 0, "failures": 0, "timeouts": 0, "dropped": 0, "durations": QuantileSketch()
+            }
+        return metric
+
+    def _worker(self):
+        """Hook worker'ı - kuyruktan çalıştır, süreyi ve sonucu kaydet"""
+        me = threading.current_thread()
+        timeout = self.config.get('hooks.timeout', 10)
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            name, hook, event, data = job
+            started = time.monotonic()
+            with self.lock:
+                self.busy[me] = (started, name)
+            outcome = None
+            try:
+                if callable(hook):
+                    hook(event, data)
+                elif self._run_command(hook, event, data, timeout) != 0:
+                    outcome = "failures"
+            except subprocess.TimeoutExpired:
+                outcome = "timeouts"
+                self.logger.warning(f"⏱️ Hook zaman aşımı ({name}) - süreç sonlandırıldı")
+            except Exception:
+                outcome = "failures"
+                self.logger.exception(f"❌ Hook hatası ({name})")
+            with self.lock:
+                del self.busy[me]
+                metric = self._metric(name)
+                metric["runs"] += 1
+                metric["durations"].add(time.monotonic() - started)
+                if outcome:
+                    metric[outcome] += 1
+                if me in self.abandoned:
+                    # Zaman aşımı zaten sayıldı, yerine yeni worker açıldı
+                    self.abandoned.discard(me)
+                    return
+                if me not in self.threads:
+                    return
+
+    @staticmethod
+    def _run_command(command, event, data, timeout) -> int:
+        """Komutu kendi süreç grubunda çalıştır; zaman aşımında grubu öldür"""
+        if isinstance(command, str) and os.name != "nt":
+            command = shlex.split(command)
+        env = dict(os.environ, BRB_EVENT=event, BRB_DATA=json.dumps(data))
+        if os.name == "nt":
+            options = {"creationflags": subprocess.CREATE_NO_WINDOW}
+        else:
+            options = {"start_new_session": True}
+        process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL, env=env, **options)
+        try:
+            return process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            if os.name == "nt":
+                process.kill()
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+            raise
+
+    def report(self) -> Dict[str, Any]:
+        """Hook başına çalışma / hata / zaman aşımı / atılan ve süre dağılımı"""
+        hooks = {}
+        with self.lock:
+            for name, metric in self.metrics.items():
+                durations = metric["durations"]
+                hooks[name] = {
+                    **{key: value for key, value in metric.items() if key != "durations"},
+                    "p50_ms": round(durations.quantile(0.5) * 1000, 1) if durations.count else None,
+                    "p90_ms": round(durations.quantile(0.9) * 1000, 1) if durations.count else None,
+                    "max_ms": round(durations.max * 1000, 1) if durations.count else None
+                }
+            return {
+                "hooks": hooks,
+                "dropped": self.dropped,
+                "workers": len(self.threads),
+                "hung_workers": len(self.abandoned)
+            }
+
+class MonitorEngine:
+    """LoL Client izleme motoru - bağlantı, oyun durumu ve ready check takibi"""
+
+    ACTIVE_INTERVAL = 1.5       # Auto accept açıkken ready check aralığı
+    CONNECTION_INTERVAL = 3     # Bağlantı / oyun durumu kontrol aralığı
+    IDLE_INTERVAL = 15          # Idle modda düşük frekanslı canlılık kontrolü
+    DISCOVERY_INTERVAL = 60     # Client olayla izlenirken bağlantı yokken yedek tarama aralığı
+    EXEC_RETRY_INTERVAL = 0.25  # Client süreci başladı, LCU henüz dinlemiyor olabilir
+    EXEC_RETRY_WINDOW = 30
+    RECONNECT_WINDOW = 60       # Bağlantı koptuktan sonra hızlı yeniden keşif süresi
+    RECONNECT_MIN = 0.1         # Yeniden keşif: lockfile her 0.1 sn, süreç taraması 0.2, 0.4, ... en fazla 1 sn
+    RECONNECT_MAX = 1.0
+    CLOCK_JUMP = 5.0            # Duvar saati / beklenen uyanma farkı bunu aşarsa uykudan dönülmüştür
+    ERROR_INTERVAL = 3          # Turda beklenmeyen hata: izleme bu aralıkla sürer
+
+    def __init__(self, client, config, meter=None, resources=None, profiler=None, tracer=None,
+                 history=None, exporter=None, bus=None):
+        self.client = client
+        self.config = config
+        self.bus = bus or EventBus()
+        self.hooks = HookRunner(config, self.bus)
+        self.pusher = MetricsPusher(config, sources=[self._metric_counters])
+        self.metrics = None     # Gönderim açıksa pusher'ın kayıt defteri
+        self.meter = meter or ActivityMeter()
+        self.resources = resources
+        self.profiler = profiler
+        self.tracer = tracer
+        self.history = history
+        self.exporter = exporter
+        self.auto_queue = AutoQueue(client, config, clock=lambda: self.clock(), on_search=self._on_auto_queue)
+        self.champ_select = ChampSelectAssistant(client, config, on_action=self._on_champ_select_action)
+        self.queue_status = QueueStatus(client, config, on_update=self._on_queue_status)
+        self.end_of_game = EndOfGameSkipper(client, config, clock=lambda: self.clock(),
+                                            on_step=self._on_end_of_game_step,
+                                            on_finish=self._on_end_of_game_finish)
+        self.cycles = MatchCycleTracker(tracer, clock=lambda: self.clock(),
+                                        on_measure=self.record_measurement, on_cycle=self._on_cycle_complete)
+        if tracer:
+            client.tracer = tracer
+        for directory in config.get('client.install_dirs', []):
+            if Path(directory) not in client.install_dirs:
+                client.install_dirs.append(Path(directory))
+        self.sketches = {
+            name: QuantileSketch.from_dict(data) for name, data in config.get('sketches', {}).items()
+        }
+
+        # State
+        self.auto_accept_running = False
+        self.idle = False
+        self.last_ready_check_id = None  # Son kabul edilen ready check ID'si
+        self.waiting_for_others = False  # Diğer oyuncuları bekleme durumu
+
+        self.monitor_thread = None
+        self.poll_errors = 0
+        self.running = False
+        self.clock = time.monotonic  # Replay sanal saat ile değiştirebilir
+        self._wake_event = threading.Event()
+        self._last_connection_check = 0
+        self.watcher = None
+        self._discovery_until = 0       # Süreç başlangıcından sonra hızlı bağlanma denemesi bitişi
+        self._verify_connection = False  # lockfile değişti / silindi - bağlantıyı hemen doğrula
+        self.wall_clock = time.time      # Uyku tespiti için (testte ileri sarılabilir)
+        self._last_poll = None           # (monotonic, duvar saati, beklenen bekleme) - gerçek zaman
+        self._reconnect_since = None
+        self._reconnect_attempts = 0
+        self._next_scan = 0              # Yeniden keşifte sıradaki süreç taraması
+        self._last_state = (False, False)
+        self._last_phase = None
+
+        # Logger
+        self.logger = logging.getLogger('BeRightBack')
+
+    def start(self):
+        """İzleme thread'ini başlat"""
+        self._start_watcher()
+        self.hooks.start()
+        if self.pusher.start():
+            self.metrics = self.client.metrics = self.pusher.registry
+        self.running = True
+        self.monitor_thread = threading.Thread(target=self._monitor_worker, daemon=True)
+        self.monitor_thread.start()
+
+    def stop(self, timeout=None):
+        """İzleme thread'ini durdur"""
+        self.running = False
+        if self.watcher:
+            self.watcher.stop()
+        self.hooks.stop()
+        self.pusher.stop()
+        self.wake()
+        if self.monitor_thread and timeout is not None:
+            self.monitor_thread.join(timeout)
+
+    def wake(self):
+        """Bekleyen izleme döngüsünü hemen uyandır"""
+        self._wake_event.set()
+
+    def _start_watcher(self):
+        """Destekleniyorsa client açılışını olayla izle"""
+        if not self.config.get('client.watch', True) or not ClientWatcher.available():
+            return
+        watcher = ClientWatcher(self.client.install_dirs, self._on_client_event)
+        if watcher.start():
+            self.watcher = watcher
+
+    def _on_client_event(self, source, value):
+        """Watcher thread'inden: lockfile / süreç olayı - bağlantı kontrolünü hemen yap"""
+        self.meter.wakeup("watcher")
+        if source == "exec":
+            self._discovery_until = self.clock() + self.EXEC_RETRY_WINDOW
+        elif source != "stopped":   # stopped: watcher öldü, uyanan tur zamanlı taramaya geçer
+            # lockfile silindi / başka client yazdı - bayat porta istek atmadan doğrula
+            self._verify_connection = True
+        self._last_connection_check = float('-inf')
+        self.wake()
+
+    def set_idle(self, idle):
+        """Idle modu aç/kapat"""
+        if idle == self.idle:
+            return
+        self.idle = idle
+        if not idle:
+            # Restore'da bağlantı durumunu beklemeden tazele
+            self._last_connection_check = 0
+            self.wake()
+
+    def set_auto_accept(self, running):
+        """Auto accept durumunu ayarla"""
+        self.auto_accept_running = running
+        self.wake()
+    
+    def set_auto_queue(self, enabled):
+        """Faz tetiklemeli otomatik aramayı aç/kapat"""
+        self.auto_queue.set_enabled(enabled)
+        self._last_connection_check = 0
+        self.wake()
+    
+    def set_champ_select(self, enabled):
+        """Şampiyon seçimi asistanını aç/kapat"""
+        self.champ_select.set_enabled(enabled)
+        self._last_connection_check = 0
+        self.wake()
+    
+    def set_end_of_game_skip(self, enabled):
+        """Oyun sonu ekranlarını otomatik geçmeyi aç/kapat"""
+        self.end_of_game.set_enabled(enabled)
+        self._last_connection_check = 0
+        self.wake()
+
+    def _monitor_worker(self):
+        """İzleme worker thread - idle farkında"""
+        while self.running:
+            try:
+                if self.profiler:
+                    interval = self.profiler.run("monitor", self.poll_once)
+                else:
+                    interval = self.poll_once()
+            except Exception:
+                # Tek turdaki hata (dışa aktarma G/Ç, hook, trace...) izlemeyi sessizce bitirmesin
+                self.poll_errors += 1
+                if self.metrics:
+                    self.metrics.inc("engine.poll_errors")
+                self.logger.exception("💥 İzleme turunda beklenmeyen hata - izleme devam ediyor")
+                interval = self.ERROR_INTERVAL
+            self._wake_event.wait(interval)
+            self._wake_event.clear()
+            self.meter.wakeup("monitor")
+
+    def _check_clock_jump(self):
+        """Uykudan dönüş: duvar saati monotonic saatten ileri kaçtıysa ya da uyanma çok geç geldiyse
+        
+        Bayat port / token ile art arda zaman aşımı beklemek yerine bağlantı hemen yeniden kurulur.
+        """
+        mono, wall = time.monotonic(), self.wall_clock()
+        last = self._last_poll
+        if last is None:
+            return
+        elapsed = mono - last[0]
+        jump = (wall - last[1]) - elapsed
+        late = elapsed - last[2]
+        if abs(jump) > self.CLOCK_JUMP or late > self.CLOCK_JUMP:
+            self.logger.info(f"⏰ Uykudan dönüldü ({max(abs(jump), late):.0f} sn) - bağlantı yenileniyor")
+            if self.client.connected:
+                self.client.reset_connection("uykudan dönüş")
+            self._last_connection_check = float('-inf')
+
+    def poll_once(self) -> float:
+        """Tek izleme adımı, bir sonraki bekleme süresini döndürür"""
+        started = time.perf_counter()
+        self._check_clock_jump()
+        interval = self._poll()
+        self._last_poll = (time.monotonic(), self.wall_clock(), interval)
+        if self.metrics:
+            self.metrics.observe("engine.poll_ms", (time.perf_counter() - started) * 1000)
+        return interval
+
+    def _metric_counters(self) -> Dict:
+        """Push thread'inden: bileşenlerin kendi tuttuğu kümülatif sayaçlar"""
+        counters = {"client.connected": int(self.client.connected), "client.resets": self.client.resets}
+        if self.client.cache:
+            cache = self.client.cache.stats()
+            for key in ("hits", "coalesced", "misses"):
+                counters[f"cache.{key}"] = cache[key]
+        if self.client.limiter:
+            counters["limiter.throttled"] = sum(values["throttled"] for values in self.client.limiter.stats().values())
+        hooks = self.hooks.report()
+        counters["hooks.dropped"] = hooks["dropped"]
+        return counters
+
+    def _poll(self) -> float:
+        current_time = self.clock()
+        # Son adımın sonundaki durum - aradaki kopmalar (GUI thread'i dahil) da fark edilir
+        previous_state = self._last_state
+        throttle = self._sample_resources()
+        if self.exporter:
+            self.exporter.maybe_export()
+        if not self.client.connected and self._reconnect_since is not None:
+            # Bağlantı yeni koptu: client birazdan (yeni portta) dönecek - lockfile sık, tarama backoff ile
+            connection_interval = self.RECONNECT_MIN
+        elif not self.client.connected and self.watcher and self.watcher.alive:
+            # Client açılışı olayla gelir - zamanlı tarama yalnızca yedek
+            if current_time < self._discovery_until:
+                connection_interval = self.EXEC_RETRY_INTERVAL
+            else:
+                connection_interval = self.DISCOVERY_INTERVAL
+        elif self.idle:
+            connection_interval = self.IDLE_INTERVAL * throttle
+        elif self.auto_queue.enabled or self.end_of_game.enabled or self.champ_select.enabled:
+            # Oyun sonu -> lobby geçişini geç fark etmek kuyruğa girişi geciktirir
+            connection_interval = self.ACTIVE_INTERVAL * throttle
+        else:
+            connection_interval = self.CONNECTION_INTERVAL * throttle
+
+        # Connection check
+        if current_time - self._last_connection_check >= connection_interval:
+            if not self.client.connected and self._reconnect_since is None:
+                self.client.find_client()
+            elif not self.client.connected:
+                scan = current_time >= self._next_scan
+                if not self.client.find_client(scan=scan) and scan:
+                    self._reconnect_attempts += 1
+                    self._next_scan = current_time + min(
+                        self.RECONNECT_MIN * 2 ** self._reconnect_attempts, self.RECONNECT_MAX)
+                    if current_time - self._reconnect_since > self.RECONNECT_WINDOW:
+                        self._reconnect_since = None
+            elif self._verify_connection:
+                self._verify_connection = False
+                lockfile = self.client.read_lockfile()
+                if lockfile is not None and lockfile != (self.client.port, self.client.token):
+                    # Yeni client: eskisi askıda olabilir - zaman aşımı beklemeden geç
+                    self.client.reset_connection("client yeniden başlatıldı")
+                    self.client.find_client()
+                else:
+                    self.client.test_connection()
+            else:
+                self.client.check_game_status()
+            self._last_connection_check = current_time
+            self.cycles.on_phase(self.client.phase if self.client.connected else None)
+            self._fetch_cycle_queue()
+            # Arama durumu faz kontrolüyle aynı turda - ayrı uyanma / zamanlama yok, idle'da istek yok
+            self.queue_status.on_phase(current_time, self.client.phase if self.client.connected else None,
+                                       fetch=not self.idle)
+
+        if previous_state[0] and not self.client.connected:
+            self._reconnect_since = current_time
+            self._reconnect_attempts = 0
+            self._next_scan = current_time
+            self._last_connection_check = float('-inf')
+        elif self.client.connected:
+            self._reconnect_since = None
+
+        if (self.client.connected, self.client.in_game) != previous_state:
+            if self.client.connected and not previous_state[0] and self.config.get('lobby.queue_id'):
+                # Lobby oluşturma anında iki istek olsun - katalog bağlanırken hazırlanır
+                self.client.queues.ensure(self.client)
+            self.bus.publish("state_changed", connected=self.client.connected, in_game=self.client.in_game)
+        self._last_state = (self.client.connected, self.client.in_game)
+        phase = self.client.phase if self.client.connected else None
+        if phase != self._last_phase:
+            self.bus.publish("phase_changed", phase=phase, previous=self._last_phase)
+            self._last_phase = phase
+
+        step_wait = None
+        if self.champ_select.enabled and self.client.connected:
+            step_wait = self.champ_select.step(current_time, self.client.phase)
+        if self.end_of_game.enabled and self.client.connected:
+            wait = self.end_of_game.step(current_time, self.client.phase)
+            if wait is not None:
+                step_wait = wait
+                # Her adımdan sonra fazı hemen tazele - sıradaki ekran ya da lobby
+                self._last_connection_check = float('-inf')
+        if self.auto_queue.enabled and self.client.connected and not self.client.in_game:
+            wait = self.auto_queue.step(current_time, self.client.phase)
+            if wait is not None:
+                step_wait = wait if step_wait is None else min(step_wait, wait)
+
+        # Auto accept kontrolü - sadece gerektiğinde
+        if (self.auto_accept_running and self.client.connected and
+            not self.client.in_game):
+            self._check_ready_check()
+            interval = self.ACTIVE_INTERVAL * throttle
+        else:
+            # Auto accept kapalıyken bir sonraki bağlantı kontrolüne kadar uyu
+            interval = max(self._last_connection_check + connection_interval - self.clock(), 0.1)
+        
+        if step_wait is not None:
+            # min_delay / tekrar deneme zamanı gelince tam vaktinde uyan
+            interval = min(interval, max(step_wait, 0.1))
+        if self._last_state[0] and not self.client.connected:
+            # Adım sırasında koptu - bağlı moddaki aralığı beklemeden yeniden bağlanma penceresine geç
+            interval = self.RECONNECT_MIN
+        return interval
+
+    def _on_auto_queue(self, dead_time, saved):
+        """Otomatik arama başladı - istatistikleri güncelle"""
+        self.config.increment('stats.queue_sessions')
+        self.bus.publish("queue_started")
+
+    def _on_queue_status(self, status):
+        """Kuyruk süresi örneklendi / kuyruktan çıkıldı - arayüz saniyeleri kendisi ilerletir"""
+        self.bus.publish("queue_status", **(status or {"time_in_queue": None, "estimated": None, "queue_id": None}))
+
+    def _on_champ_select_action(self, kind, champion_id, latency):
+        """Champ select aksiyonu gönderildi - trace'e işaretle"""
+        self.cycles.mark(f"champ_select.{kind}", championId=champion_id, ms=round(latency * 1000, 1))
+
+    def _on_end_of_game_step(self, step, seconds):
+        """Oyun sonu adımı tamamlandı - trace'e işaretle"""
+        self.cycles.mark(f"end_of_game.{step}")
+
+    def _on_end_of_game_finish(self, run):
+        """Oyun bitişi -> lobby süresini kalıcı sketch'e yaz"""
+        if run["result"] == "Lobby":
+            self.record_measurement("post_game", run["total"])
+
+    def _fetch_cycle_queue(self):
+        """Yeni döngünün kuyruk tipini lobby'den bir kez al"""
+        record = self.cycles.current
+        if record is None or "queue_id" in record or not self.client.connected:
+            return
+        lobby = self.client.get_lobby()
+        record["queue_id"] = (lobby or {}).get("gameConfig", {}).get("queueId")
+
+    def _on_cycle_complete(self, record):
+        """Biten döngüyü geçmişe ekle"""
+        if self.history:
+            self.history.append(record)
+        self.bus.publish("history_changed")
+
+    def record_measurement(self, name, seconds):
+        """Süre ölçümünü quantile sketch'ine ekle ve kalıcı kaydet (yalnızca değişen sketch serileşir)"""
+        sketch = self.sketches.setdefault(name, QuantileSketch())
+        sketch.add(seconds)
+        if self.metrics:
+            self.metrics.observe(f"cycle.{name}_s", seconds)
+        self.config.set(f'sketches.{name}', sketch.to_dict())
+
+    def percentiles(self, name, quantiles=(0.5, 0.9, 0.99)) -> Optional[Tuple]:
+        """Ölçüm için p50 / p90 / p99 (veri yoksa None)"""
+        sketch = self.sketches.get(name)
+        if not sketch or not sketch.count:
+            return None
+        return tuple(sketch.quantile(q) for q in quantiles)
+
+    def _sample_resources(self) -> float:
+        """Kaynak örneği al, güncel yavaşlatma katsayısını döndür"""
+        if not self.resources:
+            return 1.0
+        if self.resources.maybe_sample():
+            self.bus.publish("resources_sampled")
+        return self.resources.throttle
+
+    def _check_ready_check(self):
+        """Ready check durumunu işle"""
+        ready_check = self.client.get_ready_check_status()
+
+        if ready_check:
+            ready_check_id = ready_check.get("declinerFlowStartedTime", ready_check.get("timer", 0))
+            state = ready_check.get("state", "")
+            player_response = ready_check.get("playerResponse", "None")
+
+            if state == "InProgress":
+                self.cycles.on_phase("ReadyCheck")
+                # Yeni ready check ve henüz kabul etmedik
+                if (ready_check_id != self.last_ready_check_id and
+                    player_response == "None"):
+
+                    self.cycles.mark("ready_check_seen")
+                    self.config.increment('stats.matches_found')
+
+                    accepted = self.client.accept_match()
+                    # Olay kabul isteğinden sonra: uyanan hook worker'ları kabul yolunda GIL için yarışmasın
+                    self.bus.publish("ready_check", ready_check_id=ready_check_id)
+                    if self.metrics:
+                        self.metrics.inc("engine.accepts" if accepted else "engine.accept_failures")
+                    if accepted:
+                        self.last_ready_check_id = ready_check_id
+                        self.waiting_for_others = True
+                        self.cycles.on_accepted()
+                        self.bus.publish("accepted", ready_check_id=ready_check_id)
+                        self.config.increment('stats.matches_accepted')
+                        self.logger.info("⏳ Diğer oyuncular bekleniyor...")
+
+                elif player_response == "Accepted" and self.waiting_for_others:
+                    # Zaten kabul ettik, sessizce bekle
+                    pass
+
+            elif state == "EveryoneReady":
+                if self.waiting_for_others:
+                    self.cycles.mark("everyone_ready")
+                    self.logger.info("🎮 Herkes hazır! Oyun başlıyor...")
+                    self.waiting_for_others = False
+                    self.last_ready_check_id = None
+
+            elif state not in ["InProgress", "EveryoneReady"]:
+                # Ready check bitti, reset
+                self.waiting_for_others = False
+                self.last_ready_check_id = None
+
+        else:
+            # Ready check yok, reset
+            if self.waiting_for_others:
+                self.waiting_for_others = False
+                self.last_ready_check_id = None
+
+class Lifecycle:
+    """Uygulamanın thread / döngü / kaynaklarının sahibi - süre sınırlı, işbirlikçi kapanış
+    
+    Kapanış üç adımdır: tüm bileşenlere dur sinyali (bloklamaz; uçuştaki LCU istekleri kesilir),
+    kalan süre içinde thread'lerin beklenmesi, en son bekleyen durumun bir kez diske yazılması.
+    Süreyi aşan thread beklenmez (hepsi daemon), raporda listelenir.
+    """
     
-    def get_ready_check_status(self) -> Optional[Dict]:
-        """Ready check durumunu al"""
-        try:
-            url = f"https://127.0.0.1:{self.port}/lol-matchmaking/v1/ready-check"
-            response = self.session.get(url, timeout=5)
-            return response.json() if response.status_code == 200 else None
-        except Exception:
-            return None
+    BUDGET = 0.2    # s - sinyal + bekleme + yazma toplamı
     
-    def accept_match(self) -> bool:
-        """Maçı kabul et"""
-        try:
-            url = f"https://127.0.0.1:{self.port}/lol-matchmaking/v1/ready-check/accept"
-            response = self.session.post(url, timeout=5)
-            success = response.status_code == 204
-            if success:
-                self.logger.info("✅ Maç kabul edildi!")
-            return success
-        except Exception as e:
-            self.logger.error(f"❌ Maç kabul hatası: {e}")
-            return False
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.cancelled = threading.Event()  # Döngüler / işçiler kapanışı buradan görür
+        self.components = []                # (ad, stop, threads)
+        self.flushes = []                   # (ad, callback)
+        self.workers = set()                # spawn() ile açılan kısa ömürlü thread'ler
+        self.lock = threading.Lock()
+        self.result = None
+        self.logger = logging.getLogger('BeRightBack')
     
-    def start_matchmaking(self) -> bool:
-        """Matchmaking başlat"""
-        try:
-            url = f"https://127.0.0.1:{self.port}/lol-lobby/v2/lobby/matchmaking/search"
-            response = self.session.post(url, timeout=5)
-            success = response.status_code == 204
-            if success:
-                self.logger.info("🔍 Matchmaking başlatıldı")
-            return success
-        except Exception as e:
-            self.logger.error(f"❌ Matchmaking başlatma hatası: {e}")
-            return False
+    def add(self, name, stop=None, threads=None):
+        """Bileşen kaydet: stop() bloklamadan sinyal verir, threads() beklenecek thread'leri döndürür"""
+        self.components.append((name, stop, threads))
+    
+    def on_flush(self, name, callback):
+        """Thread'ler durduktan sonra bir kez çalışacak yazma adımı (kayıt sırasıyla)"""
+        self.flushes.append((name, callback))
+    
+    def spawn(self, name, target, *args):
+        """Takip edilen daemon thread başlat - kapanış başladıysa iş açılmaz"""
+        if self.cancelled.is_set():
+            return None
+        
+        def run():
+            try:
+                target(*args)
+            finally:
+                with self.lock:
+                    self.workers.discard(thread)
+        
+        thread = threading.Thread(target=run, name=name, daemon=True)
+        with self.lock:
+            self.workers.add(thread)
+        thread.start()
+        return thread
+    
+    def shutdown(self, budget=None) -> dict:
+        """Tüm bileşenleri durdur; tekrar çağrılırsa ilk raporu döndürür"""
+        with self.lock:
+            if self.result is not None:
+                return self.result
+            self.result = {}
+        started = self.clock()
+        deadline = started + (self.BUDGET if budget is None else budget)
+        self.cancelled.set()
+        errors = {}
+        
+        for name, stop, _ in self.components:
+            if stop is None:
+                continue
+            try:
+                stop()
+            except Exception as e:
+                errors[name] = f"{type(e).__name__}: {e}"
+        signalled = self.clock()
+        
+        with self.lock:
+            pending = [(thread.name, thread) for thread in self.workers]
+        for name, _, threads in self.components:
+            if threads is not None:
+                pending.extend((name, thread) for thread in threads() if thread is not None)
+        stragglers = []
+        for name, thread in pending:
+            if thread is threading.current_thread():
+                continue
+            thread.join(max(deadline - self.clock(), 0))
+            if thread.is_alive():
+                stragglers.append(name)
+        joined = self.clock()
+        
+        for name, callback in self.flushes:
+            try:
+                callback()
+            except Exception as e:
+                errors[name] = f"{type(e).__name__}: {e}"
+        finished = self.clock()
+        
+        self.result.update({
+            "signal_ms": round((signalled - started) * 1000, 1),
+            "join_ms": round((joined - signalled) * 1000, 1),
+            "flush_ms": round((finished - joined) * 1000, 1),
+            "total_ms": round((finished - started) * 1000, 1),
+            "stragglers": stragglers,
+            "errors": errors
+        })
+        return self.result
 
 class BeRightBackGUI:
     """BeRightBack Ana GUI"""
     
-    def __init__(self):
+    GUI_EVENTS = ("state_changed", "settings_changed", "queue_started", "history_changed",
+                  "resources_sampled", "timer_tick", "timer_complete", "queue_status")
+    EVENT_BATCH = 50    # Tek Tk turunda teslim edilen en fazla olay - kalanı sonraki tura
+    CONSOLE_LINES = 1000
+    MINIMAL_SIZE = (300, 96)
+    
+    def __init__(self, profile=False, record=None, trace=False, minimal=False):
         self.root = ctk.CTk()
         
         # Config Manager
         self.config = ConfigManager()
+        self.profiler = SessionProfiler(self.config.config_dir) if profile else None
+        self.tracer = Tracer() if trace else None
+        self.trace_path = None  # Kapanışta belirlenir, thread'ler durunca yazılır
+        # Motor / timer / log olayları - widget'lar yalnızca Tk thread'inde değişir
+        self.bus = EventBus()
+        # Thread / döngü sahipliği - kapanış buradan, süre sınırlı
+        self.lifecycle = Lifecycle()
         
         # Setup
         self.setup_window()
@@ -347,18 +4246,46 @@ class BeRightBackGUI:
         
         # Components
         self.client = LoLClient()
-        self.timer = MatchmakingTimer(self)
-        
+        self.client.queues = QueueCatalog(self.config.config_dir / "queues.json")
+        if record:
+            self.client.start_recording(record)
+        self.timer = MatchmakingTimer(self.bus)
+        self.meter = ActivityMeter()
+        self.resources = ResourceMonitor(self.config, self.meter)
+        self.history = MatchHistory(self.config.config_dir / "history.jsonl")
+        self.analytics = HistoryAnalytics(self.history)
+        self.exporter = StatsExporter(self.config, self.history, self.resources)
+        self.engine = MonitorEngine(self.client, self.config, self.meter, self.resources,
+                                    self.profiler, self.tracer, self.history, self.exporter, self.bus)
+        self.gui_events = self.bus.subscribe(
+            self._handle_event, kinds=self.GUI_EVENTS, maxsize=64, notify=self._schedule_drain
+        )
+        self.config.watch(self._on_settings_changed)
+        self.setup_lifecycle()
+
         # State
-        self.auto_accept_running = False
         self.console_visible = self.config.get('console_visible', False)
-        self.last_ready_check_id = None  # Son kabul edilen ready check ID'si
-        self.waiting_for_others = False  # Diğer oyuncuları bekleme durumu
-        
-        self.create_widgets()
-        self.load_stats()
+        self.ui_idle = False
+        self._gui_update_job = None
+        self._idle_check_pending = False
+        self.analytics_window = None
+        self.minimal = False
+        self.mode_snapshots = {}                # mod -> son (RSS, thread, widget) ölçümü
+        self._timer_inputs = ("5", "0")         # Arayüz yıkılınca timer alanları korunur
+        self._last_status = None
+        self._queue_search = None               # (kuyrukta geçen sn, tahmini sn, örnek anı) - Matchmaking dışında None
+        self._queue_status_text = None
+        self._queue_status_job = None
+        self._full_geometry = f"{self.config.get('window.width', 1000)}x{self.config.get('window.height', 700)}"
+
+        if minimal:
+            self.enter_minimal_mode()
+        else:
+            self.build_full_view()
         self.start_monitoring()
-        self.start_timer_update()  # Timer için ayrı güncelleme
+        self.setup_idle_tracking()
+        if self.profiler:
+            self.profiler.start(self.root)
     
     def setup_window(self):
         """Pencere ayarları"""
@@ -411,6 +4338,28 @@ class BeRightBackGUI:
                 "matches_found": "Bulunan Maçlar",
                 "matches_accepted": "Kabul Edilen",
                 "queue_sessions": "Toplam Arama",
+                "auto_queue_mode": "Lobby hazır olunca ara",
+                "time_saved": "Kazanılan süre",
+                "skip_end_of_game": "Oyun sonu ekranlarını geç",
+                "champ_select": "Şampiyon seçimi",
+                "picks_placeholder": "Seçimler: Ahri, Lux, ...",
+                "bans_placeholder": "Banlar: Yasuo, Zed, ...",
+                "post_game": "Oyun sonu",
+                "queue_wait": "Kuyruk",
+                "accept_latency": "Kabul",
+                "cycle_length": "Maç döngüsü",
+                "analytics": "Analitik",
+                "minimal_mode": "Mini",
+                "restore": "Aç",
+                "in_queue": "Kuyrukta",
+                "estimated": "tahmini",
+                "analytics_title": "Kuyruk Süresi - Haftanın Saati (medyan)",
+                "analytics_computing": "Hesaplanıyor...",
+                "analytics_empty": "Henüz geçmiş yok - birkaç maç döngüsünden sonra tekrar deneyin",
+                "analytics_rolling": "Kayan medyan (son 25 kuyruk)",
+                "analytics_queues": "Kuyruk tipleri",
+                "weekdays": "Pzt Sal Çar Per Cum Cmt Paz",
+                "export": "Dışa Aktar",
                 "connected": "Bağlı",
                 "disconnected": "Bağlantısız",
                 "in_game": "Oyunda",
@@ -440,6 +4389,28 @@ class BeRightBackGUI:
                 "matches_found": "Matches Found",
                 "matches_accepted": "Accepted",
                 "queue_sessions": "Total Queues",
+                "auto_queue_mode": "Queue when lobby is ready",
+                "time_saved": "Time saved",
+                "skip_end_of_game": "Skip end-of-game screens",
+                "champ_select": "Champion select",
+                "picks_placeholder": "Picks: Ahri, Lux, ...",
+                "bans_placeholder": "Bans: Yasuo, Zed, ...",
+                "post_game": "Post-game",
+                "queue_wait": "Queue",
+                "accept_latency": "Accept",
+                "cycle_length": "Match cycle",
+                "analytics": "Analytics",
+                "minimal_mode": "Mini",
+                "restore": "Open",
+                "in_queue": "In queue",
+                "estimated": "est.",
+                "analytics_title": "Queue Time by Hour of Week (median)",
+                "analytics_computing": "Computing...",
+                "analytics_empty": "No history yet - try again after a few match cycles",
+                "analytics_rolling": "Rolling median (last 25 queues)",
+                "analytics_queues": "Queue types",
+                "weekdays": "Mon Tue Wed Thu Fri Sat Sun",
+                "export": "Export",
                 "connected": "Connected",
                 "disconnected": "Disconnected",
                 "in_game": "In Game",
@@ -459,16 +4430,23 @@ class BeRightBackGUI:
     
     def setup_logging(self):
         """Logging ayarla"""
-        self.console_messages = []
+        # Konsol satırları widget'tan bağımsız tutulur - mini moddan dönünce konsol yeniden doldurulur
+        self.console_messages = deque(maxlen=self.CONSOLE_LINES)
         
-        # Console handler
-        console_handler = ConsoleHandler(self.add_console_message)
+        # Console handler - log kaydı hangi thread'de olursa olsun konsola Tk thread'inde yazılır
+        # Ayrı abonelik: log seli durum olaylarını kuyruktan atmasın
+        self.log_events = self.bus.subscribe(
+            self._on_log_record, kinds=["log_record"], maxsize=1000, notify=self._schedule_drain
+        )
+        console_handler = ConsoleHandler(self.bus)
+        self.console_handler = console_handler
         console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
         
         # Add to all loggers
         logging.getLogger('Timer').addHandler(console_handler)
         logging.getLogger('LoLClient').addHandler(console_handler)
         logging.getLogger('BeRightBack').addHandler(console_handler)
+        logging.getLogger('Resources').addHandler(console_handler)
         
         # Main logger
         self.logger = logging.getLogger('BeRightBack')
@@ -552,6 +4530,36 @@ class BeRightBackGUI:
         )
         self.console_toggle_btn.grid(row=0, column=1)
         
+        # Analytics
+        self.analytics_btn = ctk.CTkButton(
+            right_frame,
+            text=f"📈 {self.get_text('analytics')}",
+            command=self.open_analytics,
+            width=110,
+            fg_color=self.colors["accent"]
+        )
+        self.analytics_btn.grid(row=0, column=2, padx=(10, 0))
+        
+        # Export
+        self.export_btn = ctk.CTkButton(
+            right_frame,
+            text=f"💾 {self.get_text('export')}",
+            command=self.export_stats,
+            width=110,
+            fg_color=self.colors["accent"]
+        )
+        self.export_btn.grid(row=0, column=3, padx=(10, 0))
+        
+        # Mini mod - ağır widget ağacı yıkılır, yalnızca küçük durum göstergesi kalır
+        self.minimal_btn = ctk.CTkButton(
+            right_frame,
+            text=f"🪶 {self.get_text('minimal_mode')}",
+            command=self.enter_minimal_mode,
+            width=80,
+            fg_color=self.colors["text_dim"]
+        )
+        self.minimal_btn.grid(row=0, column=4, padx=(10, 0))
+        
         # Connection status
         center_frame = ctk.CTkFrame(header, fg_color="transparent")
         center_frame.grid(row=0, column=1, pady=15)
@@ -620,7 +4628,7 @@ class BeRightBackGUI:
         
         # Stats
         stats_frame = ctk.CTkFrame(panel, fg_color=self.colors["bg_primary"])
-        stats_frame.grid(row=3, column=0, sticky="ew", padx=20, pady=(20, 30))
+        stats_frame.grid(row=3, column=0, sticky="ew", padx=20, pady=(20, 10))
         stats_frame.grid_columnconfigure(0, weight=1)
         stats_frame.grid_columnconfigure(1, weight=1)
         
@@ -641,6 +4649,42 @@ class BeRightBackGUI:
             text_color=self.colors["success"]
         )
         self.matches_accepted_label.grid(row=0, column=1, pady=20)
+        
+        # Percentiles (p50 / p90 / p99)
+        self.percentiles_label = ctk.CTkLabel(
+            stats_frame,
+            text="",
+            font=ctk.CTkFont(family="Consolas", size=11),
+            text_color=self.colors["text_dim"],
+            justify="left"
+        )
+        self.percentiles_label.grid(row=1, column=0, columnspan=2, padx=15, pady=(0, 15))
+        
+        # Champ select
+        self.champ_select_switch = ctk.CTkSwitch(
+            panel,
+            text=f"🧩 {self.get_text('champ_select')}",
+            command=self.toggle_champ_select,
+            progress_color=self.colors["accent"],
+            text_color=self.colors["text"]
+        )
+        self.champ_select_switch.grid(row=4, column=0, pady=(0, 5))
+        if self.engine.champ_select.enabled:
+            self.champ_select_switch.select()
+        
+        self.picks_entry = ctk.CTkEntry(panel, placeholder_text=self.get_text("picks_placeholder"), width=220)
+        self.picks_entry.grid(row=5, column=0, pady=(0, 5))
+        self.bans_entry = ctk.CTkEntry(panel, placeholder_text=self.get_text("bans_placeholder"), width=220)
+        self.bans_entry.grid(row=6, column=0, pady=(0, 20))
+        picks = ", ".join(self.config.get('champ_select.picks', []))
+        bans = ", ".join(self.config.get('champ_select.bans', []))
+        if picks:
+            self.picks_entry.insert(0, picks)
+        if bans:
+            self.bans_entry.insert(0, bans)
+        for entry in (self.picks_entry, self.bans_entry):
+            entry.bind("<Return>", lambda e: self.save_champ_lists())
+            entry.bind("<FocusOut>", lambda e: self.save_champ_lists())
     
     def create_auto_queue_panel(self):
         """Auto Queue Timer paneli"""
@@ -676,7 +4720,7 @@ class BeRightBackGUI:
         self.min_label = ctk.CTkLabel(timer_settings, text=self.get_text("minutes"), text_color=self.colors["text"])
         self.min_label.grid(row=0, column=0, pady=(15, 5))
         
-        self.minutes_var = ctk.StringVar(value="5")
+        self.minutes_var = ctk.StringVar(value=self._timer_inputs[0])
         self.minutes_entry = ctk.CTkEntry(
             timer_settings, 
             textvariable=self.minutes_var,
@@ -689,7 +4733,7 @@ class BeRightBackGUI:
         self.sec_label = ctk.CTkLabel(timer_settings, text=self.get_text("seconds"), text_color=self.colors["text"])
         self.sec_label.grid(row=0, column=1, pady=(15, 5))
         
-        self.seconds_var = ctk.StringVar(value="0")
+        self.seconds_var = ctk.StringVar(value=self._timer_inputs[1])
         self.seconds_entry = ctk.CTkEntry(
             timer_settings,
             textvariable=self.seconds_var,
@@ -750,7 +4794,38 @@ class BeRightBackGUI:
             font=ctk.CTkFont(size=12),
             text_color=self.colors["text_dim"]
         )
-        self.queue_sessions_label.grid(row=6, column=0, pady=(10, 30))
+        self.queue_sessions_label.grid(row=6, column=0, pady=(10, 10))
+        
+        # Phase-triggered mode
+        self.auto_queue_switch = ctk.CTkSwitch(
+            panel,
+            text=f"⚡ {self.get_text('auto_queue_mode')}",
+            command=self.toggle_auto_queue_mode,
+            progress_color=self.colors["accent"],
+            text_color=self.colors["text"]
+        )
+        self.auto_queue_switch.grid(row=7, column=0, pady=(0, 5))
+        if self.engine.auto_queue.enabled:
+            self.auto_queue_switch.select()
+        
+        self.time_saved_label = ctk.CTkLabel(
+            panel,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color=self.colors["text_dim"]
+        )
+        self.time_saved_label.grid(row=8, column=0, pady=(0, 5))
+        
+        self.end_of_game_switch = ctk.CTkSwitch(
+            panel,
+            text=f"🏁 {self.get_text('skip_end_of_game')}",
+            command=self.toggle_end_of_game_skip,
+            progress_color=self.colors["accent"],
+            text_color=self.colors["text"]
+        )
+        self.end_of_game_switch.grid(row=9, column=0, pady=(0, 20))
+        if self.engine.end_of_game.enabled:
+            self.end_of_game_switch.select()
     
     def create_status_bar(self):
         """Alt durum çubuğu"""
@@ -768,6 +4843,25 @@ class BeRightBackGUI:
         )
         self.status_label.grid(row=0, column=0, padx=20, pady=15, sticky="w")
         
+        # Queue status - yalnızca Matchmaking sırasında dolu
+        self.queue_status_label = ctk.CTkLabel(
+            self.status_frame,
+            text="",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            text_color=self.colors["accent"]
+        )
+        self.queue_status_label.grid(row=0, column=1, padx=10, pady=15, sticky="w")
+        self._queue_status_text = ""
+        
+        # Resource usage
+        self.resource_label = ctk.CTkLabel(
+            self.status_frame,
+            text="",
+            font=ctk.CTkFont(size=10),
+            text_color=self.colors["text_dim"]
+        )
+        self.resource_label.grid(row=0, column=2, padx=10, pady=15, sticky="e")
+        
         # Version
         self.version_label = ctk.CTkLabel(
             self.status_frame,
@@ -775,7 +4869,7 @@ class BeRightBackGUI:
             font=ctk.CTkFont(size=10),
             text_color=self.colors["text_dim"]
         )
-        self.version_label.grid(row=0, column=2, padx=20, pady=15, sticky="e")
+        self.version_label.grid(row=0, column=3, padx=20, pady=15, sticky="e")
     
     def create_console(self):
         """Konsol oluştur"""
@@ -831,6 +4925,145 @@ class BeRightBackGUI:
         # Make read-only
         self.console_text.configure(state="disabled")
     
+    def build_full_view(self):
+        """Tam arayüzü kur ve motor durumundan doldur (açılış ve mini moddan dönüş)"""
+        self.create_widgets()
+        self.load_stats()
+        self.fill_console()
+        self.update_time_saved()
+        self.update_resource_display()
+        self.refresh_gui()
+        self.update_timer_display()
+        self.update_queue_status()
+        if self._last_status:
+            self.show_status(*self._last_status, log=False)
+    
+    def enter_minimal_mode(self):
+        """Mini mod: widget ağacını yık, yalnızca motor ve küçük durum göstergesi kalsın"""
+        if self.minimal:
+            return
+        before = self._snapshot("full") if hasattr(self, 'main_frame') else None
+        if hasattr(self, 'main_frame'):
+            self._timer_inputs = (self.minutes_var.get(), self.seconds_var.get())
+            self._full_geometry = self.root.geometry().split('+')[0]
+            self.close_analytics()
+            for job in ('_gui_update_job', '_queue_status_job'):
+                if getattr(self, job) is not None:
+                    self.root.after_cancel(getattr(self, job))
+                    setattr(self, job, None)
+            self.main_frame.destroy()
+            self._drop_widget_refs()
+            self._trim_heap()
+        self.minimal = True
+        self.create_minimal_view()
+        after = self._snapshot("minimal")
+        self.logger.info(f"🪶 Mini mod: {self._describe_change(before, after)}")
+    
+    def exit_minimal_mode(self):
+        """Tam arayüzü motor durumundan yeniden kur"""
+        if not self.minimal:
+            return
+        before = self._snapshot("minimal")
+        start = time.perf_counter()
+        self.mini_frame.destroy()
+        self._drop_widget_refs()
+        self.minimal = False
+        self.root.minsize(800, 600)
+        self.root.geometry(self._full_geometry)
+        self.build_full_view()
+        self.root.update_idletasks()
+        elapsed = (time.perf_counter() - start) * 1000
+        after = self._snapshot("full")
+        self.logger.info(f"🖥️ Tam arayüz {elapsed:.0f} ms'de kuruldu: {self._describe_change(before, after)}")
+        self.update_gui()
+    
+    def create_minimal_view(self):
+        """Mini mod göstergesi: bağlantı / açık özellikler, son durum mesajı, geri açma butonu"""
+        self.root.minsize(*self.MINIMAL_SIZE)
+        self.root.geometry("{}x{}".format(*self.MINIMAL_SIZE))
+        self.mini_frame = ctk.CTkFrame(self.root, fg_color=self.colors["bg_secondary"], corner_radius=0)
+        self.mini_frame.grid(row=0, column=0, sticky="nsew")
+        self.mini_frame.grid_columnconfigure(0, weight=1)
+        
+        self.mini_state_label = ctk.CTkLabel(
+            self.mini_frame, text="", font=ctk.CTkFont(size=13, weight="bold"), anchor="w"
+        )
+        self.mini_state_label.grid(row=0, column=0, sticky="w", padx=(12, 5), pady=(10, 0))
+        
+        self.mini_status_label = ctk.CTkLabel(
+            self.mini_frame, text="", font=ctk.CTkFont(size=11), text_color=self.colors["text_dim"], anchor="w"
+        )
+        self.mini_status_label.grid(row=1, column=0, sticky="w", padx=(12, 5), pady=(0, 10))
+        
+        self.mini_restore_btn = ctk.CTkButton(
+            self.mini_frame,
+            text=f"⬆ {self.get_text('restore')}",
+            command=self.exit_minimal_mode,
+            width=60,
+            fg_color=self.colors["accent"]
+        )
+        self.mini_restore_btn.grid(row=0, column=1, rowspan=2, padx=(0, 12))
+        self.update_minimal()
+    
+    def update_minimal(self):
+        """Mini göstergeyi motor durumundan güncelle"""
+        if self.client.in_game:
+            # Tam arayüzdeki update_button_states ile aynı: oyunda kabul ve timer durur
+            self.engine.auto_accept_running = False
+            if self.timer.timer_running:
+                self.timer.stop_timer()
+        if not self.client.connected:
+            icon, text, color = "🔴", self.get_text("disconnected"), self.colors["error"]
+        elif self.client.in_game:
+            icon, text, color = "🎮", self.get_text("in_game"), self.colors["warning"]
+        else:
+            icon, text, color = "🟢", self.get_text("connected"), self.colors["success"]
+        features = [flag for flag, on in (
+            ("🎯", self.engine.auto_accept_running), ("⚡", self.engine.auto_queue.enabled),
+            ("🏁", self.engine.end_of_game.enabled), ("🧩", self.engine.champ_select.enabled)
+        ) if on]
+        if self.timer.timer_running:
+            features.append(f"⏰ {self.timer.get_time_display()}")
+        self.mini_state_label.configure(text=f"{icon} {text}  {' '.join(features)}", text_color=color)
+    
+    def _drop_widget_refs(self):
+        """Yıkılan widget'lara Python referanslarını bırak - bellek gerçekten serbest kalsın"""
+        for name, value in list(vars(self).items()):
+            if isinstance(value, (tk.Misc, tk.Variable)) and value is not self.root:
+                delattr(self, name)
+    
+    @staticmethod
+    def _trim_heap():
+        """Döngüsel referansları topla; Linux'ta boş heap sayfalarını işletim sistemine geri ver"""
+        gc.collect()
+        if sys.platform.startswith("linux"):
+            try:
+                ctypes.CDLL(None).malloc_trim(0)
+            except (OSError, AttributeError):
+                pass
+    
+    def _count_widgets(self, widget=None) -> int:
+        widget = widget or self.root
+        return 1 + sum(self._count_widgets(child) for child in widget.winfo_children())
+    
+    def _snapshot(self, mode) -> Dict[str, Any]:
+        """Modun RSS / thread / widget sayısı - kapanışta modlar karşılaştırılır"""
+        process = psutil.Process()
+        snapshot = {
+            "rss_mb": round(process.memory_info().rss / 1024 / 1024, 1),
+            "threads": process.num_threads(),
+            "widgets": self._count_widgets()
+        }
+        self.mode_snapshots[mode] = snapshot
+        return snapshot
+    
+    @staticmethod
+    def _describe_change(before, after) -> str:
+        text = f"RSS {after['rss_mb']} MB, {after['threads']} thread, {after['widgets']} widget"
+        if before:
+            text += f" (önce {before['rss_mb']} MB, {before['widgets']} widget)"
+        return text
+    
     def toggle_console(self):
         """Konsolu göster/gizle"""
         self.console_visible = not self.console_visible
@@ -847,24 +5080,29 @@ class BeRightBackGUI:
     
     def add_console_message(self, message):
         """Konsola mesaj ekle"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        formatted_message = f"[{timestamp}] {message}\n"
+        full = len(self.console_messages) == self.CONSOLE_LINES
+        self.console_messages.append(formatted_message)
         if hasattr(self, 'console_text'):
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            formatted_message = f"[{timestamp}] {message}\n"
-            
             self.console_text.configure(state="normal")
+            if full:
+                # Keep only last 1000 lines
+                self.console_text.delete("1.0", "2.0")
             self.console_text.insert("end", formatted_message)
             self.console_text.configure(state="disabled")
             self.console_text.see("end")
-            
-            # Keep only last 1000 lines
-            lines = self.console_text.get("1.0", "end").split('\n')
-            if len(lines) > 1000:
-                self.console_text.configure(state="normal")
-                self.console_text.delete("1.0", f"{len(lines)-1000}.0")
-                self.console_text.configure(state="disabled")
+    
+    def fill_console(self):
+        """Yeniden kurulan konsola tampondaki satırları tek seferde yaz"""
+        self.console_text.configure(state="normal")
+        self.console_text.insert("end", "".join(self.console_messages))
+        self.console_text.configure(state="disabled")
+        self.console_text.see("end")
     
     def clear_console(self):
         """Konsolu temizle"""
+        self.console_messages.clear()
         if hasattr(self, 'console_text'):
             self.console_text.configure(state="normal")
             self.console_text.delete("1.0", "end")
@@ -881,14 +5119,64 @@ class BeRightBackGUI:
             self.show_status("⚠️ Oyundayken başlatılamaz!", "warning")
             return
         
-        self.auto_accept_running = not self.auto_accept_running
+        self.engine.set_auto_accept(not self.engine.auto_accept_running)
         self.update_button_states()
-        
-        if self.auto_accept_running:
+        self.evaluate_idle()
+
+        if self.engine.auto_accept_running:
             self.logger.info("🟢 Otomatik maç kabul başlatıldı")
         else:
             self.logger.info("🔴 Otomatik maç kabul durduruldu")
     
+    def toggle_auto_queue_mode(self):
+        """Faz tetiklemeli otomatik aramayı aç/kapat"""
+        enabled = bool(self.auto_queue_switch.get())
+        self.engine.set_auto_queue(enabled)
+        self.evaluate_idle()
+        if enabled:
+            self.logger.info("⚡ Otomatik arama: lobby hazır olunca kuyruğa girilecek")
+        else:
+            self.logger.info("🔴 Faz tetiklemeli otomatik arama kapatıldı")
+    
+    def toggle_champ_select(self):
+        """Şampiyon seçimi asistanını aç/kapat"""
+        enabled = bool(self.champ_select_switch.get())
+        self.save_champ_lists()
+        self.engine.set_champ_select(enabled)
+        self.evaluate_idle()
+        if enabled:
+            self.logger.info("🧩 Şampiyon seçimi: öncelik listesinden ban / kilitleme açık")
+        else:
+            self.logger.info("🔴 Şampiyon seçimi asistanı kapatıldı")
+    
+    def save_champ_lists(self):
+        """Virgülle ayrılmış seçim / ban listelerini kaydet"""
+        def split(text):
+            return [name.strip() for name in text.split(",") if name.strip()]
+        picks = split(self.picks_entry.get())
+        bans = split(self.bans_entry.get())
+        if (picks, bans) != (self.config.get('champ_select.picks', []), self.config.get('champ_select.bans', [])):
+            self.engine.champ_select.set_lists(picks, bans)
+    
+    def toggle_end_of_game_skip(self):
+        """Oyun sonu ekranlarını otomatik geçmeyi aç/kapat"""
+        enabled = bool(self.end_of_game_switch.get())
+        self.engine.set_end_of_game_skip(enabled)
+        self.evaluate_idle()
+        if enabled:
+            self.logger.info("🏁 Oyun sonu ekranları otomatik geçilecek")
+        else:
+            self.logger.info("🔴 Oyun sonu ekranlarını geçme kapatıldı")
+    
+    def update_time_saved(self):
+        """Oturumda otomatik aramayla kazanılan süreyi göster"""
+        report = self.engine.auto_queue.report()
+        if report["searches"]:
+            self.time_saved_label.configure(
+                text=f"{self.get_text('time_saved')}: {self.format_duration(report['saved_seconds'])} "
+                     f"({report['searches']}x)"
+            )
+    
     def update_button_states(self):
         """Buton durumlarını güncelle"""
         # Auto Accept button
@@ -900,8 +5188,8 @@ class BeRightBackGUI:
                 hover_color=self.colors["disabled"],
                 state="disabled"
             )
-            self.auto_accept_running = False
-        elif self.auto_accept_running:
+            self.engine.auto_accept_running = False
+        elif self.engine.auto_accept_running:
             # Çalışıyor
             self.auto_accept_btn.configure(
                 text=f"⏹️ {self.get_text('stop')}",
@@ -959,9 +5247,13 @@ class BeRightBackGUI:
             # Timer başlat
             success = self.timer.start_timer(minutes, seconds, self.on_timer_complete)
             if success:
+                # Otomatik aramanın kazandırdığı süre bu geri sayıma göre hesaplanır
+                self.config.set('auto_queue.baseline_seconds', minutes * 60 + seconds)
                 self.start_timer_btn.configure(state="disabled")
                 self.stop_timer_btn.configure(state="normal")
                 self.show_status(f"⏰ Timer başlatıldı: {minutes}:{seconds:02d}", "success")
+                self.update_timer_display()
+                self.evaluate_idle()
             
         except ValueError:
             self.show_status("⚠️ Geçerli sayılar girin!", "warning")
@@ -974,37 +5266,32 @@ class BeRightBackGUI:
         self.progress_bar.set(0)
         self.timer_display.configure(text="00:00")
         self.show_status("⏹️ Timer durduruldu", "warning")
+        self.evaluate_idle()
     
     def on_timer_complete(self):
-        """Timer tamamlandığında çalışır"""
+        """Timer tamamlandığında çalışır (timer thread'i) - sonuç bus ile Tk thread'ine gider"""
+        success = False
         if self.client.connected and not self.client.in_game:
-            success = self.client.start_matchmaking()
+            success = self.client.queue_up(self.config.get('lobby.queue_id'))
             if success:
-                stats = self.config.get('stats', {})
-                stats['queue_sessions'] = stats.get('queue_sessions', 0) + 1
-                self.config.set('stats', stats)
-                self.update_stats_display()
-                self.show_status("🚀 Matchmaking başlatıldı!", "success")
+                self.config.increment('stats.queue_sessions')
+                message, level = "🚀 Matchmaking başlatıldı!", "success"
             else:
-                self.show_status("❌ Matchmaking başlatılamadı!", "error")
+                message, level = "❌ Matchmaking başlatılamadı!", "error"
+        elif self.client.in_game:
+            message, level = "⚠️ Oyunda olduğu için matchmaking başlatılamadı!", "warning"
         else:
-            if self.client.in_game:
-                self.show_status("⚠️ Oyunda olduğu için matchmaking başlatılamadı!", "warning")
-            else:
-                self.show_status("❌ LoL Client bağlantısı yok!", "error")
-        
-        # Reset timer controls
-        self.root.after(0, lambda: (
-            self.start_timer_btn.configure(state="normal"),
-            self.stop_timer_btn.configure(state="disabled"),
-            self.progress_bar.set(0),
-            self.timer_display.configure(text="00:00")
-        ))
+            message, level = "❌ LoL Client bağlantısı yok!", "error"
+        self.bus.publish("timer_complete", success=success, message=message, level=level)
     
-    def start_timer_update(self):
-        """Timer güncellemesi için ayrı döngü"""
-        self.update_timer_display()
-        self.root.after(500, self.start_timer_update)  # Timer için 500ms güncelleme
+    def _on_timer_finished(self, event):
+        """Timer sonucu - durum mesajı ve kontrolleri sıfırla"""
+        self.show_status(event.data["message"], event.data["level"])
+        self.start_timer_btn.configure(state="normal")
+        self.stop_timer_btn.configure(state="disabled")
+        self.progress_bar.set(0)
+        self.timer_display.configure(text="00:00")
+        self.evaluate_idle()
     
     def update_timer_display(self):
         """Sadece timer gösterimini güncelle"""
@@ -1012,79 +5299,183 @@ class BeRightBackGUI:
             self.timer_display.configure(text=self.timer.get_time_display())
             self.progress_bar.set(self.timer.get_progress())
     
+    def setup_lifecycle(self):
+        """Kapanışta durdurulacak bileşenler ve bir kez yazılacak durum"""
+        self.lifecycle.add("engine", self.engine.stop, lambda: [self.engine.monitor_thread, self.engine.pusher.thread])
+        # Motor durduktan sonra: uçuştaki LCU isteği 5 sn timeout'u beklemeden kesilir
+        self.lifecycle.add("client", self.client.close)
+        self.lifecycle.add("timer", self.timer.stop_timer, lambda: [self.timer.timer_thread])
+        self.lifecycle.on_flush("recording", self.client.stop_recording)
+        if self.tracer:
+            self.lifecycle.on_flush("trace", self._export_trace)
+        self.lifecycle.on_flush("config", self.config.close)
+    
+    def _export_trace(self):
+        """Trace'i kapanışta belirlenen dosyaya yaz (motor durduktan sonra - açık span'ler kapanmış olur)"""
+        self.tracer.export(self.trace_path)
+    
+    def _cancel_tk_jobs(self):
+        """Bekleyen tüm after() işlerini iptal et - yok edilen widget'lara çağrı düşmesin"""
+        for job in self.root.tk.splitlist(self.root.tk.call('after', 'info')):
+            self.root.after_cancel(job)
+    
     def start_monitoring(self):
         """İzleme başlat"""
-        self.monitor_thread = threading.Thread(target=self._monitor_worker, daemon=True)
-        self.monitor_thread.start()
+        self.engine.start()
         self.update_gui()
     
-    def _monitor_worker(self):
-        """İzleme worker thread - optimized"""
-        last_connection_check = 0
+    def setup_idle_tracking(self):
+        """Pencere küçültme / odak olaylarını idle moduna bağla"""
+        for sequence in ("<Map>", "<Unmap>", "<FocusIn>", "<FocusOut>"):
+            self.root.bind(sequence, self._on_window_event, add="+")
+    
+    def _on_window_event(self, event):
+        """Pencere olayı - çocuk widget'lardan da gelir, değerlendirmeyi birleştir"""
+        if not self._idle_check_pending:
+            self._idle_check_pending = True
+            self.root.after_idle(self.evaluate_idle)
+    
+    def evaluate_idle(self):
+        """Idle koşullarını kontrol et ve gerekirse modu değiştir"""
+        self._idle_check_pending = False
+        try:
+            minimized = self.root.state() == "iconic"
+            focused = self.root.focus_get() is not None
+        except Exception:
+            # focus_get yok edilmiş widget'larda KeyError fırlatabilir
+            minimized, focused = False, True
         
-        while True:
-            current_time = time.time()
-            
-            # Connection check - her 3 saniyede bir
-            if current_time - last_connection_check >= 3:
-                if not self.client.connected:
-                    self.client.find_client()
-                else:
-                    self.client.check_game_status()
-                last_connection_check = current_time
-            
-            # Auto accept kontrolü - sadece gerektiğinde
-            if (self.auto_accept_running and self.client.connected and 
-                not self.client.in_game):
-                ready_check = self.client.get_ready_check_status()
-                
-                if ready_check:
-                    ready_check_id = ready_check.get("declinerFlowStartedTime", ready_check.get("timer", 0))
-                    state = ready_check.get("state", "")
-                    player_response = ready_check.get("playerResponse", "None")
-                    
-                    if state == "InProgress":
-                        # Yeni ready check ve henüz kabul etmedik
-                        if (ready_check_id != self.last_ready_check_id and 
-                            player_response == "None"):
-                            
-                            stats = self.config.get('stats', {})
-                            stats['matches_found'] = stats.get('matches_found', 0) + 1
-                            self.config.set('stats', stats)
-                            
-                            if self.client.accept_match():
-                                self.last_ready_check_id = ready_check_id
-                                self.waiting_for_others = True
-                                stats['matches_accepted'] = stats.get('matches_accepted', 0) + 1
-                                self.config.set('stats', stats)
-                                self.root.after(0, self.update_stats_display)
-                                self.logger.info("⏳ Diğer oyuncular bekleniyor...")
-                        
-                        elif player_response == "Accepted" and self.waiting_for_others:
-                            # Zaten kabul ettik, sessizce bekle
-                            pass
-                    
-                    elif state == "EveryoneReady":
-                        if self.waiting_for_others:
-                            self.logger.info("🎮 Herkes hazır! Oyun başlıyor...")
-                            self.waiting_for_others = False
-                            self.last_ready_check_id = None
-                    
-                    elif state not in ["InProgress", "EveryoneReady"]:
-                        # Ready check bitti, reset
-                        self.waiting_for_others = False
-                        self.last_ready_check_id = None
-                
-                else:
-                    # Ready check yok, reset
-                    if self.waiting_for_others:
-                        self.waiting_for_others = False
-                        self.last_ready_check_id = None
-            
-            time.sleep(1.5)  # Optimized sleep interval
+        busy = (self.engine.auto_accept_running or self.timer.timer_running or
+                self.engine.auto_queue.enabled or self.engine.end_of_game.enabled or
+                self.engine.champ_select.enabled)
+        self.set_ui_idle((minimized or not focused) and not busy)
+    
+    def set_ui_idle(self, idle):
+        """UI döngülerini durdur / devam ettir"""
+        if idle == self.ui_idle:
+            return
+        
+        self.ui_idle = idle
+        self.engine.set_idle(idle)
+        summary = self.meter.set_mode("idle" if idle else "active")
+        if summary:
+            self.logger.info(
+                f"📏 {summary['mode']} dönemi: {summary['seconds']:.0f}s, "
+                f"{summary['wakeups_per_minute']:.1f} uyanma/dk, "
+                f"{summary['cpu_ms_per_minute']:.1f} ms CPU/dk"
+            )
+        
+        if idle:
+            # Döngü bir sonraki turda kendini yeniden planlamaz
+            if self._gui_update_job is not None:
+                self.root.after_cancel(self._gui_update_job)
+            self._gui_update_job = None
+            self.logger.info("💤 Idle mod: UI güncellemeleri durduruldu")
+        else:
+            self.logger.info("⚡ Aktif mod: UI güncellemeleri devam ediyor")
+            self.update_gui()
+            if not self.minimal:
+                self.update_timer_display()
+                self.update_queue_status()
+    
+    def _on_settings_changed(self, changed):
+        """Ayar değişti (yazan thread'de) - bölüm başına birleşen olay olarak Tk thread'ine aktar"""
+        for section in {key.partition('.')[0] for key in changed}:
+            self.bus.publish("settings_changed", key=section, section=section)
+
+    def _schedule_drain(self, subscription):
+        """Bus kuyruğu doldu (herhangi bir thread'den) - Tk thread'inde toplu teslim et"""
+        if not self.lifecycle.cancelled.is_set():
+            self.root.after(0, subscription.drain, self.EVENT_BATCH)
+    
+    def _handle_event(self, event):
+        """Motor / timer olayını Tk thread'inde işle - idle modda da anında yansıt"""
+        kind = event.kind
+        if kind == "queue_status":
+            data = event.data
+            # Örnek yayın anına sabitlenir - teslimat gecikmesi göstergeyi geri çekmez
+            self._queue_search = (None if data["time_in_queue"] is None
+                                  else (data["time_in_queue"], data["estimated"], event.time))
+            if not self.minimal:
+                self.update_queue_status()
+            return
+        if self.minimal:
+            if kind == "timer_complete":
+                self.show_status(event.data["message"], event.data["level"])
+            elif kind == "queue_started":
+                self.show_status("🚀 Lobby hazır - matchmaking başlatıldı!", "success")
+            if kind in ("state_changed", "timer_tick", "timer_complete", "queue_started"):
+                self.update_minimal()
+            return
+        if kind == "settings_changed":
+            # Yalnızca değişen bölümün etiketleri yenilenir
+            if event.data["section"] == "stats":
+                self.update_counters_display()
+            elif event.data["section"] == "sketches":
+                self.update_percentiles_display()
+        elif kind == "state_changed":
+            self.refresh_gui()
+        elif kind == "timer_tick":
+            self.meter.wakeup("timer_ui")
+            self.update_timer_display()
+        elif kind == "timer_complete":
+            self._on_timer_finished(event)
+        elif kind == "resources_sampled" and not self.ui_idle:
+            self.update_resource_display()
+        elif kind == "queue_started":
+            self.update_time_saved()
+            self.show_status("🚀 Lobby hazır - matchmaking başlatıldı!", "success")
+        elif kind == "history_changed" and self.analytics_window is not None:
+            self.refresh_analytics()
+    
+    def update_queue_status(self):
+        """Kuyruk süresini göster; bir sonraki saniye sınırında yeniden planla
+        
+        Etiket yalnızca gösterilen metin değiştiğinde yeniden yapılandırılır (saniyede en fazla bir kez).
+        """
+        if self._queue_status_job is not None:
+            self.root.after_cancel(self._queue_status_job)
+        self._queue_status_job = None
+        if self._queue_search is None:
+            text = ""
+        else:
+            time_in_queue, estimated, sampled = self._queue_search
+            elapsed = time_in_queue + time.monotonic() - sampled
+            text = f"⏳ {self.get_text('in_queue')} {self._format_seconds(elapsed)}"
+            if estimated:
+                text += f" / {self.get_text('estimated')} {self._format_seconds(estimated)}"
+            if not self.ui_idle:
+                # Gösterilen saniye değişince uyan - arada çizim / uyanma yok
+                delay = int((1 - elapsed % 1) * 1000) + 1
+                self._queue_status_job = self.root.after(delay, self.update_queue_status)
+        if text != self._queue_status_text:
+            self.queue_status_label.configure(text=text)
+            self._queue_status_text = text
+    
+    @staticmethod
+    def _format_seconds(seconds):
+        minutes, seconds = divmod(int(seconds), 60)
+        return f"{minutes:02d}:{seconds:02d}"
+    
+    def _on_log_record(self, event):
+        """Log kaydını konsola yaz (Tk thread'i)"""
+        self.add_console_message(event.data["message"])
     
     def update_gui(self):
         """GUI güncelle - timer hariç"""
+        self._gui_update_job = None
+        if self.minimal:
+            # Mini gösterge olaylarla güncellenir, döngü yok
+            return
+        self.meter.wakeup("gui_update")
+        self.refresh_gui()
+        
+        # Schedule next update - timer ayrı güncelleniyor, idle modda durur
+        if not self.ui_idle:
+            self._gui_update_job = self.root.after(2000, self.update_gui)
+    
+    def refresh_gui(self):
+        """Bağlantı durumu ve butonları güncelle"""
         # Connection status
         if self.client.connected:
             if self.client.in_game:
@@ -1108,9 +5499,10 @@ class BeRightBackGUI:
         
         # Button states update
         self.update_button_states()
-        
-        # Schedule next update - timer ayrı güncelleniyor
-        self.root.after(2000, self.update_gui)
+    
+    def update_resource_display(self):
+        """Kaynak kullanımını durum çubuğunda göster"""
+        self.resource_label.configure(text=self.resources.format_summary())
     
     def load_stats(self):
         """İstatistikleri yükle"""
@@ -1118,16 +5510,173 @@ class BeRightBackGUI:
     
     def update_stats_display(self):
         """İstatistik ekranını güncelle"""
-        stats = self.config.get('stats', {})
-        
-        matches_found = stats.get('matches_found', 0)
-        matches_accepted = stats.get('matches_accepted', 0)
-        queue_sessions = stats.get('queue_sessions', 0)
+        self.update_counters_display()
+        self.update_percentiles_display()
+    
+    def update_counters_display(self):
+        """Maç / kuyruk sayaçlarını göster"""
+        matches_found = self.config.get('stats.matches_found', 0)
+        matches_accepted = self.config.get('stats.matches_accepted', 0)
+        queue_sessions = self.config.get('stats.queue_sessions', 0)
         
         self.matches_found_label.configure(text=f"{self.get_text('matches_found')}\n{matches_found}")
         self.matches_accepted_label.configure(text=f"{self.get_text('matches_accepted')}\n{matches_accepted}")
         self.queue_sessions_label.configure(text=f"{self.get_text('queue_sessions')}: {queue_sessions}")
     
+    def update_percentiles_display(self):
+        """Kuyruk, kabul gecikmesi ve döngü süresi p50 / p90 / p99"""
+        lines = []
+        for name, formatter in (("queue_wait", self.format_duration),
+                                ("accept_latency", lambda v: f"{v * 1000:.0f}ms"),
+                                ("cycle_length", self.format_duration),
+                                ("post_game", lambda v: f"{v:.1f}s")):
+            values = self.engine.percentiles(name)
+            if values:
+                p50, p90, p99 = (formatter(v) for v in values)
+                lines.append(f"{self.get_text(name):<12} p50 {p50:>6}  p90 {p90:>6}  p99 {p99:>6}")
+        self.percentiles_label.configure(text="\n".join(lines))
+    
+    def open_analytics(self):
+        """Geçmiş analitiği penceresini aç"""
+        if not HistoryAnalytics.available():
+            self.logger.warning("⚠️ Analitik için NumPy gerekli: pip install numpy")
+            return
+        if self.analytics_window is not None:
+            self.analytics_window.focus()
+            return
+        
+        window = ctk.CTkToplevel(self.root)
+        window.title(f"BeRightBack - {self.get_text('analytics')}")
+        window.geometry("720x520")
+        window.configure(fg_color=self.colors["bg_primary"])
+        window.protocol("WM_DELETE_WINDOW", self.close_analytics)
+        self.analytics_window = window
+        
+        ctk.CTkLabel(
+            window,
+            text=f"📈 {self.get_text('analytics_title')}",
+            font=ctk.CTkFont(size=16, weight="bold"),
+            text_color=self.colors["text"]
+        ).pack(pady=(15, 5))
+        
+        self.heatmap_canvas = tk.Canvas(window, width=680, height=200, bg=self.colors["bg_primary"],
+                                        highlightthickness=0)
+        self.heatmap_canvas.pack(padx=20)
+        
+        self.rolling_canvas = tk.Canvas(window, width=680, height=110, bg=self.colors["bg_primary"],
+                                        highlightthickness=0)
+        self.rolling_canvas.pack(padx=20, pady=(10, 0))
+        
+        self.analytics_label = ctk.CTkLabel(
+            window,
+            text=self.get_text("analytics_computing"),
+            font=ctk.CTkFont(family="Consolas", size=11),
+            text_color=self.colors["text_dim"],
+            justify="left"
+        )
+        self.analytics_label.pack(padx=20, pady=10, anchor="w")
+        
+        self.refresh_analytics()
+    
+    def export_stats(self):
+        """Geçmiş ve metrikleri arka planda dışa aktar (son imleçten itibaren)"""
+        def worker():
+            try:
+                result = self.exporter.export()
+                self.logger.info(
+                    f"💾 {result['history_rows']} yeni satır dışa aktarıldı -> {Path(result['history_file']).parent}"
+                )
+            except Exception as e:
+                self.logger.error(f"❌ Dışa aktarma hatası: {e}")
+        
+        self.lifecycle.spawn("export", worker)
+    
+    def close_analytics(self):
+        """Analitik penceresini kapat"""
+        if self.analytics_window is not None:
+            self.analytics_window.destroy()
+            self.analytics_window = None
+    
+    def refresh_analytics(self):
+        """Analitiği arka planda hesapla - Tk thread'i bloklanmaz"""
+        def worker():
+            try:
+                result = self.analytics.compute()
+            except Exception as e:
+                self.logger.error(f"❌ Analitik hesaplanamadı: {e}")
+                return
+            if not self.lifecycle.cancelled.is_set():
+                self.root.after(0, self._render_analytics, result)
+        
+        self.lifecycle.spawn("analytics", worker)
+    
+    def _render_analytics(self, result):
+        """Isı haritası, kayan medyan ve kuyruk kırılımını çiz"""
+        if self.analytics_window is None:
+            return
+        if not result["samples"]:
+            self.analytics_label.configure(text=self.get_text("analytics_empty"))
+            return
+        
+        # Isı haritası: 7 gün x 24 saat, renk = medyan kuyruk süresi
+        canvas = self.heatmap_canvas
+        canvas.delete("all")
+        heatmap = result["heatmap"]
+        peak = np.nanmax(heatmap)
+        left, top, cell_w, cell_h = 40, 18, 26, 24
+        for hour in range(0, 24, 3):
+            canvas.create_text(left + hour * cell_w + cell_w / 2, 8, text=f"{hour:02d}",
+                               fill=self.colors["text_dim"], font=("Consolas", 8))
+        for day, day_name in enumerate(self.get_text("weekdays").split()):
+            y = top + day * cell_h
+            canvas.create_text(left - 20, y + cell_h / 2, text=day_name,
+                               fill=self.colors["text_dim"], font=("Consolas", 9))
+            for hour in range(24):
+                value = heatmap[day, hour]
+                x = left + hour * cell_w
+                if np.isnan(value):
+                    color = self.colors["bg_secondary"]
+                else:
+                    # bg_secondary -> accent arasında doğrusal
+                    ratio = value / peak if peak else 0
+                    color = "#%02x%02x%02x" % (int(0x1A + (0x00 - 0x1A) * ratio),
+                                               int(0x1D + (0xD4 - 0x1D) * ratio),
+                                               int(0x29 + (0xFF - 0x29) * ratio))
+                canvas.create_rectangle(x, y, x + cell_w - 2, y + cell_h - 2, fill=color, width=0)
+        
+        # Kayan medyan - en fazla canvas genişliği kadar nokta
+        canvas = self.rolling_canvas
+        canvas.delete("all")
+        rolling = result["rolling_median"]
+        canvas.create_text(left, 8, text=self.get_text("analytics_rolling"), anchor="w",
+                           fill=self.colors["text_dim"], font=("Consolas", 9))
+        if len(rolling) > 1:
+            width, height = 600, 80
+            step = max(1, len(rolling) // width)
+            points = rolling[::step]
+            top_value = points.max() or 1
+            xs = left + np.arange(len(points)) * (width / max(1, len(points) - 1))
+            ys = 20 + height - points / top_value * height
+            canvas.create_line(*np.column_stack((xs, ys)).ravel().tolist(),
+                               fill=self.colors["accent"], width=2)
+            canvas.create_text(left + width + 5, 20, text=self.format_duration(top_value), anchor="w",
+                               fill=self.colors["text_dim"], font=("Consolas", 8))
+        
+        lines = [f"{self.get_text('analytics_queues')} ({result['samples']} / {result['cycles']})"]
+        for q in result["queues"][:6]:
+            lines.append(
+                f"{q['name']:<16} {q['count']:>5}x  p50 {self.format_duration(q['median_wait']):>6}  "
+                f"μ {self.format_duration(q['mean_wait']):>6}  %{q['played_rate'] * 100:.0f}"
+            )
+        lines.append(f"{result['elapsed_ms']:.1f} ms")
+        self.analytics_label.configure(text="\n".join(lines))
+    
+    @staticmethod
+    def format_duration(seconds):
+        """Saniyeyi M:SS biçiminde göster"""
+        seconds = int(round(seconds))
+        return f"{seconds // 60}:{seconds % 60:02d}"
+    
     def change_language(self, language):
         """Dil değiştir"""
         new_lang = "en" if language == "English" else "tr"
@@ -1145,15 +5694,18 @@ class BeRightBackGUI:
         # Console toggle
         console_text = self.get_text("hide_console") if self.console_visible else self.get_text("show_console")
         self.console_toggle_btn.configure(text=f"📊 {console_text}")
+        self.analytics_btn.configure(text=f"📈 {self.get_text('analytics')}")
+        self.export_btn.configure(text=f"💾 {self.get_text('export')}")
         
         # Auto Accept Panel
         self.auto_accept_title.configure(text=f"🎯 {self.get_text('auto_accept')}")
         self.auto_accept_desc.configure(text=self.get_text("auto_accept_desc"))
         
-        if self.auto_accept_running:
+        if self.engine.auto_accept_running:
             self.auto_accept_btn.configure(text=f"⏹️ {self.get_text('stop')}")
         else:
             self.auto_accept_btn.configure(text=f"▶️ {self.get_text('start')}")
+        self.champ_select_switch.configure(text=f"🧩 {self.get_text('champ_select')}")
         
         # Auto Queue Panel
         self.auto_queue_title.configure(text=f"⏰ {self.get_text('auto_queue')}")
@@ -1162,6 +5714,9 @@ class BeRightBackGUI:
         self.sec_label.configure(text=self.get_text("seconds"))
         self.start_timer_btn.configure(text=f"▶️ {self.get_text('start')}")
         self.stop_timer_btn.configure(text=f"⏹️ {self.get_text('stop')}")
+        self.auto_queue_switch.configure(text=f"⚡ {self.get_text('auto_queue_mode')}")
+        self.end_of_game_switch.configure(text=f"🏁 {self.get_text('skip_end_of_game')}")
+        self.update_time_saved()
         
         # Console
         if hasattr(self, 'console_title'):
@@ -1177,7 +5732,7 @@ class BeRightBackGUI:
         # Update button states
         self.update_button_states()
     
-    def show_status(self, message, msg_type="info"):
+    def show_status(self, message, msg_type="info", log=True):
         """Durum mesajı göster"""
         colors = {
             "info": self.colors["text"],
@@ -1186,37 +5741,149 @@ class BeRightBackGUI:
             "error": self.colors["error"]
         }
         
-        self.status_label.configure(
+        self._last_status = (message, msg_type)
+        label = self.mini_status_label if self.minimal else self.status_label
+        label.configure(
             text=message,
             text_color=colors.get(msg_type, self.colors["text"])
         )
         
         # Also log to console
-        self.logger.info(message)
+        if log:
+            self.logger.info(message)
     
     def on_closing(self):
         """Pencere kapatılırken"""
-        # Save window size
-        geometry = self.root.geometry()
+        # Save window size - mini moddaysa tam arayüzün boyutu (diske kapanışta bir kez yazılır)
+        geometry = self._full_geometry if self.minimal else self.root.geometry()
         width, height = geometry.split('+')[0].split('x')
-        self.config.set('window.width', int(width))
-        self.config.set('window.height', int(height))
+        self.config.set('window.width', int(width), save=False)
+        self.config.set('window.height', int(height), save=False)
         
-        # Stop components
-        if hasattr(self, 'timer'):
-            self.timer.stop_timer()
+        # Idle / aktif karşılaştırması
+        for mode, values in self.meter.report().items():
+            self.logger.info(
+                f"📏 {mode}: {values['wakeups_per_minute']} uyanma/dk, "
+                f"{values['cpu_ms_per_minute']} ms CPU/dk ({values['seconds']}s)"
+            )
         
+        cache = self.client.cache.stats()
+        self.logger.info(
+            f"🗄️ LCU önbellek: {cache['hits']} isabet, {cache['coalesced']} birleştirilen, "
+            f"{cache['misses']} istek"
+        )
+        auto_queue = self.engine.auto_queue.report()
+        if auto_queue["searches"]:
+            self.logger.info(
+                f"⚡ Otomatik arama: {auto_queue['searches']} arama, "
+                f"ortalama {auto_queue['mean_dead_time']} sn bekleme, {auto_queue['saved_seconds']} sn kazanıldı"
+            )
+        champ_select = self.engine.champ_select.report()
+        if champ_select["post_ms"]:
+            self.logger.info(
+                f"🧩 Şampiyon seçimi: {champ_select['actions']['ban']} ban, {champ_select['actions']['pick']} kilit, "
+                f"karar -> istek ortalama {champ_select['post_ms']['mean']} ms"
+            )
+        end_of_game = self.engine.end_of_game.report()
+        if end_of_game["mean_seconds_to_lobby"] is not None:
+            self.logger.info(
+                f"🏁 Oyun sonu: {end_of_game['games']} oyun, "
+                f"ortalama {end_of_game['mean_seconds_to_lobby']} sn'de lobby'ye dönüldü"
+            )
+        throttled = sum(values["throttled"] for values in self.client.limiter.stats().values())
+        if throttled:
+            self.logger.info(f"🚦 LCU hız sınırı: {throttled} istek bekletildi")
+        for mode, snapshot in self.mode_snapshots.items():
+            self.logger.info(f"🪶 {mode}: RSS {snapshot['rss_mb']} MB, {snapshot['threads']} thread, "
+                             f"{snapshot['widgets']} widget")
+        hooks = self.engine.hooks.report()
+        if hooks["hooks"]:
+            runs = sum(values["runs"] for values in hooks["hooks"].values())
+            timeouts = sum(values["timeouts"] for values in hooks["hooks"].values())
+            self.logger.info(f"🪝 Hook'lar: {runs} çalışma, {timeouts} zaman aşımı, {hooks['dropped']} atılan")
+        if self.engine.pusher.enabled():
+            pushed = self.engine.pusher.report()
+            self.logger.info(
+                f"📡 Metrikler: {pushed['sent']} parti gönderildi ({pushed['bytes']} bayt gzip), "
+                f"{pushed['pending']} bekleyen, {pushed['dropped']} atılan"
+            )
+        for name, values in self.bus.stats().items():
+            if values["dropped"] or values["coalesced"]:
+                self.logger.info(
+                    f"📨 Olay kuyruğu {name}: {values['delivered']} teslim, {values['coalesced']} birleştirilen, "
+                    f"{values['dropped']} atılan, en fazla {values['high_watermark']} bekleyen"
+                )
+        if self.tracer:
+            # Konsol handler'ı aşağıda kaldırılıyor - yol şimdi loglanır, dosya kapanışta yazılır
+            self.trace_path = (self.config.config_dir / "traces"
+                               / f"trace-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+            self.logger.info(f"🧵 Trace kaydediliyor: {self.trace_path}")
         self.logger.info("👋 BeRightBack kapatılıyor...")
+        
+        # Konsol widget'ı yok edildikten sonra log yazılmasın, teslimat planlanmasın
+        for name in ('Timer', 'LoLClient', 'BeRightBack', 'Resources'):
+            logging.getLogger(name).removeHandler(self.console_handler)
+        self.bus.unsubscribe(self.gui_events)
+        self.bus.unsubscribe(self.log_events)
+        self.config.unwatch(self._on_settings_changed)
+        
+        report = self.lifecycle.shutdown()
+        if report["stragglers"] or report["errors"] or report["total_ms"] > Lifecycle.BUDGET * 1000:
+            self.logger.warning(
+                f"⚠️ Kapanış {report['total_ms']} ms sürdü; beklenmeyen: {', '.join(report['stragglers']) or '-'}, "
+                f"hatalar: {report['errors'] or '-'}"
+            )
+        self._cancel_tk_jobs()
         self.root.destroy()
     
     def run(self):
         """GUI çalıştır"""
-        self.root.mainloop()
+        if self.profiler:
+            self.root.mainloop()
+            self.profiler.write_report()
+            print(f"Profil raporu: {self.profiler.output_dir}")
+        else:
+            self.root.mainloop()
+
+def parse_args(argv=None):
+    """Komut satırı argümanları"""
+    parser = argparse.ArgumentParser(description="BeRightBack - LoL Auto Accept & Queue")
+    parser.add_argument("--profile", action="store_true",
+                        help="Monitor ve Tk thread'lerini profille, raporu Documents/BeRightBack altına yaz")
+    parser.add_argument("--record", metavar="PATH",
+                        help="Tüm LCU istek / yanıtlarını replay için PATH dosyasına kaydet (.jsonl.gz)")
+    parser.add_argument("--trace", action="store_true",
+                        help="Maç döngülerini Chrome trace formatında Documents/BeRightBack/traces altına yaz")
+    parser.add_argument("--minimal", action="store_true",
+                        help="Mini modda başla - yalnızca küçük durum göstergesi (bütün gün açık kalacaksa)")
+    parser.add_argument("--export", nargs="?", const="", metavar="DIR",
+                        help="GUI açmadan geçmiş ve metrikleri dışa aktar (varsayılan: Documents/BeRightBack/exports)")
+    parser.add_argument("--export-format", choices=StatsExporter.FORMATS,
+                        help="Dışa aktarma formatı (varsayılan: config export.format)")
+    parser.add_argument("--export-full", action="store_true",
+                        help="İmleci yok say, tüm geçmişi yeni bir dosyaya yaz")
+    return parser.parse_args(argv)
+
+def run_export(args):
+    """Headless dışa aktarma - cron / Görev Zamanlayıcı için"""
+    config = ConfigManager()
+    exporter = StatsExporter(config, MatchHistory(config.config_dir / "history.jsonl"))
+    result = exporter.export(args.export_format, full=args.export_full, directory=args.export or None)
+    print(f"{result['history_rows']} satır -> {result['history_file']} ({result['seconds']}s)")
+    print(f"Metrikler -> {result['metrics_file']}")
 
 def main():
     """Ana fonksiyon"""
+    args = parse_args()
+    if args.export is not None:
+        try:
+            run_export(args)
+        except Exception as e:
+            print(f"Dışa aktarma hatası: {e}")
+            sys.exit(1)
+        return
     try:
-        app = BeRightBackGUI()
+        app = BeRightBackGUI(profile=args.profile, record=args.record, trace=args.trace, minimal=args.minimal)
         app.run()
     except Exception as e:
         print(f"Program başlatılırken hata: {e}")